@@ -4,11 +4,18 @@ FastAPI Server for BL1NK MCP Tools
 Exposes MCP server tools as HTTP endpoints
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from typing import Optional, Dict, Any
 import json
 from src.server import get_server
+from src.catalog import get_skill_catalog
+from src.store import get_artifact_store
+from src.export import EXPORT_FORMATS
+from src.templates import slugify
+from src.executor import ExecutorSaturated, batch_concurrency, get_tool_executor, run_batch
+from src.transport import HTTPSessionManager, PARSE_ERROR, SessionLimitReached, encode, error_response
 
 # Create FastAPI app
 app = FastAPI(
@@ -26,8 +33,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Get server instance
+# Get server instance and the bounded tool executor
 server = get_server()
+executor = get_tool_executor()
+
+def check_tool_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn tool input validation errors into a 422 response"""
+    if "validation_errors" in result:
+        raise HTTPException(status_code=422, detail=result)
+    return result
+
+def too_busy(error: ExecutorSaturated) -> HTTPException:
+    """429 with Retry-After when the tool executor is saturated"""
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)}
+    )
 
 # Root endpoint
 @app.get("/")
@@ -43,7 +65,10 @@ def root():
             "/health",
             "/skills",
             "/run-skill",
-            "/skill-info/{skill_name}"
+            "/run-skill/{skill_name}/batch",
+            "/skill-info/{skill_name}",
+            "/bots/{bot_id}/export",
+            "/mcp"
         ]
     }
 
@@ -59,25 +84,28 @@ def health():
 
 # List skills
 @app.get("/skills")
-def list_skills(phase: Optional[str] = None):
+async def list_skills(phase: Optional[str] = None):
     """
     List all available skills
     
     Parameters:
-    - phase: Optional filter by phase (critical, integration, platform, advanced)
+    - phase: Optional filter by phase (one of the catalog's phase directories)
     """
     try:
         if phase:
-            result = server.call_tool("list_skills", phase=phase)
-        else:
-            result = server.call_tool("list_skills")
-        return result
+            # Same compiled schema (and error shape) as the list_skills tool
+            check_tool_result(server.get_tool("list_skills").check({"phase": phase}) or {})
+        # O(1) lookup of the pre-serialized catalog response
+        payload = get_skill_catalog().list_skills_payload(phase)
+        return Response(content=payload, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Run skill
 @app.post("/run-skill/{skill_name}")
-def run_skill(skill_name: str, params: Optional[Dict[str, Any]] = None):
+async def run_skill(skill_name: str, params: Optional[Dict[str, Any]] = None):
     """
     Execute a specific skill
     
@@ -86,14 +114,51 @@ def run_skill(skill_name: str, params: Optional[Dict[str, Any]] = None):
     - params: Optional parameters to pass to the skill
     """
     try:
-        result = server.call_tool("run_skill", skill_name=skill_name, params=params or {})
-        return result
+        result = await executor.call(server, "run_skill", skill_name=skill_name, params=params or {})
+        return check_tool_result(result)
+    except ExecutorSaturated as e:
+        raise too_busy(e)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Run skill batch
+@app.post("/run-skill/{skill_name}/batch")
+async def run_skill_batch_endpoint(skill_name: str, payload: Dict[str, Any]):
+    """
+    Execute a skill for many inputs in one request
+    
+    Parameters:
+    - skill_name: Name of the skill to run (required)
+    - payload: {"inputs": [params, ...], "concurrency": 8}
+    
+    Results are streamed back as NDJSON, one line per input as it completes.
+    """
+    inputs = payload.get("inputs")
+    if not isinstance(inputs, list) or not inputs:
+        raise HTTPException(status_code=400, detail="'inputs' must be a non-empty list")
+
+    try:
+        concurrency = batch_concurrency(payload.get("concurrency"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def run_one(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # Concurrency is already bounded by the batch, so wait for a slot
+        return await executor.call(
+            server, "run_skill", wait=True, skill_name=skill_name, params=params or {}
+        )
+
+    async def ndjson():
+        async for item in run_batch(run_one, inputs, concurrency):
+            yield json.dumps(item, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 # Get skill info
 @app.get("/skill-info/{skill_name}")
-def get_skill_info(skill_name: str):
+async def get_skill_info(skill_name: str):
     """
     Get information about a specific skill
     
@@ -101,12 +166,16 @@ def get_skill_info(skill_name: str):
     - skill_name: Name of the skill
     """
     try:
-        result = server.call_tool("get_skill_info", skill_name=skill_name)
+        result = check_tool_result(
+            await executor.call(server, "get_skill_info", skill_name=skill_name)
+        )
         
         if not result.get("found"):
             raise HTTPException(status_code=404, detail=f"Skill '{skill_name}' not found")
         
         return result
+    except ExecutorSaturated as e:
+        raise too_busy(e)
     except HTTPException:
         raise
     except Exception as e:
@@ -115,13 +184,9 @@ def get_skill_info(skill_name: str):
 # List tools
 @app.get("/tools")
 def list_tools():
-    """Get all available tools"""
+    """Get all available tools (serialized once, served as cached bytes)"""
     try:
-        tools = server.get_tools()
-        return {
-            "total": len(tools),
-            "tools": tools
-        }
+        return Response(content=server.get_tools_payload(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -131,10 +196,101 @@ def get_server_info():
     """Get server information"""
     try:
         info = server.get_server_info()
+        info["executor"] = executor.get_stats()
         return info
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Export a generated bot project
+@app.get("/bots/{bot_id}/export")
+def export_bot(bot_id: str, format: str = "zip"):
+    """
+    Stream a generated bot project as an archive
+    
+    Parameters:
+    - bot_id: ID returned when the bot was created
+    - format: zip (default) or tar (tar.gz)
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{format}'")
+    
+    store = get_artifact_store()
+    if not store.exists(bot_id):
+        raise HTTPException(status_code=404, detail=f"Bot '{bot_id}' not found")
+    
+    stream, media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream(store, bot_id),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{slugify(bot_id)}.{extension}"'}
+    )
+
+# MCP streamable HTTP transport
+mcp_sessions = HTTPSessionManager(server)
+
+def is_request(message: Any) -> bool:
+    return isinstance(message, dict) and "method" in message and "id" in message
+
+@app.post("/mcp")
+async def mcp_post(request: Request):
+    """
+    MCP JSON-RPC endpoint (streamable HTTP)
+    
+    Accepts a single message or a batch. Responses stream back as SSE
+    events as each call finishes when the client accepts text/event-stream,
+    otherwise they are returned together as JSON.
+    """
+    try:
+        body = json.loads(await request.body())
+    except json.JSONDecodeError as e:
+        return Response(
+            content=encode(error_response(None, PARSE_ERROR, f"Parse error: {e}")),
+            status_code=400,
+            media_type="application/json"
+        )
+    
+    messages = body if isinstance(body, list) else [body]
+    session_id = request.headers.get("mcp-session-id")
+    headers = {}
+    
+    if any(isinstance(m, dict) and m.get("method") == "initialize" for m in messages):
+        try:
+            session_id = mcp_sessions.create()
+        except SessionLimitReached as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        headers["Mcp-Session-Id"] = session_id
+    
+    session = mcp_sessions.get(session_id)
+    if session is None:
+        if session_id:
+            raise HTTPException(status_code=404, detail="Unknown MCP session")
+        raise HTTPException(status_code=400, detail="Missing Mcp-Session-Id header")
+    
+    if not any(is_request(m) for m in messages):
+        await session.handle(body)
+        return Response(status_code=202, headers=headers)
+    
+    if "text/event-stream" in request.headers.get("accept", ""):
+        async def events():
+            async for message in session.exchange(messages):
+                yield b"event: message\ndata: " + encode(message) + b"\n\n"
+        
+        return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+    
+    responses = [message async for message in session.exchange(messages)]
+    if not responses:
+        # Every request was cancelled
+        return Response(status_code=202, headers=headers)
+    payload = responses if isinstance(body, list) else responses[0]
+    return Response(content=encode(payload), media_type="application/json", headers=headers)
+
+@app.delete("/mcp")
+async def mcp_delete(request: Request):
+    """End an MCP session and cancel its in-flight calls"""
+    if not await mcp_sessions.close(request.headers.get("mcp-session-id", "")):
+        raise HTTPException(status_code=404, detail="Unknown MCP session")
+    return Response(status_code=204)
+
 if __name__ == "__main__":
     import uvicorn
     print("🚀 Starting BL1NK Skill MCP API Server...")
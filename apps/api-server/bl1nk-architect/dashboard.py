@@ -3,18 +3,31 @@
 Bl1nk Architect Monitoring Dashboard
 
 Real-time health monitoring using Streamlit
+
+With HEALTH_EVENTS_URL set (e.g. http://localhost:8000/health/events), the
+dashboard follows the server's health event stream: one subscription per
+dashboard process feeds every viewer, and no checks run here. Without it,
+one local checker per dashboard process refreshes stale checks in the
+background and feeds every viewer the same way.
 """
 
 import streamlit as st
 import asyncio
 import json
+import os
+import time
+import threading
 from datetime import datetime
 import sys
+from typing import Any, Dict, Optional
 
 # Add src to path
 sys.path.insert(0, '/home/user/projects/bl1nk-architect')
 
-from src.health_check import run_health_check
+from src.health_check import get_health_checker, HEALTH_HISTORY_DB, HEALTH_HISTORY_SIZE
+from src.health_history import HealthHistory
+
+HEALTH_EVENTS_URL = os.getenv("HEALTH_EVENTS_URL")
 
 # Page config
 st.set_page_config(
@@ -66,10 +79,88 @@ def get_status_emoji(status: str):
     else:
         return "❌"
 
-async def fetch_health_data():
-    """Fetch health check data"""
-    result = await run_health_check()
-    return result
+def load_history():
+    """Health history persisted by the server (None when not configured)"""
+    if not HEALTH_HISTORY_DB:
+        return None
+    return HealthHistory(HEALTH_HISTORY_SIZE, HEALTH_HISTORY_DB)
+
+class HealthFeed:
+    """Latest health summary and check latencies, shared by all viewers"""
+    
+    def __init__(self):
+        self.summary: Optional[Dict[str, Any]] = None
+        self.latencies: Dict[str, float] = {}
+        self.error: Optional[str] = None
+        self.connected = False
+    
+    def _apply(self, event: Dict[str, Any]):
+        if event.get("type") == "summary":
+            self.summary = {key: value for key, value in event.items() if key != "type"}
+        elif event.get("type") == "check":
+            self.latencies[event["check"]] = event.get("latency_ms")
+
+
+class HealthEventFeed(HealthFeed):
+    """Health events from the server's SSE stream"""
+    
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        threading.Thread(target=self._run, name="health-events", daemon=True).start()
+    
+    def _run(self):
+        import httpx
+        
+        backoff = 1.0
+        # One client for the life of the feed, so reconnects reuse its pool
+        with httpx.Client(timeout=httpx.Timeout(10.0, read=60.0)) as client:
+            while True:
+                try:
+                    with client.stream("GET", self.url, headers={"Accept": "text/event-stream"}) as response:
+                        response.raise_for_status()
+                        self.connected, self.error, backoff = True, None, 1.0
+                        for line in response.iter_lines():
+                            if line.startswith("data:"):
+                                self._apply(json.loads(line[5:]))
+                except Exception as e:
+                    self.error = str(e)
+                self.connected = False
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+
+class LocalHealthFeed(HealthFeed):
+    """Health events from an in-process checker on its own long-lived loop"""
+    
+    def __init__(self):
+        super().__init__()
+        threading.Thread(target=lambda: asyncio.run(self._run()), name="health-checks", daemon=True).start()
+    
+    async def _run(self):
+        checker = get_health_checker()
+        # Subscribing starts the checker's background refresh of stale checks
+        queue = checker.subscribe()
+        try:
+            await checker.get_results()
+            self.summary, self.connected = checker.get_summary(), True
+            while True:
+                self._apply(await queue.get())
+        except Exception as e:
+            self.error, self.connected = str(e), False
+        finally:
+            checker.unsubscribe(queue)
+
+
+@st.cache_resource
+def get_event_feed(url: str) -> HealthEventFeed:
+    """One feed per dashboard process, whatever the number of viewers"""
+    return HealthEventFeed(url)
+
+@st.cache_resource
+def get_local_feed() -> LocalHealthFeed:
+    """One local checker per dashboard process, whatever the number of viewers"""
+    return LocalHealthFeed()
 
 def main():
     """Main dashboard"""
@@ -80,13 +171,18 @@ def main():
     st.sidebar.header("⚙️ Settings")
     auto_refresh = st.sidebar.checkbox("Auto refresh", value=True)
     refresh_interval = st.sidebar.slider("Refresh interval (seconds)", 5, 60, 10)
+    history_minutes = st.sidebar.slider("History window (minutes)", 5, 1440, 60)
     
     # Fetch health data
-    try:
-        health_data = asyncio.run(fetch_health_data())
-    except Exception as e:
-        st.error(f"Error fetching health data: {str(e)}")
-        return
+    feed = get_event_feed(HEALTH_EVENTS_URL) if HEALTH_EVENTS_URL else get_local_feed()
+    if feed.error:
+        st.warning(f"Health checks unavailable: {feed.error}")
+    health_data = feed.summary
+    latencies = feed.latencies
+    if health_data is None:
+        st.info(f"Waiting for health checks from {HEALTH_EVENTS_URL or 'the local checker'}...")
+        time.sleep(1)
+        st.rerun()
     
     # Overall status
     col1, col2, col3, col4 = st.columns(4)
@@ -121,6 +217,7 @@ def main():
     st.header("📋 Detailed Status")
     
     checks = health_data["checks"]
+    history = load_history()
     
     # Create tabs for each check
     tabs = st.tabs(list(checks.keys()))
@@ -136,6 +233,8 @@ def main():
             st.markdown(f"**Status**: <span style='color: {color};'>{status.upper()}</span>", 
                        unsafe_allow_html=True)
             st.markdown(f"**Message**: {check_data['message']}")
+            if latencies.get(check_name) is not None:
+                st.markdown(f"**Last run**: {latencies[check_name]:.0f} ms")
             
             # Details
             if check_data.get("details"):
@@ -157,6 +256,23 @@ def main():
                                 st.write(f"  • {k}: {v}")
                         else:
                             st.write(f"**{key}**: {value}")
+            
+            # Trends from stored samples (no checks are re-run for these)
+            if history is not None:
+                window = history_minutes * 60
+                stats = history.stats(check_name, window)
+                if stats["samples"]:
+                    st.markdown(f"**Trend** (last {history_minutes} min, {stats['samples']} samples):")
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("p50", f"{stats['latency_ms']['p50']:.0f} ms")
+                    c2.metric("p95", f"{stats['latency_ms']['p95']:.0f} ms")
+                    c3.metric("p99", f"{stats['latency_ms']['p99']:.0f} ms")
+                    c4.metric("Availability", f"{stats['availability']:.1%}")
+                    samples = history.samples(check_name, window)
+                    st.line_chart({"latency_ms": [sample["latency_ms"] for sample in samples]})
+    
+    if history is not None:
+        history.close()
     
     # JSON view
     st.header("🔍 Raw Data")
@@ -167,7 +283,6 @@ def main():
     # Auto refresh
     if auto_refresh:
         st.info(f"Auto-refreshing every {refresh_interval} seconds...")
-        import time
         time.sleep(refresh_interval)
         st.rerun()
 
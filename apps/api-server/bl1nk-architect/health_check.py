@@ -7,11 +7,14 @@ Usage:
     python health_check.py --quick      # Quick checks only
     python health_check.py --json       # JSON output
     python health_check.py [check_name] # Specific check
+    python health_check.py --ndjson     # One JSON line per check as it finishes
+    python health_check.py --watch      # Re-run every --interval seconds
 """
 
 import asyncio
 import json
 import sys
+import time
 from typing import Optional
 import argparse
 from datetime import datetime
@@ -47,13 +50,63 @@ def print_status(status: str) -> str:
     return f"{symbol}"
 
 
-async def run_all_checks(json_output: bool = False):
+def emit(record: dict):
+    """Write one NDJSON line and flush it immediately"""
+    sys.stdout.write(json.dumps(record, default=str) + "\n")
+    sys.stdout.flush()
+
+
+async def stream_checks(iteration: int = 1) -> str:
+    """Emit each check as NDJSON when it finishes, then a summary line"""
+    checker = get_health_checker()
+    started = time.monotonic()
+    async for result, elapsed_ms in checker.iter_checks():
+        emit({"type": "check", "iteration": iteration, "elapsed_ms": round(elapsed_ms, 3),
+              **result.to_dict()})
+    
+    summary = checker.get_summary()
+    emit({
+        "type": "summary",
+        "iteration": iteration,
+        "duration_ms": round((time.monotonic() - started) * 1000, 3),
+        "overall_status": summary["overall_status"],
+        "summary": summary["summary"],
+        "timestamp": summary["timestamp"],
+    })
+    return summary["overall_status"]
+
+
+async def watch(interval: float, ndjson: bool, iterations: Optional[int] = None):
+    """
+    Re-run all checks every ``interval`` seconds
+    
+    The checker (and its HTTP connection pool) lives across iterations.
+    """
+    checker = get_health_checker()
+    iteration = 0
+    try:
+        while iterations is None or iteration < iterations:
+            iteration += 1
+            started = time.monotonic()
+            if ndjson:
+                await stream_checks(iteration)
+            else:
+                await run_all_checks(fresh=True)
+            if iterations is None or iteration < iterations:
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+    finally:
+        await checker.aclose()
+
+
+async def run_all_checks(json_output: bool = False, fresh: bool = True):
     """Run all health checks"""
     print_colored("\n🏥 BL1NK ARCHITECT HEALTH CHECK", "blue")
     print_colored("=" * 50, "blue")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    result = await run_health_check()
+    # Fresh by default: the loop ends with the CLI, so stale results
+    # could never be refreshed in the background
+    result = await run_health_check(fresh=fresh)
     
     if json_output:
         print(json.dumps(result, indent=2, default=str))
@@ -121,9 +174,7 @@ async def run_quick_checks():
     print_colored("=" * 50, "blue")
     
     checker = get_health_checker()
-    await checker.check_basic_health()
-    
-    result = checker.results["Health Check"]
+    result = await checker.run_check("Health Check")
     
     color = "green" if result.status == "ok" else "yellow" if result.status == "warning" else "red"
     print_colored(f"Status: {print_status(result.status)}", color)
@@ -154,19 +205,8 @@ async def run_specific_check(check_name: str, json_output: bool = False):
     
     checker = get_health_checker()
     
-    # Run specific check
-    if actual_check == "Health Check":
-        await checker.check_basic_health()
-    elif actual_check == "Lint Check":
-        await checker.check_lint()
-    elif actual_check == "Skill Check":
-        await checker.check_skills()
-    elif actual_check == "Webhook Check":
-        await checker.check_webhooks()
-    elif actual_check == "GitHub Check":
-        await checker.check_github()
-    elif actual_check == "Deep Research Check":
-        await checker.check_deep_research()
+    # Run specific check (within its deadline)
+    await checker.run_check(actual_check)
     
     result = checker.results.get(actual_check)
     
@@ -224,6 +264,8 @@ Examples:
   python health_check.py --json         # JSON output
   python health_check.py lint           # Specific check
   python health_check.py skills --json  # JSON output for specific check
+  python health_check.py --ndjson       # Stream results; exit 1 on error
+  python health_check.py --watch --ndjson --interval 60
         """
     )
     
@@ -242,11 +284,40 @@ Examples:
         action="store_true",
         help="Output as JSON"
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream one JSON line per check as it completes, then a summary line"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Run all checks repeatedly"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=30.0,
+        help="Seconds between --watch runs (default: 30)"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        help="Stop --watch after this many runs"
+    )
     
     args = parser.parse_args()
     
     try:
-        if args.quick:
+        if args.watch:
+            await watch(args.interval, args.ndjson, args.iterations)
+        elif args.ndjson:
+            overall = await stream_checks()
+            await get_health_checker().aclose()
+            # Usable as a synthetic probe: non-zero exit when anything errors
+            if overall == "error":
+                sys.exit(1)
+        elif args.quick:
             await run_quick_checks()
         elif args.check:
             await run_specific_check(args.check, args.json)
@@ -259,4 +330,7 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
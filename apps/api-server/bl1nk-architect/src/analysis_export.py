@@ -0,0 +1,324 @@
+"""
+Analysis Export - Columnar dataset of architecture analysis results
+
+Each workflow run's structured results are appended to a local dataset
+that can be queried in bulk across repositories:
+1. The run is split into flat tables: runs, files, deps and duplicates
+2. Every table is written as one file per run, Parquet or Arrow IPC when
+   ``pyarrow`` is installed and CSV otherwise
+3. Files are laid out in Hive-style partitions,
+   ``<table>/repository=<name>/date=<YYYY-MM-DD>/<run_id>.<ext>``, so
+   appending never rewrites earlier files
+4. Each file is written under a hidden temporary name and renamed into
+   place, and the ``runs`` row is written last, so a run listed in
+   ``runs`` has all of its other tables in place
+"""
+
+import os
+import csv
+import glob
+import uuid
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - CSV is used without pyarrow
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_EXPORT_DIR = os.getenv("ANALYSIS_EXPORT_DIR")
+ANALYSIS_EXPORT_FORMAT = os.getenv("ANALYSIS_EXPORT_FORMAT")
+
+# Format name -> file suffix
+EXPORT_FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "csv": ".csv",
+}
+
+PARTITION_KEYS = ("repository", "date")
+
+# Table name -> (column, type) pairs; types name pyarrow factories
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "runs": (
+        ("run_id", "string"),
+        ("created_at", "timestamp"),
+        ("task_id", "string"),
+        ("files_count", "int64"),
+        ("python_deps_count", "int64"),
+        ("typescript_deps_count", "int64"),
+        ("duplicates_count", "int64"),
+    ),
+    "files": (
+        ("run_id", "string"),
+        ("path", "string"),
+        ("directory", "string"),
+        ("extension", "string"),
+        ("depth", "int32"),
+    ),
+    "deps": (
+        ("run_id", "string"),
+        ("ecosystem", "string"),
+        ("name", "string"),
+    ),
+    "duplicates": (
+        ("run_id", "string"),
+        ("pattern", "string"),
+        ("count", "int64"),
+    ),
+}
+
+
+def _csv_value(kind: str, value: str) -> Any:
+    """A CSV cell as the value pyarrow returns for the column's type"""
+    if kind == "string":
+        return value
+    if value == "":
+        return None
+    return datetime.fromisoformat(value) if kind == "timestamp" else int(value)
+
+
+def available_formats() -> List[str]:
+    """Export formats usable in this environment, best first"""
+    return ["parquet", "arrow", "csv"] if pyarrow is not None else ["csv"]
+
+
+def _arrow_schema(table: str):
+    types = {
+        "string": pyarrow.string(),
+        "int32": pyarrow.int32(),
+        "int64": pyarrow.int64(),
+        "timestamp": pyarrow.timestamp("us", tz="UTC"),
+    }
+    return pyarrow.schema([(name, types[kind]) for name, kind in TABLES[table]])
+
+
+def build_tables(
+    analysis_data: Dict[str, Any],
+    run_id: str,
+    created_at: datetime,
+    task_id: Optional[str] = None,
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Split one run's ``analysis_data`` into column lists per table"""
+    files = [str(path) for path in analysis_data.get("files") or []]
+    python_deps = [str(dep) for dep in analysis_data.get("python_deps") or []]
+    typescript_deps = [str(dep) for dep in analysis_data.get("typescript_deps") or []]
+    duplicates = analysis_data.get("duplicates") or []
+
+    directories, extensions = [], []
+    for path in files:
+        directory, name = os.path.split(path)
+        directories.append(directory)
+        extensions.append(os.path.splitext(name)[1].lower())
+
+    deps = [("python", dep) for dep in python_deps] + [("typescript", dep) for dep in typescript_deps]
+
+    return {
+        "runs": {
+            "run_id": [run_id],
+            "created_at": [created_at],
+            "task_id": [task_id],
+            "files_count": [analysis_data.get("files_count", len(files))],
+            "python_deps_count": [len(python_deps)],
+            "typescript_deps_count": [len(typescript_deps)],
+            "duplicates_count": [len(duplicates)],
+        },
+        "files": {
+            "run_id": [run_id] * len(files),
+            "path": files,
+            "directory": directories,
+            "extension": extensions,
+            "depth": [path.count("/") for path in files],
+        },
+        "deps": {
+            "run_id": [run_id] * len(deps),
+            "ecosystem": [ecosystem for ecosystem, _ in deps],
+            "name": [name for _, name in deps],
+        },
+        "duplicates": {
+            "run_id": [run_id] * len(duplicates),
+            "pattern": [str(dup.get("pattern", "")) for dup in duplicates],
+            "count": [int(dup.get("count", 0)) for dup in duplicates],
+        },
+    }
+
+
+class AnalysisExporter:
+    """Appends analysis runs to a partitioned columnar dataset"""
+
+    def __init__(self, root: str, file_format: Optional[str] = None):
+        file_format = file_format or available_formats()[0]
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {file_format}")
+        if file_format != "csv" and pyarrow is None:
+            raise ValueError(f"{file_format} export needs the 'pyarrow' package")
+        self.root = root
+        self.format = file_format
+        self.suffix = EXPORT_FORMATS[file_format]
+
+    def _partition_dir(self, table: str, repository: str, date: str) -> str:
+        return os.path.join(
+            self.root,
+            table,
+            f"repository={quote(repository or 'unknown', safe='')}",
+            f"date={date}",
+        )
+
+    def export(
+        self,
+        analysis_data: Dict[str, Any],
+        run_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> Dict[str, str]:
+        """
+        Append one run to the dataset.
+
+        Tables without rows are skipped; the ``runs`` row is always written.
+
+        Returns:
+            Table name -> written file path
+        """
+        run_id = run_id or uuid.uuid4().hex
+        created_at = created_at or datetime.now(timezone.utc)
+        tables = build_tables(analysis_data, run_id, created_at, task_id)
+        repository = analysis_data.get("repository", "")
+        date = created_at.strftime("%Y-%m-%d")
+
+        written = {}
+        # runs goes last: a run is visible only once its other tables exist
+        for table in ("files", "deps", "duplicates", "runs"):
+            columns = tables[table]
+            if table != "runs" and not columns["run_id"]:
+                continue
+            directory = self._partition_dir(table, repository, date)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{run_id}{self.suffix}")
+            self._write(table, columns, path)
+            written[table] = path
+
+        logger.info(f"Exported analysis run {run_id} for {repository} as {self.format}")
+        return written
+
+    def _write(self, table: str, columns: Dict[str, List[Any]], path: str):
+        # Dot-prefixed files are ignored by dataset readers until renamed
+        temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        try:
+            if self.format == "csv":
+                with open(temp_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    writer.writerows(zip(*(
+                        [value.isoformat() if isinstance(value, datetime) else value for value in values]
+                        for values in columns.values()
+                    )))
+            else:
+                arrow_table = pyarrow.table(columns, schema=_arrow_schema(table))
+                if self.format == "parquet":
+                    pyarrow.parquet.write_table(arrow_table, temp_path, compression="zstd")
+                else:
+                    with pyarrow.ipc.new_file(temp_path, arrow_table.schema) as writer:
+                        writer.write_table(arrow_table)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _paths(self, table: str) -> List[str]:
+        pattern = os.path.join(self.root, table, "*", "*", f"*{self.suffix}")
+        return sorted(glob.glob(pattern))
+
+    def dataset(self, table: str):
+        """
+        ``pyarrow.dataset.Dataset`` over every file of a table.
+
+        ``repository`` and ``date`` come from the partition directories and
+        can be used in filters without opening non-matching files.
+        """
+        if pyarrow is None:
+            raise ValueError("Dataset queries need the 'pyarrow' package")
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        # Partition values are URI-decoded, matching quote() in _partition_dir
+        partitioning = pyarrow.dataset.HivePartitioning(
+            pyarrow.schema([(key, pyarrow.string()) for key in PARTITION_KEYS]),
+            segment_encoding="uri",
+        )
+        schema = _arrow_schema(table)
+        for key in PARTITION_KEYS:
+            schema = schema.append(pyarrow.field(key, pyarrow.string()))
+        return pyarrow.dataset.dataset(
+            self._paths(table),
+            schema=schema,
+            format="ipc" if self.format == "arrow" else self.format,
+            partitioning=partitioning,
+            partition_base_dir=os.path.join(self.root, table),
+        )
+
+    def read(
+        self,
+        table: str,
+        repository: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rows of a table as dicts, optionally for one repository
+        
+        Values have the column types in ``TABLES`` whatever the format,
+        except that CSV cannot tell a null string from an empty one:
+        both read back as ``""``.
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table}")
+
+        if pyarrow is not None:
+            expression = pyarrow.dataset.field("repository") == repository \
+                if repository is not None else None
+            return self.dataset(table).to_table(columns=columns, filter=expression).to_pylist()
+
+        kinds = dict(TABLES[table])
+        rows = []
+        for path in self._paths(table):
+            partitions = dict(
+                part.split("=", 1) for part in
+                os.path.relpath(os.path.dirname(path), os.path.join(self.root, table)).split(os.sep)
+            )
+            partitions["repository"] = unquote(partitions["repository"])
+            if repository is not None and partitions["repository"] != repository:
+                continue
+            with open(path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    row = {key: _csv_value(kinds[key], value) for key, value in row.items()}
+                    row.update(partitions)
+                    rows.append({key: row[key] for key in columns} if columns else row)
+        return rows
+
+
+_exporter: Optional[AnalysisExporter] = None
+_exporter_configured = False
+
+
+def get_analysis_exporter() -> Optional[AnalysisExporter]:
+    """
+    Exporter for ``ANALYSIS_EXPORT_DIR``, or None when export is disabled
+    
+    A misconfigured export (unknown format, or Parquet/Arrow without
+    ``pyarrow``) is logged once and disables export instead of failing runs.
+    """
+    global _exporter, _exporter_configured
+    if not _exporter_configured:
+        _exporter_configured = True
+        if ANALYSIS_EXPORT_DIR:
+            try:
+                _exporter = AnalysisExporter(ANALYSIS_EXPORT_DIR, ANALYSIS_EXPORT_FORMAT)
+            except ValueError as e:
+                logger.error(f"Analysis export disabled: {e}")
+    return _exporter
@@ -3,15 +3,275 @@ File Attachment Handler
 
 Handles file upload and download for bot responses.
 Supports sending files in bot responses.
+
+Large attachments are built with ``AttachmentBuilder``: content is encoded
+and written chunk by chunk into a spooled temporary file (in memory up to
+``SPOOL_SIZE``, on disk beyond), the size limit is enforced on every
+write, and the result is handed back as a file-like object. The async
+helpers run builds on a worker thread, since spooled writes can block.
+
+Attachments can be compressed with gzip or, when ``zstandard`` is
+installed, zstd. Content is compressed as it is written, so the size limit
+applies to the compressed bytes and the uncompressed content is never
+stored. Large gzip files are compressed in independent chunks on a thread
+pool (zlib releases the GIL) and written as a multi-member gzip stream,
+which any gzip reader decodes as one file; zstd uses its own worker
+threads.
 """
 
+import csv
+import gzip
+import json
 import logging
 import os
-from typing import Optional, Union, BinaryIO
+import asyncio
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Union, BinaryIO
 from io import BytesIO
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstd output is optional
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Attachments stay in memory up to this size, then spill to a temp file
+SPOOL_SIZE = 1024 * 1024
+# Characters encoded per write when streaming a large string
+TEXT_CHUNK_SIZE = 64 * 1024
+
+# Compression formats: file suffix and content encoding
+COMPRESSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+# Uncompressed bytes per independently compressed gzip member
+COMPRESS_CHUNK_SIZE = 1024 * 1024
+COMPRESS_WORKERS = min(4, os.cpu_count() or 1)
+# Compression for generated reports ("gzip" or "zstd"); unset sends them as-is
+ATTACHMENT_COMPRESSION = os.getenv("ATTACHMENT_COMPRESSION")
+
+
+class AttachmentTooLarge(Exception):
+    """Raised when an attachment grows past the handler's size limit"""
+
+
+def _check_compression(compression: str):
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the zstandard package")
+
+
+def default_compression() -> Optional[str]:
+    """``ATTACHMENT_COMPRESSION`` if set and usable, else None"""
+    if not ATTACHMENT_COMPRESSION:
+        return None
+    try:
+        _check_compression(ATTACHMENT_COMPRESSION)
+    except ValueError as e:
+        logger.warning(f"Attachment compression disabled: {e}")
+        return None
+    return ATTACHMENT_COMPRESSION
+
+
+def _gzip_chunk(data: bytes) -> bytes:
+    # mtime=0 keeps output reproducible for identical input
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class _GzipCompressor:
+    """Parallel chunked gzip; at most 2 x workers chunks are held at once"""
+    
+    def __init__(self, output: Callable[[bytes], None], workers: int):
+        self._output = output
+        self._workers = workers
+        self._buffer = bytearray()
+        self._pending: deque = deque()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._members = 0
+    
+    def write(self, data: bytes):
+        self._buffer += data
+        while len(self._buffer) >= COMPRESS_CHUNK_SIZE:
+            self._submit(bytes(self._buffer[:COMPRESS_CHUNK_SIZE]))
+            del self._buffer[:COMPRESS_CHUNK_SIZE]
+    
+    def _submit(self, chunk: bytes, last: bool = False):
+        self._members += 1
+        # A single-member file is not worth a thread pool
+        if self._workers < 2 or (last and self._pool is None):
+            self._output(_gzip_chunk(chunk))
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="gzip")
+        self._pending.append(self._pool.submit(_gzip_chunk, chunk))
+        if len(self._pending) >= self._workers * 2:
+            self._output(self._pending.popleft().result())
+    
+    def close(self):
+        """Compress what is buffered and write every remaining member"""
+        try:
+            # An empty input still needs one (empty) gzip member
+            if self._buffer or not self._members:
+                self._submit(bytes(self._buffer), last=True)
+                self._buffer.clear()
+            while self._pending:
+                self._output(self._pending.popleft().result())
+        finally:
+            self.abort()
+    
+    def abort(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+class _OutputStream:
+    """Write-only stream handing bytes to a callback"""
+    
+    def __init__(self, output: Callable[[bytes], None]):
+        self._output = output
+    
+    def write(self, data) -> int:
+        self._output(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+
+
+class _ZstdCompressor:
+    """zstd stream, using the library's own worker threads"""
+    
+    def __init__(self, output: Callable[[bytes], None], workers: int):
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=workers if workers > 1 else 0)
+        self._writer = compressor.stream_writer(_OutputStream(output), closefd=False)
+    
+    def write(self, data: bytes):
+        self._writer.write(data)
+    
+    def close(self):
+        self._writer.close()
+    
+    def abort(self):
+        pass
+
+
+class AttachmentBuilder:
+    """
+    Builds one attachment incrementally in a spooled temporary file
+    
+    With ``compression``, data is compressed as it is written: the size
+    limit applies to the compressed bytes, and ``filename`` gains the
+    compression's suffix.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        max_file_size: int,
+        spool_size: int = SPOOL_SIZE,
+        compression: Optional[str] = None,
+        workers: int = COMPRESS_WORKERS
+    ):
+        self._compressor = None
+        if compression:
+            _check_compression(compression)
+            filename += COMPRESSIONS[compression]
+            compressor = _ZstdCompressor if compression == "zstd" else _GzipCompressor
+            self._compressor = compressor(self._write_output, workers)
+        self.filename = filename
+        self.max_file_size = max_file_size
+        self.size = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_size, mode="w+b")
+    
+    def write(self, data: Union[str, bytes]) -> int:
+        """Append text (UTF-8 encoded) or bytes; raises AttachmentTooLarge"""
+        if isinstance(data, str):
+            # Encode long strings in slices so no full-size copy is made
+            if len(data) > TEXT_CHUNK_SIZE:
+                for start in range(0, len(data), TEXT_CHUNK_SIZE):
+                    self.write(data[start:start + TEXT_CHUNK_SIZE])
+                return len(data)
+            data = data.encode("utf-8")
+        
+        if self._compressor is not None:
+            self._compressor.write(data)
+        else:
+            self._write_output(data)
+        return len(data)
+    
+    def _write_output(self, data: bytes):
+        if self.size + len(data) > self.max_file_size:
+            raise AttachmentTooLarge(
+                f"{self.filename} exceeds the {self.max_file_size} byte limit"
+            )
+        self._file.write(data)
+        self.size += len(data)
+    
+    def write_all(self, chunks: Iterable[Union[str, bytes]]):
+        """Append many pieces, batching small text pieces into larger writes"""
+        pending: list[str] = []
+        pending_size = 0
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                if pending:
+                    self.write("".join(pending))
+                    pending, pending_size = [], 0
+                self.write(chunk)
+                continue
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= TEXT_CHUNK_SIZE:
+                self.write("".join(pending))
+                pending, pending_size = [], 0
+        if pending:
+            self.write("".join(pending))
+    
+    def finish(self) -> BinaryIO:
+        """The finished attachment, rewound and ready to read"""
+        if self._compressor is not None:
+            compressor, self._compressor = self._compressor, None
+            compressor.close()
+        self._file.flush()
+        self._file.seek(0)
+        return self._file
+    
+    def close(self):
+        if self._compressor is not None:
+            self._compressor.abort()
+            self._compressor = None
+        self._file.close()
+    
+    def __enter__(self) -> "AttachmentBuilder":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        # On success the caller owns the file returned by finish()
+        if exc_type is not None:
+            self.close()
+
+
+def available_compressions() -> list[str]:
+    """Compression formats usable in this environment, best first"""
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def _read_and_close(file_obj: Optional[BinaryIO]) -> Optional[bytes]:
+    """Contents of a built attachment as bytes (None stays None)"""
+    if file_obj is None:
+        return None
+    try:
+        return file_obj.read()
+    finally:
+        file_obj.close()
+
 
 class AttachmentHandler:
     """Handler for file attachments in Poe bot responses"""
@@ -25,6 +285,102 @@ class AttachmentHandler:
         """
         self.max_file_size = max_file_size
     
+    def open_builder(self, filename: str, compression: Optional[str] = None) -> AttachmentBuilder:
+        """Start an attachment that is written (and compressed) incrementally"""
+        return AttachmentBuilder(filename, self.max_file_size, compression=compression)
+    
+    async def stream_text_file(
+        self,
+        chunks: Iterable[Union[str, bytes]],
+        filename: str = "output.txt",
+        compression: Optional[str] = None
+    ) -> tuple[Optional[BinaryIO], Optional[str]]:
+        """
+        Build a file attachment from chunks of text or bytes.
+        
+        Args:
+            chunks: Content pieces, written as they are produced
+            filename: Output filename
+            compression: Optional "gzip" or "zstd" (adds .gz / .zst)
+            
+        Returns:
+            Tuple of (file object, filename), or (None, None) if too large
+        """
+        return await self._build(filename, lambda builder: builder.write_all(chunks), compression)
+    
+    async def _build(
+        self,
+        filename: str,
+        fill: Callable[[AttachmentBuilder], None],
+        compression: Optional[str] = None
+    ) -> tuple[Optional[BinaryIO], Optional[str]]:
+        """Fill a new builder on a worker thread; (None, None) if it grew too large"""
+        def run() -> tuple[BinaryIO, str]:
+            with self.open_builder(filename, compression) as builder:
+                fill(builder)
+                return builder.finish(), builder.filename
+        
+        try:
+            return await asyncio.to_thread(run)
+        except AttachmentTooLarge as e:
+            logger.warning(str(e))
+            return None, None
+    
+    async def stream_json_file(
+        self,
+        data: Any,
+        filename: str = "data.json",
+        compression: Optional[str] = None
+    ) -> tuple[Optional[BinaryIO], Optional[str]]:
+        """Build a JSON attachment without materializing the JSON string"""
+        return await self.stream_text_file(
+            json.JSONEncoder(indent=2).iterencode(data), filename, compression
+        )
+    
+    async def stream_csv_file(
+        self,
+        headers: list[str],
+        rows: Iterable[list],
+        filename: str = "data.csv",
+        compression: Optional[str] = None
+    ) -> tuple[Optional[BinaryIO], Optional[str]]:
+        """Build a CSV attachment row by row; ``rows`` may be a generator"""
+        def fill(builder: AttachmentBuilder):
+            writer = csv.writer(builder)
+            writer.writerow(headers)
+            writer.writerows(rows)
+        
+        return await self._build(filename, fill, compression)
+    
+    async def compress_file(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        compression: str = "gzip"
+    ) -> tuple[Optional[BinaryIO], Optional[str]]:
+        """
+        Compress an attachment, returning a new file and suffixed filename.
+        
+        Runs on a worker thread so the event loop is not blocked; the size
+        limit applies to the compressed output. ``file_obj`` is closed.
+        
+        Args:
+            file_obj: Uncompressed attachment (read from its current position)
+            filename: Uncompressed filename, e.g. "report.csv"
+            compression: "gzip" or "zstd" (zstd needs the zstandard package)
+            
+        Returns:
+            Tuple of (file object, filename), or (None, None) if too large
+        """
+        _check_compression(compression)
+        
+        def fill(builder: AttachmentBuilder):
+            with file_obj:
+                for chunk in iter(lambda: file_obj.read(COMPRESS_CHUNK_SIZE), b""):
+                    builder.write(chunk)
+        
+        return await self._build(filename, fill, compression)
+    
     async def prepare_text_file(
         self,
         content: str,
@@ -41,13 +397,15 @@ class AttachmentHandler:
             Tuple of (file_bytes, filename)
         """
         try:
-            file_bytes = content.encode('utf-8')
-            
-            if len(file_bytes) > self.max_file_size:
-                logger.warning(f"File size {len(file_bytes)} exceeds limit")
+            # UTF-8 needs at least one byte per character, so a string with
+            # more characters than the limit can be rejected before encoding
+            if len(content) > self.max_file_size:
+                logger.warning(f"File size {len(content)}+ exceeds limit")
                 return None, None
             
-            return file_bytes, filename
+            # The builder encodes in slices, so no second full-size copy is made
+            file_obj, filename = await self._build(filename, lambda builder: builder.write(content))
+            return _read_and_close(file_obj), filename
         
         except Exception as e:
             logger.exception(f"Error preparing text file: {e}")
@@ -86,9 +444,8 @@ class AttachmentHandler:
             Tuple of (file_bytes, filename)
         """
         try:
-            import json
-            json_str = json.dumps(data, indent=2)
-            return await self.prepare_text_file(json_str, filename)
+            file_obj, filename = await self.stream_json_file(data, filename)
+            return _read_and_close(file_obj), filename
         
         except Exception as e:
             logger.exception(f"Error preparing JSON file: {e}")
@@ -112,21 +469,8 @@ class AttachmentHandler:
             Tuple of (file_bytes, filename)
         """
         try:
-            import csv
-            from io import StringIO
-            
-            output = StringIO()
-            writer = csv.writer(output)
-            
-            # Write headers
-            writer.writerow(headers)
-            
-            # Write rows
-            for row in rows:
-                writer.writerow(row)
-            
-            csv_str = output.getvalue()
-            return await self.prepare_text_file(csv_str, filename)
+            file_obj, filename = await self.stream_csv_file(headers, rows, filename)
+            return _read_and_close(file_obj), filename
         
         except Exception as e:
             logger.exception(f"Error preparing CSV file: {e}")
@@ -137,8 +481,14 @@ class AttachmentHandler:
         return file_size <= self.max_file_size
     
     def get_content_type(self, filename: str) -> str:
-        """Get MIME content type based on filename"""
+        """
+        Get MIME content type based on filename.
+        
+        Compressed files (``.gz``, ``.zst``) are typed by their container.
+        """
         ext = os.path.splitext(filename)[1].lower()
+        if ext in ('.gz', '.zst'):
+            return 'application/gzip' if ext == '.gz' else 'application/zstd'
         
         content_types = {
             '.txt': 'text/plain',
@@ -154,3 +504,11 @@ class AttachmentHandler:
         }
         
         return content_types.get(ext, 'application/octet-stream')
+    
+    def get_content_encoding(self, filename: str) -> Optional[str]:
+        """"gzip" or "zstd" for compressed filenames, else None"""
+        ext = os.path.splitext(filename)[1].lower()
+        for compression, suffix in COMPRESSIONS.items():
+            if ext == suffix:
+                return compression
+        return None
@@ -7,10 +7,12 @@ Manages authentication flow and workflow orchestration.
 
 import os
 import logging
+from typing import Callable, Optional
 from fastapi import FastAPI
 import fastapi_poe as fp
 
 from src.auth import auth_router, is_user_authenticated, get_login_url
+from src.health_check_api import include_health_routes
 from src.orchestrator import run_architect_workflow
 
 logger = logging.getLogger(__name__)
@@ -122,12 +124,13 @@ _After authorizing, please reply with "Start" or "Analyze" again._
         logger.error(f"Error for message {error.message_id}: {error.error_message}")
 
 
-def create_app() -> FastAPI:
+def create_app(lifespan: Optional[Callable] = None, require_skills: bool = False) -> FastAPI:
     """Create and configure FastAPI application"""
     app = FastAPI(
         title="Bl1nk Architect",
         description="GitHub repository architecture analysis bot for Poe",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # Include auth routes (GitHub callback)
@@ -145,10 +148,8 @@ def create_app() -> FastAPI:
         allow_without_key=False,
     )
 
-    # Health check endpoint
-    @app.get("/health")
-    async def health():
-        return {"status": "healthy", "version": "0.1.0"}
+    # Probes (/livez, /readyz), /health and detailed /health/* reports and events
+    include_health_routes(app, require_skills=require_skills)
 
     logger.info("Bl1nk Architect bot initialized")
     return app
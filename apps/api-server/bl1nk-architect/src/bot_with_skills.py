@@ -9,16 +9,20 @@ Combines original orchestrator with skill/plugin system:
 """
 
 import os
+import json
 import logging
-from typing import Optional, AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Optional, AsyncGenerator, Dict, Any
 import fastapi_poe as fp
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 
 from src.bot import Bl1nkArchitectBot, create_app as create_base_app
 from src.poe_plugin_manager import (
     get_skill_router_bot,
     get_skill_bot_factory,
-    initialize_skill_bots,
+    initialize_skill_system,
+    shutdown_skill_system,
     PoeSkillBot,
 )
 
@@ -35,10 +39,10 @@ class Bl1nkArchitectWithSkillsBot(Bl1nkArchitectBot):
         self.skills_initialized = False
     
     async def initialize_skills(self):
-        """Lazy initialize skills"""
+        """Attach to the shared skill system (warmed up at app startup)"""
         if not self.skills_initialized:
             try:
-                await initialize_skill_bots()
+                await initialize_skill_system()
                 self.skill_router_bot = get_skill_router_bot()
                 self.skills_initialized = True
                 logger.info("Skills initialized successfully")
@@ -156,11 +160,26 @@ class Bl1nkArchitectWithSkillsBot(Bl1nkArchitectBot):
         )
 
 
+@asynccontextmanager
+async def skills_lifespan(app: FastAPI):
+    """Load and warm up skills once before serving traffic"""
+    try:
+        count = await initialize_skill_system()
+        logger.info(f"Warmed up {count} skills at startup")
+    except Exception as e:
+        # Bots retry lazily on first request; readiness stays false
+        logger.error(f"Error warming up skills: {e}")
+    
+    yield
+    
+    await shutdown_skill_system()
+
+
 def create_app_with_skills() -> FastAPI:
     """Create FastAPI app with skill support"""
     
     # Create base app
-    app = create_base_app()
+    app = create_base_app(lifespan=skills_lifespan, require_skills=True)
     
     # Remove original bot
     # Create enhanced bot with skills
@@ -206,19 +225,65 @@ def create_app_with_skills() -> FastAPI:
     @app.post("/skills/{skill_id}/execute")
     async def execute_skill(skill_id: str, query: str):
         """Execute a skill"""
-        factory = get_skill_bot_factory()
-        skill_bot = factory.get_bot(skill_id)
-        
-        if not skill_bot:
+        from src.skill_loader import execute_skill, get_skill_loader
+
+        # Same lookup as the batch route: the loader runs the skill
+        if not get_skill_loader().get_bot(skill_id):
             raise HTTPException(status_code=404, detail="Skill not found")
         
         try:
-            from src.skill_loader import execute_skill
             result = await execute_skill(skill_id, query)
             return {"result": result}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
-    
+
+    @app.post("/skills/{skill_id}/execute/batch")
+    async def execute_skill_batch(skill_id: str, payload: Dict[str, Any]):
+        """
+        Execute a skill for many queries, streaming NDJSON results.
+
+        A client disconnect cancels the queries still running; script skills
+        rely on SkillExecutor.run() retiring the worker of a cancelled call.
+        """
+        from src.skill_loader import batch_concurrency, execute_skill_batch as run_batch, get_skill_loader
+
+        if not get_skill_loader().get_bot(skill_id):
+            raise HTTPException(status_code=404, detail="Skill not found")
+
+        queries = payload.get("queries")
+        if not isinstance(queries, list) or not queries:
+            raise HTTPException(status_code=400, detail="'queries' must be a non-empty list")
+
+        try:
+            concurrency = batch_concurrency(payload.get("concurrency"))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        async def ndjson():
+            async for item in run_batch(skill_id, queries, concurrency):
+                yield json.dumps(item, default=str) + "\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    @app.post("/skills/chain")
+    async def execute_chain(payload: Dict[str, Any]):
+        """Execute skills as a chain (list of skill IDs or DAG of stages)"""
+        from src.skill_chain import SkillChain, ChainStage
+
+        query = payload.get("query", "")
+        try:
+            if "stages" in payload:
+                chain = SkillChain([ChainStage(**stage) for stage in payload["stages"]])
+            else:
+                chain = SkillChain.linear(payload.get("skills", []))
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        try:
+            return await chain.run(query)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
     logger.info("Bot with skills support created")
     return app
 
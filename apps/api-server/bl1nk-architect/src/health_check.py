@@ -8,20 +8,53 @@ Checks for:
 4. Webhook Check - Slack/Linear/ClickUp connectivity
 5. GitHub Check - GitHub App & OAuth
 6. Deep Research - Gemini API connectivity
+
+Checks run concurrently, each with its own deadline. Results are cached
+per check for its TTL; stale results are served while a single background
+refresh runs, so readers never wait on (or stampede) upstream APIs.
+Background refreshes need a long-lived event loop: one-shot callers
+(``asyncio.run`` per read, as in the CLI and dashboard) pass ``fresh=True``
+to ``run_health_check`` instead.
 """
 
 import os
+import re
 import sys
+import time
 import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import importlib
 import ast
 
+from src.health_history import HealthHistory
+
 logger = logging.getLogger(__name__)
 
+# Directory linted by the Lint Check (this package's own sources by default)
+LINT_SRC_DIR = os.getenv("LINT_SRC_DIR", os.path.dirname(os.path.abspath(__file__)))
+LINT_MAX_CHARS = 50000
+LINT_MAX_LINE_LENGTH = 120
+# Below this many changed files, linting in-process beats dispatching to workers
+LINT_POOL_THRESHOLD = 8
+
+# Samples kept per check, and an optional SQLite file to persist them in
+HEALTH_HISTORY_SIZE = int(os.getenv("HEALTH_HISTORY_SIZE", "1440"))
+HEALTH_HISTORY_DB = os.getenv("HEALTH_HISTORY_DB")
+
+# Seconds between background refresh passes while event subscribers exist
+HEALTH_REFRESH_INTERVAL = float(os.getenv("HEALTH_REFRESH_INTERVAL", "30"))
+# Events buffered per subscriber before the oldest are dropped
+EVENT_QUEUE_SIZE = 100
+
+SLACK_WEBHOOK_PATTERN = re.compile(r"https://hooks\.slack\.com/(services|workflows|triggers)/[A-Za-z0-9_/-]+")
+
 
 @dataclass
 class HealthCheckResult:
@@ -37,29 +70,236 @@ class HealthCheckResult:
             self.timestamp = datetime.now()
         if self.details is None:
             self.details = {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "check": self.check_name,
+            "status": self.status,
+            "message": self.message,
+            "details": self.details,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+@dataclass
+class CheckSpec:
+    """How one check is scheduled"""
+    name: str       # Result key, e.g. "Lint Check"
+    method: str     # HealthChecker coroutine that records the result
+    timeout: float  # Seconds before the check is reported as an error
+    ttl: float      # Seconds a result is served without refreshing
+    critical: bool = False  # An "error" result makes the service not ready
+
+
+CHECK_SPECS: List[CheckSpec] = [
+    CheckSpec("Health Check", "check_basic_health", timeout=10, ttl=300, critical=True),
+    CheckSpec("Lint Check", "check_lint", timeout=30, ttl=300),
+    CheckSpec("Skill Check", "check_skills", timeout=15, ttl=60, critical=True),
+    CheckSpec("Webhook Check", "check_webhooks", timeout=8, ttl=120),
+    CheckSpec("GitHub Check", "check_github", timeout=5, ttl=300),
+    CheckSpec("Deep Research Check", "check_deep_research", timeout=15, ttl=120),
+]
 
 
 class HealthChecker:
     """Main health checker"""
     
-    def __init__(self):
+    def __init__(self, specs: Optional[List[CheckSpec]] = None):
+        self.specs: Dict[str, CheckSpec] = {spec.name: spec for spec in (specs or CHECK_SPECS)}
+        self._order = {name: index for index, name in enumerate(self.specs)}
         self.results: Dict[str, HealthCheckResult] = {}
         self.logger = logger
+        self._refreshed_at: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refresher: Optional[asyncio.Task] = None
+        self.lint_cache = LintCache(LINT_SRC_DIR)
+        self.history = HealthHistory(HEALTH_HISTORY_SIZE, HEALTH_HISTORY_DB)
+        self._subscribers: List[asyncio.Queue] = []
+        self._http = None
+        self._http_loop = None
     
     async def run_all_checks(self) -> Dict[str, HealthCheckResult]:
-        """Run all health checks"""
-        self.results = {}
-        
-        # Sequential checks
-        await self.check_basic_health()
-        await self.check_lint()
-        await self.check_skills()
-        await self.check_webhooks()
-        await self.check_github()
-        await self.check_deep_research()
+        """Run all health checks now, concurrently"""
+        await asyncio.gather(*(self.run_check(name) for name in self.specs))
+        return self.results
+    
+    async def iter_checks(self, names: Optional[List[str]] = None):
+        """Run checks concurrently, yielding (result, elapsed ms) as each finishes"""
+        started = time.monotonic()
+        runs = [self.run_check(name) for name in (names or self.specs)]
+        for run in asyncio.as_completed(runs):
+            result = await run
+            yield result, (time.monotonic() - started) * 1000
+    
+    async def run_check(self, name: str) -> HealthCheckResult:
+        """Run one check within its deadline; joins a run already in flight"""
+        # A cancelled caller must not cancel the run other callers share
+        return await asyncio.shield(self._start(name))
+    
+    def _start(self, name: str) -> asyncio.Task:
+        """The in-flight run of a check, started if there is none"""
+        task = self._inflight.get(name)
+        # A run left over from a closed loop cannot be awaited from this one
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._run_with_deadline(self.specs[name]))
+            self._inflight[name] = task
+            task.add_done_callback(lambda done: self._finished(name, done))
+        return task
+    
+    def _finished(self, name: str, task: asyncio.Task):
+        if self._inflight.get(name) is task:
+            del self._inflight[name]
+    
+    async def _run_with_deadline(self, spec: CheckSpec) -> HealthCheckResult:
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(getattr(self, spec.method)(), spec.timeout)
+        except asyncio.TimeoutError:
+            self.add_result(HealthCheckResult(
+                check_name=spec.name,
+                status="error",
+                message=f"Timed out after {spec.timeout}s",
+                details={"timeout": spec.timeout}
+            ))
+        self._refreshed_at[spec.name] = time.monotonic()
+        result = self.results[spec.name]
+        latency_ms = (time.monotonic() - started) * 1000
+        self.history.record(spec.name, result.status, latency_ms)
+        if self.history.path:
+            # Runs finishing together share one commit, made off the loop
+            try:
+                await asyncio.to_thread(self.history.flush)
+            except Exception as e:
+                logger.warning(f"Could not persist health history: {e}")
+        if self._subscribers:
+            self._publish({"type": "check", "latency_ms": round(latency_ms, 3), **result.to_dict()})
+            self._publish({"type": "summary", **self.get_summary()})
+        return result
+    
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Queue that receives a ``check`` and a ``summary`` event whenever a
+        check finishes. The first subscriber starts the background refresh,
+        so any number of subscribers share one check cycle.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._subscribers.append(queue)
+        self.start_background_refresh(HEALTH_REFRESH_INTERVAL)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Stop delivering events to a queue; the last one stops the refresh"""
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+        if not self._subscribers and self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+    
+    def _publish(self, event: Dict[str, Any]):
+        for queue in self._subscribers:
+            if queue.full():
+                # A slow subscriber loses its oldest event, never blocks checks
+                queue.get_nowait()
+            queue.put_nowait(event)
+    
+    def is_fresh(self, name: str) -> bool:
+        """True while a check's cached result is within its TTL"""
+        refreshed_at = self._refreshed_at.get(name)
+        return refreshed_at is not None and time.monotonic() - refreshed_at < self.specs[name].ttl
+    
+    async def get_results(self) -> Dict[str, HealthCheckResult]:
+        """
+        Cached results for every check
         
+        Checks that never ran are awaited; stale ones are refreshed in the
+        background while the cached result is returned.
+        """
+        missing = [name for name in self.specs if name not in self.results]
+        if missing:
+            await asyncio.gather(*(self.run_check(name) for name in missing))
+        for name in self.specs:
+            if not self.is_fresh(name):
+                self._start(name)
         return self.results
     
+    async def get_result(self, name: str) -> Optional[HealthCheckResult]:
+        """Cached result for one check, running it if it never ran"""
+        if name not in self.specs:
+            return None
+        if name not in self.results:
+            await self.run_check(name)
+        elif not self.is_fresh(name):
+            self._start(name)
+        return self.results.get(name)
+    
+    def get_readiness(self) -> Dict[str, Any]:
+        """
+        Readiness from cached results only - never waits on a check
+        
+        Stale critical checks are refreshed in the background; a critical
+        check that has not produced a result yet counts as pending.
+        """
+        failing = []
+        pending = []
+        for name, spec in self.specs.items():
+            if not spec.critical:
+                continue
+            if not self.is_fresh(name):
+                self._start(name)
+            result = self.results.get(name)
+            if result is None:
+                pending.append(name)
+            elif result.status == "error":
+                failing.append(name)
+        return {
+            "ready": not failing and not pending,
+            "failing": failing,
+            "pending": pending,
+            "checks": {name: result.status for name, result in self.results.items()},
+        }
+    
+    def start_background_refresh(self, interval: float = 30.0):
+        """Refresh stale checks every ``interval`` seconds until stopped"""
+        async def refresh_loop():
+            while True:
+                stale = [name for name in self.specs if not self.is_fresh(name)]
+                if stale:
+                    await asyncio.gather(*(self.run_check(name) for name in stale))
+                await asyncio.sleep(interval)
+        
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(refresh_loop())
+    
+    async def stop_background_refresh(self):
+        """Stop the refresh loop started by start_background_refresh"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+    
+    def http_client(self):
+        """Shared HTTP client, so probes reuse connections from run to run"""
+        loop = asyncio.get_running_loop()
+        # A client's connections belong to the loop that opened them
+        if self._http is None or self._http_loop is not loop:
+            import httpx
+            self._http = httpx.AsyncClient(timeout=5)
+            self._http_loop = loop
+        return self._http
+    
+    async def aclose(self):
+        """Release the HTTP client, lint workers and history database"""
+        await self.stop_background_refresh()
+        if self._http is not None and self._http_loop is asyncio.get_running_loop():
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
+        self.lint_cache.shutdown()
+        self.history.close()
+    
     def add_result(self, result: HealthCheckResult):
         """Add check result"""
         self.results[result.check_name] = result
@@ -71,27 +311,24 @@ class HealthChecker:
             python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
             
             # Check required packages
+            # Import names (PyGithub -> github, pyjwt -> jwt, ...)
             required_packages = [
                 'fastapi',
                 'fastapi_poe',
                 'modal',
                 'google.genai',
-                'PyGithub',
+                'github',
                 'requests',
-                'pyjwt',
+                'jwt',
                 'cryptography',
                 'jinja2',
-                'python_dotenv',
+                'dotenv',
                 'httpx',
-                'pyyaml',
+                'yaml',
             ]
             
-            missing_packages = []
-            for pkg in required_packages:
-                try:
-                    __import__(pkg)
-                except ImportError:
-                    missing_packages.append(pkg)
+            # Imports can block for a while; keep them off the event loop
+            missing_packages = await asyncio.to_thread(_missing_packages, required_packages)
             
             if missing_packages:
                 result = HealthCheckResult(
@@ -129,40 +366,8 @@ class HealthChecker:
     async def check_lint(self):
         """Check 2: Lint Check - Code quality"""
         try:
-            src_dir = "/home/user/projects/bl1nk-architect/src"
-            python_files = []
-            lint_issues = []
-            
-            # Find all Python files
-            import os
-            for root, dirs, files in os.walk(src_dir):
-                for file in files:
-                    if file.endswith('.py'):
-                        python_files.append(os.path.join(root, file))
-            
-            # Check each file
-            for file_path in python_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        code = f.read()
-                    
-                    # Parse Python code
-                    ast.parse(code)
-                    
-                    # Check for common issues
-                    if len(code) > 50000:
-                        lint_issues.append(f"{file_path}: File too large ({len(code)} chars)")
-                    
-                    if code.count('\t') > 0:
-                        lint_issues.append(f"{file_path}: Contains tabs")
-                    
-                    # Check line length
-                    for i, line in enumerate(code.split('\n'), 1):
-                        if len(line) > 120:
-                            lint_issues.append(f"{file_path}:{i}: Line too long ({len(line)} chars)")
-                
-                except SyntaxError as e:
-                    lint_issues.append(f"{file_path}: Syntax error - {str(e)}")
+            # File reads and parsing block; run them off the event loop
+            python_files, lint_issues, relinted = await asyncio.to_thread(self.lint_cache.lint)
             
             if lint_issues:
                 status = "warning"
@@ -177,6 +382,7 @@ class HealthChecker:
                 message=message,
                 details={
                     "files_checked": len(python_files),
+                    "files_relinted": relinted,
                     "issues_found": len(lint_issues),
                     "issues": lint_issues[:10]  # First 10 issues
                 }
@@ -208,7 +414,7 @@ class HealthChecker:
             for skills_root in [skills_dir, example_skills_dir]:
                 if os.path.exists(skills_root):
                     try:
-                        skills = SkillDiscovery.find_skills(skills_root)
+                        skills = await asyncio.to_thread(SkillDiscovery.find_skills, skills_root)
                         discovered_skills.extend(skills)
                     except Exception as e:
                         failed_skills.append(f"{skills_root}: {str(e)}")
@@ -219,7 +425,7 @@ class HealthChecker:
             
             for skill_path in discovered_skills:
                 try:
-                    skill = SkillDiscovery.parse_skill_file(skill_path)
+                    skill = await asyncio.to_thread(SkillDiscovery.parse_skill_file, skill_path)
                     if skill:
                         parsed_skills.append(skill.metadata.name)
                     else:
@@ -268,85 +474,81 @@ class HealthChecker:
                 "clickup": {"status": "unconfigured", "message": ""},
             }
             
-            # Check Slack
             slack_webhook = os.getenv("SLACK_WEBHOOK_URL")
-            if slack_webhook:
-                try:
-                    import httpx
-                    async with httpx.AsyncClient(timeout=5) as client:
-                        response = await client.post(
-                            slack_webhook,
-                            json={"text": "Health check ping"}
-                        )
-                        if response.status_code == 200:
-                            webhook_results["slack"] = {
-                                "status": "ok",
-                                "message": "Webhook accessible"
-                            }
-                        else:
-                            webhook_results["slack"] = {
-                                "status": "error",
-                                "message": f"HTTP {response.status_code}"
-                            }
-                except Exception as e:
+            linear_api_key = os.getenv("LINEAR_API_KEY")
+            clickup_api_key = os.getenv("CLICKUP_API_KEY")
+            
+            async def check_slack():
+                # Any request to an incoming webhook posts to the channel,
+                # so periodic checks only validate the URL's format
+                if SLACK_WEBHOOK_PATTERN.fullmatch(slack_webhook):
+                    webhook_results["slack"] = {
+                        "status": "ok",
+                        "message": "Webhook URL configured"
+                    }
+                else:
                     webhook_results["slack"] = {
                         "status": "error",
-                        "message": str(e)
+                        "message": "Not a Slack incoming webhook URL"
                     }
             
-            # Check Linear
-            linear_api_key = os.getenv("LINEAR_API_KEY")
-            if linear_api_key:
+            async def check_linear():
                 try:
-                    import httpx
-                    async with httpx.AsyncClient(timeout=5) as client:
-                        response = await client.post(
-                            "https://api.linear.app/graphql",
-                            json={"query": "{ viewer { id } }"},
-                            headers={"Authorization": f"Bearer {linear_api_key}"}
-                        )
-                        if "errors" not in response.json():
-                            webhook_results["linear"] = {
-                                "status": "ok",
-                                "message": "API accessible"
-                            }
-                        else:
-                            webhook_results["linear"] = {
-                                "status": "error",
-                                "message": "API error"
-                            }
+                    client = self.http_client()
+                    response = await client.post(
+                        "https://api.linear.app/graphql",
+                        json={"query": "{ viewer { id } }"},
+                        headers={"Authorization": f"Bearer {linear_api_key}"}
+                    )
+                    if "errors" not in response.json():
+                        webhook_results["linear"] = {
+                            "status": "ok",
+                            "message": "API accessible"
+                        }
+                    else:
+                        webhook_results["linear"] = {
+                            "status": "error",
+                            "message": "API error"
+                        }
                 except Exception as e:
                     webhook_results["linear"] = {
                         "status": "error",
                         "message": str(e)
                     }
             
-            # Check ClickUp
-            clickup_api_key = os.getenv("CLICKUP_API_KEY")
-            if clickup_api_key:
+            async def check_clickup():
                 try:
-                    import httpx
-                    async with httpx.AsyncClient(timeout=5) as client:
-                        response = await client.get(
-                            "https://api.clickup.com/api/v2/user",
-                            headers={"Authorization": clickup_api_key}
-                        )
-                        if response.status_code == 200:
-                            webhook_results["clickup"] = {
-                                "status": "ok",
-                                "message": "API accessible"
-                            }
-                        else:
-                            webhook_results["clickup"] = {
-                                "status": "error",
-                                "message": f"HTTP {response.status_code}"
-                            }
+                    client = self.http_client()
+                    response = await client.get(
+                        "https://api.clickup.com/api/v2/user",
+                        headers={"Authorization": clickup_api_key}
+                    )
+                    if response.status_code == 200:
+                        webhook_results["clickup"] = {
+                            "status": "ok",
+                            "message": "API accessible"
+                        }
+                    else:
+                        webhook_results["clickup"] = {
+                            "status": "error",
+                            "message": f"HTTP {response.status_code}"
+                        }
                 except Exception as e:
                     webhook_results["clickup"] = {
                         "status": "error",
                         "message": str(e)
                     }
             
+            # Probe the configured services concurrently
+            probes = []
+            if slack_webhook:
+                probes.append(check_slack())
+            if linear_api_key:
+                probes.append(check_linear())
+            if clickup_api_key:
+                probes.append(check_clickup())
+            await asyncio.gather(*probes)
+            
             # Determine overall status
             configured = sum(1 for v in webhook_results.values() if v["status"] != "unconfigured")
             errors = sum(1 for v in webhook_results.values() if v["status"] == "error")
@@ -465,7 +667,8 @@ class HealthChecker:
                     
                     # Try a simple API call
                     model = genai.GenerativeModel('gemini-1.5-pro')
-                    response = model.generate_content("ping")
+                    # The client is synchronous; a thread keeps the deadline enforceable
+                    response = await asyncio.to_thread(model.generate_content, "ping")
                     
                     result = HealthCheckResult(
                         check_name="Deep Research Check",
@@ -529,11 +732,142 @@ class HealthChecker:
                     "message": result.message,
                     "details": result.details
                 }
-                for name, result in self.results.items()
+                # Report order follows the specs, not completion order
+                for name, result in sorted(
+                    self.results.items(), key=lambda item: self._order.get(item[0], len(self._order))
+                )
             }
         }
 
 
+def _lint_source(file_path: str, code: str) -> List[str]:
+    """Lint issues in one file's source"""
+    issues = []
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        return [f"{file_path}: Syntax error - {str(e)}"]
+    
+    if len(code) > LINT_MAX_CHARS:
+        issues.append(f"{file_path}: File too large ({len(code)} chars)")
+    
+    if '\t' in code:
+        issues.append(f"{file_path}: Contains tabs")
+    
+    # Only split into lines when some line could be too long
+    if len(code) > LINT_MAX_LINE_LENGTH:
+        for i, line in enumerate(code.split('\n'), 1):
+            if len(line) > LINT_MAX_LINE_LENGTH:
+                issues.append(f"{file_path}:{i}: Line too long ({len(line)} chars)")
+    return issues
+
+
+def _lint_file(file_path: str) -> List[str]:
+    """Read and lint one file (runs in a worker process)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return _lint_source(file_path, f.read())
+    except (OSError, UnicodeDecodeError) as e:
+        return [f"{file_path}: Unreadable - {str(e)}"]
+
+
+class LintCache:
+    """
+    Incremental lint of a source tree
+    
+    Per-file results are keyed by (mtime, size). A file whose stat changed
+    is hashed, and only files whose content hash changed are re-linted -
+    in a process pool when enough of them changed at once.
+    
+    Runs are serialized: a run whose check timed out keeps going in its
+    thread, and the next run waits for it (then mostly hits the cache).
+    """
+    
+    def __init__(self, src_dir: str, max_workers: Optional[int] = None):
+        self.src_dir = src_dir
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        # path -> (mtime_ns, size, sha256, issues)
+        self._entries: Dict[str, Tuple[int, int, str, List[str]]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def lint(self) -> Tuple[List[str], List[str], int]:
+        """(files checked, issues, files re-linted) for the current tree"""
+        with self._lock:
+            return self._lint()
+    
+    def _lint(self) -> Tuple[List[str], List[str], int]:
+        python_files = []
+        for root, dirs, files in os.walk(self.src_dir):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            python_files.extend(os.path.join(root, file) for file in files if file.endswith('.py'))
+        python_files.sort()
+        
+        entries: Dict[str, Tuple[int, int, str, List[str]]] = {}
+        changed: Dict[str, Tuple[int, int, str]] = {}
+        for file_path in python_files:
+            try:
+                stat = os.stat(file_path)
+                entry = self._entries.get(file_path)
+                if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                    entries[file_path] = entry
+                    continue
+                with open(file_path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                continue
+            if entry and entry[2] == digest:
+                # Touched but unchanged
+                entries[file_path] = (stat.st_mtime_ns, stat.st_size, digest, entry[3])
+            else:
+                changed[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        
+        for file_path, issues in zip(changed, self._lint_changed(list(changed))):
+            entries[file_path] = (*changed[file_path], issues)
+        
+        # Deleted files drop out here
+        self._entries = entries
+        lint_issues = [issue for file_path in python_files if file_path in entries
+                       for issue in entries[file_path][3]]
+        return python_files, lint_issues, len(changed)
+    
+    def _lint_changed(self, paths: List[str]) -> List[List[str]]:
+        if len(paths) < LINT_POOL_THRESHOLD or self.max_workers < 2:
+            return [_lint_file(path) for path in paths]
+        
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        chunksize = max(1, len(paths) // (self.max_workers * 4))
+        try:
+            return list(pool.map(_lint_file, paths, chunksize=chunksize))
+        except Exception as e:
+            logger.warning(f"Lint pool failed, linting in-process: {e}")
+            self.shutdown()
+            return [_lint_file(path) for path in paths]
+    
+    def shutdown(self):
+        """Stop the worker processes (they are restarted on demand)"""
+        # Not under the lock: shutdown must not wait for a run in progress
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _missing_packages(packages: List[str]) -> List[str]:
+    """Packages that fail to import"""
+    missing = []
+    for pkg in packages:
+        try:
+            __import__(pkg)
+        except ImportError:
+            missing.append(pkg)
+    return missing
+
+
 # Global health checker instance
 _health_checker: Optional[HealthChecker] = None
 
@@ -546,10 +880,18 @@ def get_health_checker() -> HealthChecker:
     return _health_checker
 
 
-async def run_health_check() -> Dict[str, Any]:
-    """Run all health checks and return summary"""
+async def run_health_check(fresh: bool = False) -> Dict[str, Any]:
+    """
+    Summary of all health checks, served from the per-check cache
+    
+    ``fresh`` re-runs every check and waits for it; use it when the event
+    loop ends with the call, since a background refresh would not finish.
+    """
     checker = get_health_checker()
-    await checker.run_all_checks()
+    if fresh:
+        await checker.run_all_checks()
+    else:
+        await checker.get_results()
     return checker.get_summary()
 
 
@@ -557,7 +899,7 @@ if __name__ == "__main__":
     import json
     
     async def main():
-        result = await run_health_check()
+        result = await run_health_check(fresh=True)
         print(json.dumps(result, indent=2, default=str))
     
     asyncio.run(main())
@@ -2,28 +2,64 @@
 Health Check API Endpoints
 
 Expose health checks via FastAPI endpoints:
+- GET /livez - Liveness probe (constant time, no I/O)
+- GET /readyz - Readiness probe (cached check state and skill loading)
 - GET /health - Basic health check
 - GET /health/full - Complete health check report
 - GET /health/status/{check_name} - Specific check
 - GET /health/summary - Summary only
+- GET /health/history/{check_name} - Samples and stats over a time window
+- GET /health/events - Server-sent check and summary events
 """
 
+import json
+import asyncio
+from typing import Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
 from src.health_check import get_health_checker, run_health_check
+from src.poe_plugin_manager import is_skill_system_ready
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds of silence before an SSE keep-alive comment is sent
+EVENT_KEEPALIVE = 15.0
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+def create_probe_router(require_skills: bool = True) -> APIRouter:
+    """
+    Orchestrator probes, kept outside /health and free of outbound calls
+    
+    ``require_skills`` makes /readyz wait for the skill system to load.
+    """
+    probe_router = APIRouter(tags=["health"])
+    
+    @probe_router.get("/livez")
+    async def livez():
+        """Liveness - the event loop is serving requests"""
+        return {"status": "alive"}
+    
+    @probe_router.get("/readyz")
+    async def readyz():
+        """Readiness - cached critical checks pass and skills are loaded"""
+        readiness = get_health_checker().get_readiness()
+        skills_ready = is_skill_system_ready() or not require_skills
+        readiness["skills_ready"] = skills_ready
+        readiness["ready"] = readiness["ready"] and skills_ready
+        return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+    
+    return probe_router
+
+
 @router.get("")
 async def health():
     """Basic health check - returns 200 if healthy"""
     try:
         checker = get_health_checker()
-        if not checker.results:
-            await checker.check_basic_health()
+        await checker.get_result("Health Check")
         
         summary = checker.get_summary()
         
@@ -57,11 +93,7 @@ async def health_status(check_name: str):
     """Get specific health check status"""
     try:
         checker = get_health_checker()
-        
-        if not checker.results:
-            await checker.run_all_checks()
-        
-        check_result = checker.results.get(check_name)
+        check_result = await checker.get_result(check_name)
         
         if not check_result:
             raise HTTPException(status_code=404, detail=f"Check not found: {check_name}")
@@ -95,16 +127,70 @@ async def health_summary():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/events")
+async def health_events():
+    """
+    Stream health events as SSE
+    
+    Starts with a ``summary`` snapshot from the cache, then relays every
+    ``check`` and ``summary`` event. Checks run on the shared background
+    refresh, so each additional subscriber costs no extra probes.
+    """
+    checker = get_health_checker()
+    queue = checker.subscribe()
+    
+    def sse(event: dict) -> bytes:
+        data = json.dumps(event, default=str)
+        return f"event: {event['type']}\ndata: {data}\n\n".encode("utf-8")
+    
+    async def events():
+        try:
+            await checker.get_results()
+            yield sse({"type": "summary", **checker.get_summary()})
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), EVENT_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                yield sse(event)
+        finally:
+            checker.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/history")
+async def health_history(window: Optional[float] = None):
+    """Latency and status stats for every check over the last ``window`` seconds"""
+    history = get_health_checker().history
+    return {
+        "window_seconds": window,
+        "checks": {name: history.stats(name, window) for name in history.checks()},
+    }
+
+
+@router.get("/history/{check_name}")
+async def health_history_check(check_name: str, window: Optional[float] = None, samples: bool = True):
+    """Samples and stats for one check, read from history (never runs the check)"""
+    history = get_health_checker().history
+    if check_name not in history.checks():
+        raise HTTPException(status_code=404, detail=f"No history for check: {check_name}")
+    result = history.stats(check_name, window)
+    if samples:
+        result["samples_data"] = history.samples(check_name, window)
+    return result
+
+
 @router.get("/lint")
 async def health_lint():
     """Get lint check details"""
     try:
-        checker = get_health_checker()
-        
-        if "Lint Check" not in checker.results:
-            await checker.check_lint()
-        
-        result = checker.results.get("Lint Check")
+        result = await get_health_checker().get_result("Lint Check")
         
         if not result:
             raise HTTPException(status_code=500, detail="Lint check failed")
@@ -126,12 +212,7 @@ async def health_lint():
 async def health_skills():
     """Get skills check details"""
     try:
-        checker = get_health_checker()
-        
-        if "Skill Check" not in checker.results:
-            await checker.check_skills()
-        
-        result = checker.results.get("Skill Check")
+        result = await get_health_checker().get_result("Skill Check")
         
         if not result:
             raise HTTPException(status_code=500, detail="Skills check failed")
@@ -153,12 +234,7 @@ async def health_skills():
 async def health_webhooks():
     """Get webhooks check details"""
     try:
-        checker = get_health_checker()
-        
-        if "Webhook Check" not in checker.results:
-            await checker.check_webhooks()
-        
-        result = checker.results.get("Webhook Check")
+        result = await get_health_checker().get_result("Webhook Check")
         
         if not result:
             raise HTTPException(status_code=500, detail="Webhooks check failed")
@@ -180,12 +256,7 @@ async def health_webhooks():
 async def health_github():
     """Get GitHub check details"""
     try:
-        checker = get_health_checker()
-        
-        if "GitHub Check" not in checker.results:
-            await checker.check_github()
-        
-        result = checker.results.get("GitHub Check")
+        result = await get_health_checker().get_result("GitHub Check")
         
         if not result:
             raise HTTPException(status_code=500, detail="GitHub check failed")
@@ -207,12 +278,7 @@ async def health_github():
 async def health_deepresearch():
     """Get Deep Research check details"""
     try:
-        checker = get_health_checker()
-        
-        if "Deep Research Check" not in checker.results:
-            await checker.check_deep_research()
-        
-        result = checker.results.get("Deep Research Check")
+        result = await get_health_checker().get_result("Deep Research Check")
         
         if not result:
             raise HTTPException(status_code=500, detail="Deep Research check failed")
@@ -230,6 +296,7 @@ async def health_deepresearch():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def include_health_routes(app):
-    """Include health check routes in FastAPI app"""
+def include_health_routes(app, require_skills: bool = True):
+    """Include health check and probe routes in FastAPI app"""
+    app.include_router(create_probe_router(require_skills))
     app.include_router(router)
@@ -0,0 +1,223 @@
+"""
+Health History - Time series of health check samples
+
+Each check keeps a fixed-size ring buffer of (timestamp, latency, status)
+samples in flat ``array`` columns, so memory stays constant no matter how
+long the service runs:
+1. Appending a sample overwrites the oldest one once the buffer is full
+2. Time windows are found by binary search over the timestamps
+3. Stats report latency percentiles, status counts and availability
+4. With a SQLite path, samples are also persisted and reloaded on start;
+   ``record`` only queues rows, and ``flush`` writes everything queued in
+   one transaction, off the event loop
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_CODES = {"ok": 0, "warning": 1, "error": 2}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS health_samples (
+    check_name TEXT NOT NULL,
+    ts REAL NOT NULL,
+    latency_ms REAL NOT NULL,
+    status INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_health_samples_check_ts
+    ON health_samples (check_name, ts);
+"""
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+class RingBuffer:
+    """Fixed-size buffer of samples stored column-wise in arrays"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.latencies = array("d", bytes(8 * capacity))
+        self.statuses = array("b", bytes(capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, latency_ms: float, status: int):
+        self.timestamps[self._next] = timestamp
+        self.latencies[self._next] = latency_ms
+        self.statuses[self._next] = status
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _slot(self, index: int) -> int:
+        """Array slot of the ``index``-th oldest sample"""
+        return (self._next - self._size + index) % self.capacity
+
+    def oldest(self) -> Optional[float]:
+        return self.timestamps[self._slot(0)] if self._size else None
+
+    def window(self, since: Optional[float] = None, until: Optional[float] = None) -> Tuple[array, array, array]:
+        """(timestamps, latencies, statuses) with ``since <= timestamp <= until``, oldest first"""
+        positions = range(self._size)
+        key = lambda index: self.timestamps[self._slot(index)]
+        start = bisect_left(positions, since, key=key) if since is not None else 0
+        end = bisect_right(positions, until, key=key) if until is not None else self._size
+        return tuple(self._slice(column, start, end) for column in
+                     (self.timestamps, self.latencies, self.statuses))
+
+    def _slice(self, column: array, start: int, end: int) -> array:
+        """Logical ``[start:end]`` of a column - at most two array slices"""
+        if start >= end:
+            return column[:0]
+        first, last = self._slot(start), self._slot(end - 1)
+        if first <= last:
+            return column[first:last + 1]
+        return column[first:] + column[:last + 1]
+
+
+class HealthHistory:
+    """Per-check ring buffers of health samples, optionally backed by SQLite"""
+
+    def __init__(self, capacity: int = 1440, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self._buffers: Dict[str, RingBuffer] = {}
+        self._writes: Dict[str, int] = {}
+        self._pending: List[Tuple[str, float, float, int]] = []
+        self._lock = threading.Lock()
+        # Serializes database writes without holding up record() and reads
+        self._write_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+            self._load()
+
+    def _load(self):
+        """Fill the buffers with the newest persisted samples of each check"""
+        names = [row[0] for row in self._conn.execute(
+            "SELECT DISTINCT check_name FROM health_samples"
+        )]
+        for name in names:
+            rows = self._conn.execute(
+                "SELECT ts, latency_ms, status FROM health_samples WHERE check_name = ? "
+                "ORDER BY ts DESC LIMIT ?",
+                (name, self.capacity),
+            ).fetchall()
+            buffer = self._buffer(name)
+            for ts, latency_ms, status in reversed(rows):
+                buffer.append(ts, latency_ms, status)
+        if names:
+            logger.info(f"Loaded health history for {len(names)} checks from {self.path}")
+
+    def _buffer(self, check_name: str) -> RingBuffer:
+        buffer = self._buffers.get(check_name)
+        if buffer is None:
+            buffer = self._buffers[check_name] = RingBuffer(self.capacity)
+        return buffer
+
+    def record(self, check_name: str, status: str, latency_ms: float, timestamp: Optional[float] = None):
+        """Append one sample for a check (in memory; persisted by ``flush``)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        code = STATUS_CODES.get(status, STATUS_CODES["error"])
+        with self._lock:
+            self._buffer(check_name).append(timestamp, latency_ms, code)
+            if self._conn is not None:
+                self._pending.append((check_name, timestamp, latency_ms, code))
+
+    def flush(self) -> int:
+        """Write queued samples in one transaction; blocks, so call it in a thread"""
+        with self._write_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                conn = self._conn
+            if not rows or conn is None:
+                return 0
+            with conn:
+                conn.executemany(
+                    "INSERT INTO health_samples (check_name, ts, latency_ms, status) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                # Trim rows that fell out of the buffer once per buffer's worth of writes
+                for check_name, count in Counter(row[0] for row in rows).items():
+                    writes = self._writes.get(check_name, 0) + count
+                    if writes >= self.capacity:
+                        with self._lock:
+                            oldest = self._buffers[check_name].oldest()
+                        conn.execute(
+                            "DELETE FROM health_samples WHERE check_name = ? AND ts < ?",
+                            (check_name, oldest),
+                        )
+                        writes = 0
+                    self._writes[check_name] = writes
+            return len(rows)
+
+    def checks(self) -> List[str]:
+        """Names of checks with at least one sample"""
+        with self._lock:
+            return list(self._buffers)
+
+    def samples(self, check_name: str, window: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Samples of the last ``window`` seconds (all if None), oldest first"""
+        since = time.time() - window if window else None
+        with self._lock:
+            buffer = self._buffers.get(check_name)
+            timestamps, latencies, statuses = buffer.window(since) if buffer else ((), (), ())
+        return [
+            {"timestamp": ts, "latency_ms": round(latency, 3), "status": STATUS_NAMES[code]}
+            for ts, latency, code in zip(timestamps, latencies, statuses)
+        ]
+
+    def stats(self, check_name: str, window: Optional[float] = None) -> Dict[str, Any]:
+        """Latency percentiles, status counts and availability over a window"""
+        since = time.time() - window if window else None
+        with self._lock:
+            buffer = self._buffers.get(check_name)
+            timestamps, latencies, statuses = buffer.window(since) if buffer else ((), (), ())
+
+        latencies = sorted(latencies)
+        counts = {name: statuses.count(code) for name, code in STATUS_CODES.items()}
+        total = len(timestamps)
+        return {
+            "check": check_name,
+            "window_seconds": window,
+            "samples": total,
+            "latency_ms": {
+                "p50": round(_percentile(latencies, 50), 3),
+                "p95": round(_percentile(latencies, 95), 3),
+                "p99": round(_percentile(latencies, 99), 3),
+                "mean": round(sum(latencies) / total, 3) if total else 0.0,
+                "max": round(latencies[-1], 3) if latencies else 0.0,
+            },
+            "status_counts": counts,
+            # Share of samples that were not errors
+            "availability": round(1 - counts["error"] / total, 4) if total else None,
+            "first_timestamp": timestamps[0] if total else None,
+            "last_timestamp": timestamps[-1] if total else None,
+        }
+
+    def close(self):
+        """Flush queued samples and close the database"""
+        self.flush()
+        with self._write_lock, self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -15,6 +15,7 @@ from src.github_client import GitHubClient
 from src.gemini_client import deep_research_task
 from src.auth import get_installation_id, get_access_token
 from src.notifications import get_notification_manager
+from src.analysis_export import get_analysis_exporter
 from src.widgets import create_analysis_report
 from utils.formatter import format_architecture_plan
 
@@ -190,6 +191,14 @@ async def run_architect_workflow_v2(
             typescript_deps=ts_deps or [],
         )
         
+        # Append structured results to the analysis dataset
+        try:
+            exporter = get_analysis_exporter()
+            if exporter is not None:
+                await asyncio.to_thread(exporter.export, analysis_data, task_id=task_id)
+        except Exception as e:
+            logger.exception(f"Analysis export error: {e}")
+        
         # Send notifications
         yield "\n\n## 📤 Sending Notifications\n\n"
         notification_manager = get_notification_manager()
@@ -7,7 +7,7 @@ Allows workflow to send architecture report as downloadable file.
 import logging
 from typing import AsyncGenerator, Optional
 
-from src.attachment_handler import AttachmentHandler
+from src.attachment_handler import AttachmentHandler, default_compression
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,8 @@ logger = logging.getLogger(__name__)
 async def create_architecture_report(
     repo_name: str,
     analysis_results: str,
-    file_format: str = "markdown"
+    file_format: str = "markdown",
+    compression: Optional[str] = None
 ) -> tuple[bytes, str, str]:
     """
     Create architecture report file.
@@ -24,12 +25,14 @@ async def create_architecture_report(
         repo_name: Repository name
         analysis_results: Full analysis results
         file_format: Output format (markdown, json, html)
+        compression: "gzip" or "zstd" for the file (default: ATTACHMENT_COMPRESSION)
         
     Returns:
         Tuple of (file_bytes, filename, content_type)
     """
     
     handler = AttachmentHandler()
+    compression = compression or default_compression()
     
     if file_format == "markdown":
         # Wrap analysis in markdown template
@@ -52,9 +55,10 @@ async def create_architecture_report(
 - Status: Complete
 
 """
-        file_bytes, filename = await handler.prepare_markdown_file(
-            report_content,
-            filename=f"{repo_name}_architecture_analysis.md"
+        file_obj, filename = await handler.stream_text_file(
+            [report_content],
+            filename=f"{repo_name}_architecture_analysis.md",
+            compression=compression
         )
         content_type = "text/markdown"
     
@@ -65,26 +69,36 @@ async def create_architecture_report(
             "format": "json",
             "status": "complete"
         }
-        file_bytes, filename = await handler.prepare_json_file(
+        file_obj, filename = await handler.stream_json_file(
             report_data,
-            filename=f"{repo_name}_architecture_analysis.json"
+            filename=f"{repo_name}_architecture_analysis.json",
+            compression=compression
         )
         content_type = "application/json"
     
     else:
         # Default to markdown
-        file_bytes, filename = await handler.prepare_markdown_file(
-            analysis_results,
-            filename=f"{repo_name}_analysis.md"
+        file_obj, filename = await handler.stream_text_file(
+            [analysis_results],
+            filename=f"{repo_name}_analysis.md",
+            compression=compression
         )
         content_type = "text/markdown"
     
-    return file_bytes, filename, content_type
+    if file_obj is None:
+        return None, None, content_type
+    if compression:
+        content_type = handler.get_content_type(filename)
+    
+    # Compressed while written, so the size limit applied to the compressed file
+    with file_obj:
+        return file_obj.read(), filename, content_type
 
 
 async def generate_summary_csv(
     tasks: list[dict],
-    filename: str = "architecture_tasks.csv"
+    filename: str = "architecture_tasks.csv",
+    compression: Optional[str] = None
 ) -> tuple[bytes, str]:
     """
     Generate CSV file with architecture tasks.
@@ -92,31 +106,39 @@ async def generate_summary_csv(
     Args:
         tasks: List of task dictionaries
         filename: Output CSV filename
+        compression: "gzip" or "zstd", adding .gz / .zst to the filename
+            (default: ATTACHMENT_COMPRESSION)
         
     Returns:
         Tuple of (file_bytes, filename)
     """
     
     handler = AttachmentHandler()
+    compression = compression or default_compression()
     
     # Extract headers
     headers = ["Task", "Priority", "Effort", "Impact", "Status"]
     
-    # Build rows
-    rows = []
-    for task in tasks:
-        rows.append([
+    # Rows are produced lazily while the CSV is written
+    rows = (
+        [
             task.get("name", ""),
             task.get("priority", ""),
             task.get("effort", ""),
             task.get("impact", ""),
             task.get("status", "Pending"),
-        ])
+        ]
+        for task in tasks
+    )
     
-    file_bytes, _ = await handler.prepare_csv_file(
+    file_obj, output_name = await handler.stream_csv_file(
         headers,
         rows,
-        filename
+        filename,
+        compression=compression
     )
+    if file_obj is None:
+        return None, filename
     
-    return file_bytes, filename
+    with file_obj:
+        return file_obj.read(), output_name
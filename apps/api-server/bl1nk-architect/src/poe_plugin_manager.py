@@ -10,9 +10,11 @@ Integrates Skill Loader with Poe Protocol to:
 """
 
 import os
+import asyncio
 import logging
 from typing import Dict, List, Optional, AsyncGenerator
 import fastapi_poe as fp
+from src.skill_executor import get_skill_executor
 from src.skill_loader import (
     get_skill_loader,
     load_skills,
@@ -84,8 +86,9 @@ class PoeSkillBot(fp.PoeBot):
         self.initialized = False
     
     async def initialize_skills(self):
-        """Initialize skills (lazy load)"""
+        """Initialize skills (no-op once the shared startup warm-up ran)"""
         if not self.initialized:
+            await initialize_skill_system()
             await self.router.initialize()
             self.initialized = True
     
@@ -113,11 +116,13 @@ class PoeSkillBot(fp.PoeBot):
             
             # Check if querying for available skills
             if "list skills" in last_message.lower() or "show skills" in last_message.lower():
-                yield from self._handle_list_skills()
+                async for response in self._handle_list_skills():
+                    yield response
                 return
             
             if "search" in last_message.lower():
-                yield from self._handle_search(last_message)
+                async for response in self._handle_search(last_message):
+                    yield response
                 return
             
             # Try to route to appropriate skill
@@ -128,7 +133,8 @@ class PoeSkillBot(fp.PoeBot):
                     text="❌ No matching skill found for your query.\n\n"
                          "Available skills:\n"
                 )
-                yield from self._handle_list_skills()
+                async for response in self._handle_list_skills():
+                    yield response
                 return
             
             # Execute skill
@@ -254,7 +260,8 @@ class DynamicSkillBotFactory:
         # Create individual bot for each skill
         skills = await get_available_skills()
         for skill in skills:
-            self.bots[skill['id']] = DynamicSkillPoeBot(skill['id'])
+            if skill['id'] not in self.bots:
+                self.bots[skill['id']] = DynamicSkillPoeBot(skill['id'])
         
         logger.info(f"Created {len(self.bots)} dynamic skill bots")
     
@@ -346,11 +353,54 @@ def get_skill_bot_factory() -> DynamicSkillBotFactory:
     return _factory
 
 
+# Shared startup state - skills are discovered once per process
+_init_lock = asyncio.Lock()
+_skills_ready = False
+
+
+async def initialize_skill_system() -> int:
+    """
+    Load skills once, build the shared skill bots and warm the executor.
+    
+    Safe to call from every bot and from app startup; only the first call
+    does any work and concurrent callers wait for it to finish.
+    """
+    global _skills_ready
+    
+    async with _init_lock:
+        factory = get_skill_bot_factory()
+        if _skills_ready:
+            return len(factory.get_all_bots())
+        
+        await factory.initialize()
+        
+        # Pre-warm worker processes if any skill runs scripts
+        loader = get_skill_loader()
+        if any(bot.get_entry_point() for bot in loader.bots.values()):
+            await get_skill_executor().start()
+        
+        _skills_ready = True
+        logger.info(f"Skill system ready with {len(factory.get_all_bots())} skills")
+        return len(factory.get_all_bots())
+
+
+def is_skill_system_ready() -> bool:
+    """True once initialize_skill_system has completed"""
+    return _skills_ready
+
+
+async def shutdown_skill_system():
+    """Stop skill worker processes and mark the skill system not ready"""
+    global _skills_ready
+    
+    async with _init_lock:
+        _skills_ready = False
+        await get_skill_executor().shutdown()
+
+
 async def initialize_skill_bots() -> int:
     """Initialize all skill bots"""
-    factory = get_skill_bot_factory()
-    await factory.initialize()
-    return len(factory.get_all_bots())
+    return await initialize_skill_system()
 
 
 def get_skill_router_bot() -> PoeSkillBot:
@@ -0,0 +1,133 @@
+"""
+Skill Result Cache - Memoize deterministic skill executions
+
+Opt-in per skill through the SKILL.md ``cache`` frontmatter field:
+
+    cache: true            # defaults below
+    cache:
+      ttl: 300             # seconds an entry stays valid
+      max_entries: 256     # LRU eviction beyond this many entries
+      max_bytes: 1048576   # total serialized size cap
+
+Entries are keyed by skill version, skill content hash and input hash, so
+editing a skill's SKILL.md or scripts never serves stale results.
+"""
+
+import json
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single skill cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class SkillResultCache:
+    """TTL + LRU cache with an entry count and byte size cap"""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256, max_bytes: int = 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.stats = CacheStats()
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["SkillResultCache"]:
+        """Build a cache from the SKILL.md ``cache`` field (None if disabled)"""
+        if not config:
+            return None
+        if config is True:
+            return cls()
+        if isinstance(config, dict):
+            if not config.get("enabled", True):
+                return None
+            return cls(
+                ttl=float(config.get("ttl", 300)),
+                max_entries=int(config.get("max_entries", 256)),
+                max_bytes=int(config.get("max_bytes", 1024 * 1024)),
+            )
+        logger.warning(f"Ignoring invalid cache config: {config!r}")
+        return None
+
+    @staticmethod
+    def make_key(version: Optional[str], content_hash: str, *inputs: Any) -> str:
+        """Key from skill version, skill content hash and input hash"""
+        input_hash = hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{version or '0'}:{content_hash}:{input_hash}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None; refreshes LRU position on hit"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, size, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, size: Optional[int] = None):
+        """Store a value, evicting least recently used entries as needed"""
+        if size is None:
+            size = len(json.dumps(value, default=str))
+
+        if size > self.max_bytes:
+            logger.debug(f"Result too large to cache ({size} bytes)")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (time.monotonic() + self.ttl, size, value)
+        self.total_bytes += size
+
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def clear(self):
+        """Drop all entries"""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters and occupancy"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+        }
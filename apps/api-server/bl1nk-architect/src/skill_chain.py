@@ -0,0 +1,268 @@
+"""
+Skill Chain Executor - Run skills as a streaming DAG
+
+Chains multiple skills together:
+1. Stages declare which upstream stages feed their input
+2. Independent stages run concurrently
+3. Output streams chunk by chunk into downstream stages (async generators);
+   instruction-only skills pass chunks on as they arrive, while skills
+   backed by a script entry point run in a subprocess and start once their
+   whole input is in
+4. Per-stage timing is recorded for every run, in a dict owned by that run,
+   so concurrent runs of one chain do not share timings
+"""
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional
+
+from src.skill_loader import SkillLoader, get_skill_loader
+
+logger = logging.getLogger(__name__)
+
+# Sentinel marking the end of a stage's output stream
+_END = object()
+
+
+@dataclass
+class ChainStage:
+    """One skill invocation in a chain"""
+    name: str
+    skill_id: str
+    depends_on: List[str] = field(default_factory=list)
+    context: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class StageTiming:
+    """Timing for a single stage of a chain run"""
+    stage: str
+    skill_id: str
+    status: str = "pending"  # "pending", "running", "ok", "error", "cancelled"
+    started_ms: float = 0.0  # offset from chain start
+    first_chunk_ms: Optional[float] = None  # time to first output chunk
+    duration_ms: float = 0.0
+    chunks: int = 0
+    error: Optional[str] = None
+
+
+class _Channel:
+    """Fan-out of one stage's output to every downstream consumer"""
+
+    def __init__(self):
+        self.queues: List[asyncio.Queue] = []
+
+    def subscribe(self) -> asyncio.Queue:
+        # Unbounded on purpose: consumers read their inputs in order, so a
+        # bounded queue on a fan-out edge could stall a sibling branch.
+        queue = asyncio.Queue()
+        self.queues.append(queue)
+        return queue
+
+    async def publish(self, item: Any):
+        for queue in self.queues:
+            await queue.put(item)
+
+
+async def _iterate(queue: asyncio.Queue) -> AsyncGenerator[str, None]:
+    """Turn a channel subscription back into an async generator"""
+    while True:
+        item = await queue.get()
+        if item is _END:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+class SkillChain:
+    """DAG of skill stages executed with streaming between them"""
+
+    def __init__(
+        self,
+        stages: List[ChainStage],
+        loader: Optional[SkillLoader] = None,
+    ):
+        if not stages:
+            raise ValueError("Chain needs at least one stage")
+
+        self.loader = loader or get_skill_loader()
+        self.stages = {stage.name: stage for stage in stages}
+
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names in chain")
+
+        self.order = self._topological_order(stages)
+
+        for stage in stages:
+            if not self.loader.get_bot(stage.skill_id):
+                raise ValueError(f"Skill not found: {stage.skill_id}")
+
+    @classmethod
+    def linear(cls, skill_ids: List[str], loader: Optional[SkillLoader] = None) -> "SkillChain":
+        """Build a simple A -> B -> C chain"""
+        stages = []
+        for index, skill_id in enumerate(skill_ids):
+            depends_on = [stages[-1].name] if stages else []
+            stages.append(ChainStage(f"{index}:{skill_id}", skill_id, depends_on))
+        return cls(stages, loader)
+
+    @staticmethod
+    def _topological_order(stages: List[ChainStage]) -> List[str]:
+        """Validate dependencies and return stages in dependency order"""
+        names = {stage.name for stage in stages}
+        pending = {stage.name: set(stage.depends_on) for stage in stages}
+
+        for name, deps in pending.items():
+            unknown = deps - names
+            if unknown:
+                raise ValueError(f"Stage {name} depends on unknown stages: {sorted(unknown)}")
+
+        order = []
+        while pending:
+            ready = [name for name, deps in pending.items() if not deps & pending.keys()]
+            if not ready:
+                raise ValueError(f"Cycle detected in chain: {sorted(pending)}")
+            for name in ready:
+                order.append(name)
+                del pending[name]
+        return order
+
+    def terminal_stages(self) -> List[str]:
+        """Stages whose output is not consumed by another stage"""
+        consumed = {dep for stage in self.stages.values() for dep in stage.depends_on}
+        return [name for name in self.order if name not in consumed]
+
+    async def stream(
+        self,
+        query: str,
+        timings: Optional[Dict[str, StageTiming]] = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Run the chain, yielding output of the terminal stages as it arrives.
+
+        Pass a dict as ``timings`` to have it filled with this run's
+        per-stage timings (see ``get_timing_report``).
+        """
+        chain_started = time.perf_counter()
+        timings = {} if timings is None else timings
+        timings.update(
+            (name, StageTiming(stage=name, skill_id=self.stages[name].skill_id))
+            for name in self.order
+        )
+
+        channels = {name: _Channel() for name in self.order}
+        inputs = {
+            name: [channels[dep].subscribe() for dep in self.stages[name].depends_on]
+            for name in self.order
+        }
+        outputs = [channels[name].subscribe() for name in self.terminal_stages()]
+
+        tasks = [
+            asyncio.create_task(
+                self._run_stage(name, query, inputs[name], channels[name], timings[name], chain_started)
+            )
+            for name in self.order
+        ]
+
+        try:
+            for queue in outputs:
+                async for chunk in _iterate(queue):
+                    yield chunk
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, query: str) -> Dict[str, Any]:
+        """Run the chain; returns the joined terminal output and this run's timings"""
+        timings: Dict[str, StageTiming] = {}
+        result = "".join([chunk async for chunk in self.stream(query, timings)])
+        return {"result": result, "timings": self.get_timing_report(timings)}
+
+    async def _run_stage(
+        self,
+        name: str,
+        query: str,
+        upstream: List[asyncio.Queue],
+        channel: _Channel,
+        timing: StageTiming,
+        chain_started: float,
+    ):
+        stage = self.stages[name]
+        bot = self.loader.get_bot(stage.skill_id)
+
+        started = time.perf_counter()
+        timing.status = "running"
+        timing.started_ms = (started - chain_started) * 1000
+
+        try:
+            source = self._stage_input(query, upstream)
+            async for chunk in bot.stream(source, stage.context):
+                if timing.first_chunk_ms is None:
+                    timing.first_chunk_ms = (time.perf_counter() - started) * 1000
+                timing.chunks += 1
+                await channel.publish(chunk)
+
+            timing.status = "ok"
+            await channel.publish(_END)
+
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            raise
+
+        except Exception as e:
+            logger.error(f"Chain stage {name} ({stage.skill_id}) failed: {e}")
+            timing.status = "error"
+            timing.error = str(e)
+            await channel.publish(e)
+
+        finally:
+            timing.duration_ms = (time.perf_counter() - started) * 1000
+
+    async def _stage_input(
+        self,
+        query: str,
+        upstream: List[asyncio.Queue],
+    ) -> AsyncIterator[str]:
+        """Root stages read the query; others read upstream output in order"""
+        if not upstream:
+            yield query
+            return
+
+        for queue in upstream:
+            async for chunk in _iterate(queue):
+                yield chunk
+
+    @staticmethod
+    def get_timing_report(timings: Dict[str, StageTiming]) -> Dict[str, Any]:
+        """Per-stage timing report for one run's timings"""
+        return {
+            "stages": [
+                {
+                    "stage": t.stage,
+                    "skill_id": t.skill_id,
+                    "status": t.status,
+                    "started_ms": round(t.started_ms, 2),
+                    "first_chunk_ms": (
+                        round(t.first_chunk_ms, 2) if t.first_chunk_ms is not None else None
+                    ),
+                    "duration_ms": round(t.duration_ms, 2),
+                    "chunks": t.chunks,
+                    "error": t.error,
+                }
+                for t in timings.values()
+            ],
+            "total_ms": round(
+                max((t.started_ms + t.duration_ms for t in timings.values()), default=0.0),
+                2,
+            ),
+        }
+
+
+async def execute_skill_chain(skill_ids: List[str], query: str) -> Dict[str, Any]:
+    """Run a linear chain of skills and return output with timings"""
+    return await SkillChain.linear(skill_ids).run(query)
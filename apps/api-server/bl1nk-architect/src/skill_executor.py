@@ -0,0 +1,355 @@
+"""
+Skill Executor - Run skill scripts in a sandboxed process pool
+
+Skill entry points (e.g. ``execute(query)`` in a skill's ``scripts/`` folder)
+run in pre-warmed worker processes instead of the bot process:
+1. Workers are spawned once and reused across calls
+2. Each call gets its own CPU, memory and wall-clock limits
+3. Arguments and results travel as compact JSON, never pickle
+4. A crashed or timed-out worker is replaced without affecting the bot
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+import importlib.util
+import multiprocessing
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - resource is Unix-only
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionLimits:
+    """Per-call resource limits for a skill script"""
+    cpu_seconds: int = 10
+    memory_mb: int = 512
+    timeout: float = 30.0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ExecutionLimits":
+        """Build limits from a SKILL.md ``limits`` mapping"""
+        limits = cls()
+        for key, value in (data or {}).items():
+            if hasattr(limits, key) and value is not None:
+                setattr(limits, key, type(getattr(limits, key))(value))
+        return limits
+
+
+@dataclass
+class ExecutionResult:
+    """Outcome of a single skill script call"""
+    status: str  # "ok", "error", "timeout", "killed"
+    value: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def _dumps(data: Any) -> bytes:
+    """Compact JSON encoding used on the worker pipe"""
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    return json.loads(payload.decode("utf-8"))
+
+
+def _apply_limits(limits: Dict[str, Any]):
+    """Apply CPU and memory limits to the current worker for one call"""
+    if resource is None:
+        return
+
+    # RLIMIT_CPU counts total process CPU time, so offset by what the
+    # worker has already used. Only soft limits are touched so they can
+    # be raised again for the next call.
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    _set_soft_limit(resource.RLIMIT_CPU, used + int(limits["cpu_seconds"]))
+    _set_soft_limit(resource.RLIMIT_AS, int(limits["memory_mb"]) * 1024 * 1024)
+
+
+def _set_soft_limit(kind: int, value: int):
+    _, hard = resource.getrlimit(kind)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    try:
+        resource.setrlimit(kind, (value, hard))
+    except (ValueError, OSError) as e:
+        logger.debug(f"Could not set rlimit {kind}: {e}")
+
+
+def _load_entry(modules: Dict[str, Any], script_path: str, function: str):
+    """Import a skill script once per worker and return its entry point"""
+    module = modules.get(script_path)
+    if module is None:
+        module_name = f"skill_{abs(hash(script_path))}"
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load script: {script_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[script_path] = module
+
+    entry = getattr(module, function, None)
+    if not callable(entry):
+        raise AttributeError(f"{os.path.basename(script_path)} has no callable '{function}'")
+    return entry
+
+
+def _worker_main(conn):
+    """Worker loop - runs inside the child process"""
+    modules: Dict[str, Any] = {}
+
+    while True:
+        try:
+            request = _loads(conn.recv_bytes())
+        except (EOFError, OSError):
+            return
+
+        if request.get("op") == "ping":
+            conn.send_bytes(_dumps({"status": "ok", "value": "pong"}))
+            continue
+
+        try:
+            _apply_limits(request["limits"])
+            entry = _load_entry(modules, request["script"], request["function"])
+            value = entry(*request.get("args", []), **request.get("kwargs", {}))
+            response = {"status": "ok", "value": value}
+        except MemoryError:
+            response = {"status": "error", "error": "Memory limit exceeded"}
+        except Exception as e:
+            response = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+
+        try:
+            conn.send_bytes(_dumps(response))
+        except (TypeError, ValueError) as e:
+            conn.send_bytes(_dumps({"status": "error", "error": f"Unserializable result: {e}"}))
+
+
+class _Worker:
+    """Handle for a single worker process"""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._in_flight = threading.Lock()
+
+    def roundtrip(self, payload: bytes, timeout: float) -> Optional[bytes]:
+        """Send one request and wait for the reply; None on timeout"""
+        with self._in_flight:
+            self.conn.send_bytes(payload)
+            if not self.conn.poll(timeout):
+                return None
+            return self.conn.recv_bytes()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self):
+        try:
+            self.process.kill()
+            self.process.join(timeout=1)
+        finally:
+            # A roundtrip abandoned by a cancelled caller may still be reading
+            # the pipe; with the process gone it returns at once, so wait for
+            # it before closing the connection underneath it.
+            acquired = self._in_flight.acquire(timeout=5)
+            try:
+                self.conn.close()
+            finally:
+                if acquired:
+                    self._in_flight.release()
+
+
+class SkillExecutor:
+    """Pre-warmed pool of sandboxed workers for skill scripts"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        limits: Optional[ExecutionLimits] = None,
+        max_batch_concurrency: Optional[int] = None,
+    ):
+        self.size = workers or int(os.getenv("SKILL_EXECUTOR_WORKERS", os.cpu_count() or 2))
+        self.limits = limits or ExecutionLimits()
+        # Upper bound on concurrent executions for one batch request
+        self.max_batch_concurrency = max_batch_concurrency or int(
+            os.getenv("SKILL_BATCH_CONCURRENCY", "16")
+        )
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: List[_Worker] = []
+        self._start_lock = asyncio.Lock()
+        self._replacing: set = set()
+
+    @property
+    def started(self) -> bool:
+        return self._idle is not None
+
+    async def start(self) -> int:
+        """Spawn and warm up the worker pool"""
+        async with self._start_lock:
+            if self.started:
+                return len(self._workers)
+
+            idle: asyncio.Queue = asyncio.Queue()
+            spawned = await asyncio.gather(
+                *(asyncio.to_thread(self._spawn) for _ in range(self.size)),
+                return_exceptions=True,
+            )
+            failures = [result for result in spawned if isinstance(result, BaseException)]
+            if failures:
+                for worker in spawned:
+                    if isinstance(worker, _Worker):
+                        worker.kill()
+                raise failures[0]
+
+            for worker in spawned:
+                self._workers.append(worker)
+                idle.put_nowait(worker)
+
+            self._idle = idle
+            logger.info(f"Skill executor started with {len(self._workers)} workers")
+            return len(self._workers)
+
+    def _spawn(self) -> _Worker:
+        """Start a worker and wait until it answers a ping"""
+        worker = _Worker(self._context)
+        try:
+            reply = worker.roundtrip(_dumps({"op": "ping"}), timeout=30)
+        except (EOFError, OSError):
+            reply = None
+
+        if reply is None:
+            worker.kill()
+            raise RuntimeError("Skill worker did not answer its warm-up ping")
+        return worker
+
+    async def run(
+        self,
+        script_path: str,
+        function: str = "execute",
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        limits: Optional[ExecutionLimits] = None,
+    ) -> ExecutionResult:
+        """Run ``function`` from ``script_path`` in a worker process"""
+        if not self.started:
+            await self.start()
+
+        limits = limits or self.limits
+        payload = _dumps({
+            "script": str(script_path),
+            "function": function,
+            "args": args or [],
+            "kwargs": kwargs or {},
+            "limits": {"cpu_seconds": limits.cpu_seconds, "memory_mb": limits.memory_mb},
+        })
+
+        idle = self._idle
+        worker = await idle.get()
+        started = time.perf_counter()
+        healthy = True
+
+        try:
+            reply = await asyncio.to_thread(worker.roundtrip, payload, limits.timeout)
+            duration_ms = (time.perf_counter() - started) * 1000
+
+            if reply is None:
+                healthy = False
+                return ExecutionResult(
+                    status="timeout",
+                    error=f"Exceeded wall-clock limit of {limits.timeout}s",
+                    duration_ms=duration_ms,
+                )
+
+            response = _loads(reply)
+            return ExecutionResult(
+                status=response["status"],
+                value=response.get("value"),
+                error=response.get("error"),
+                duration_ms=duration_ms,
+            )
+
+        except (EOFError, OSError, BrokenPipeError) as e:
+            healthy = False
+            logger.warning(f"Skill worker died running {script_path}: {e}")
+            return ExecutionResult(
+                status="killed",
+                error="Worker terminated (CPU or memory limit exceeded)",
+                duration_ms=(time.perf_counter() - started) * 1000,
+            )
+
+        except asyncio.CancelledError:
+            # The roundtrip thread is still waiting on this worker's pipe and
+            # would race the next caller for the reply, so retire the worker
+            healthy = False
+            raise
+
+        finally:
+            if healthy and worker.is_alive():
+                if idle is self._idle:
+                    idle.put_nowait(worker)
+            else:
+                # Replace in a task of its own so a second cancellation of
+                # this caller cannot lose the pool slot
+                replacement = asyncio.ensure_future(self._replace(worker, idle))
+                self._replacing.add(replacement)
+                replacement.add_done_callback(self._replacing.discard)
+                await asyncio.shield(replacement)
+
+    async def _replace(self, worker: _Worker, idle: asyncio.Queue):
+        """Kill a broken worker and return a fresh one to the pool"""
+        await asyncio.to_thread(worker.kill)
+        if idle is not self._idle:
+            return  # pool was shut down meanwhile
+
+        try:
+            fresh = await asyncio.to_thread(self._spawn)
+        except Exception as e:
+            logger.error(f"Could not replace skill worker: {e}")
+            if worker in self._workers:
+                self._workers.remove(worker)
+            return
+
+        if idle is not self._idle or worker not in self._workers:
+            fresh.kill()
+            return
+        self._workers[self._workers.index(worker)] = fresh
+        idle.put_nowait(fresh)
+
+    async def shutdown(self):
+        """Terminate all workers"""
+        for worker in self._workers:
+            worker.kill()
+        self._workers = []
+        self._idle = None
+        logger.info("Skill executor stopped")
+
+
+# Global executor instance
+_executor: Optional[SkillExecutor] = None
+
+
+def get_skill_executor() -> SkillExecutor:
+    """Get or create global skill executor"""
+    global _executor
+    if _executor is None:
+        _executor = SkillExecutor()
+    return _executor
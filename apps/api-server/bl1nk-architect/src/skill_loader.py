@@ -10,15 +10,21 @@ Enables Bl1nk Architect to:
 """
 
 import os
+import json
 import yaml
+import time
+import hashlib
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 import importlib.util
 import sys
 
+from src.skill_cache import SkillResultCache
+from src.skill_executor import ExecutionLimits, ExecutionResult, get_skill_executor
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +38,17 @@ class SkillMetadata:
     author: Optional[str] = None
     tags: List[str] = None
     dependencies: List[str] = None
+    entry_point: Optional[str] = None  # "script.py:function"
+    limits: Dict[str, Any] = None
+    cache: Any = None  # SKILL.md ``cache`` field, see src/skill_cache.py
     
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
         if self.dependencies is None:
             self.dependencies = []
+        if self.limits is None:
+            self.limits = {}
 
 
 @dataclass
@@ -47,6 +58,7 @@ class SkillContent:
     instructions: str
     scripts: Dict[str, str] = None  # {filename: path}
     resources: Dict[str, str] = None  # {filename: path}
+    content_hash: str = ""  # sha256 of SKILL.md and scripts
     
     def __post_init__(self):
         if self.scripts is None:
@@ -117,7 +129,10 @@ class SkillDiscovery:
                 version=metadata_dict.get('version'),
                 author=metadata_dict.get('author'),
                 tags=metadata_dict.get('tags', []),
-                dependencies=metadata_dict.get('dependencies', [])
+                dependencies=metadata_dict.get('dependencies', []),
+                entry_point=metadata_dict.get('entry_point'),
+                limits=metadata_dict.get('limits', {}),
+                cache=metadata_dict.get('cache')
             )
             
             # Find scripts and resources
@@ -128,13 +143,23 @@ class SkillDiscovery:
                 metadata=metadata,
                 instructions=instructions,
                 scripts=scripts,
-                resources=resources
+                resources=resources,
+                content_hash=SkillDiscovery._hash_content(content, scripts)
             )
         
         except Exception as e:
             logger.error(f"Error parsing skill {skill_dir}: {e}")
             return None
     
+    @staticmethod
+    def _hash_content(skill_md: str, scripts: Dict[str, str]) -> str:
+        """Hash SKILL.md and script sources to detect skill changes"""
+        digest = hashlib.sha256(skill_md.encode('utf-8'))
+        for name in sorted(scripts):
+            digest.update(name.encode('utf-8'))
+            digest.update(Path(scripts[name]).read_bytes())
+        return digest.hexdigest()
+    
     @staticmethod
     def _find_scripts(skill_dir: Path) -> Dict[str, str]:
         """Find executable scripts in skill"""
@@ -248,42 +273,138 @@ class SkillBot:
         self.name = skill.metadata.name
         self.description = skill.metadata.description
         self.instructions = skill.metadata.description
-    
+        self.cache = SkillResultCache.from_config(skill.metadata.cache)
+
+    def get_entry_point(self) -> Optional[Tuple[str, str]]:
+        """Resolve SKILL.md ``entry_point`` to (script_path, function)"""
+        entry_point = self.skill.metadata.entry_point
+        if not entry_point:
+            return None
+
+        script_name, _, function = entry_point.partition(":")
+        script_path = self.skill.scripts.get(script_name)
+        if not script_path:
+            logger.error(f"Entry point script not found: {script_name} in {self.name}")
+            return None
+
+        return script_path, function or "execute"
+
+    async def run_entry_point(self, query: str) -> Optional[ExecutionResult]:
+        """Run the skill's script entry point, if it declares one"""
+        entry = self.get_entry_point()
+        if not entry:
+            return None
+
+        script_path, function = entry
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = SkillResultCache.make_key(
+                self.skill.metadata.version, self.skill.content_hash, function, query
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return replace(cached, cached=True, duration_ms=0.0)
+
+        execution = await get_skill_executor().run(
+            script_path,
+            function,
+            args=[query],
+            limits=ExecutionLimits.from_dict(self.skill.metadata.limits),
+        )
+
+        # Only successful runs are memoized
+        if cache_key is not None and execution.ok:
+            self.cache.set(cache_key, execution, size=len(json.dumps(execution.value, default=str)))
+
+        return execution
+
     async def call_with_instructions(
         self,
         query: str,
         context: Optional[Dict] = None
     ) -> str:
         """Execute skill with query"""
-        
-        # Build execution context
-        exec_context = {
-            "skill_name": self.skill.metadata.name,
-            "query": query,
-            "instructions": self.skill.instructions,
-            "context": context or {},
-        }
-        
-        # Execute skill instructions
-        # In real implementation, this would process the instructions
-        # and execute any referenced scripts
-        
-        result = f"""
+
+        # Run the script entry point in the sandboxed executor
+        execution = await self.run_entry_point(query)
+        if execution:
+            return self._format_execution(execution)
+
+        return self._instructions_header() + query + self._instructions_footer()
+
+    def _instructions_header(self) -> str:
+        return f"""
 # Skill: {self.skill.metadata.name}
 
 **Instructions:**
 {self.skill.instructions[:500]}...
 
-**Query:** {query}
+**Query:** """
+
+    def _instructions_footer(self) -> str:
+        return f"""
 
 **Status:** Ready to execute
 
 **Available Scripts:** {list(self.skill.scripts.keys())}
 **Available Resources:** {list(self.skill.resources.keys())}
 """
-        
-        return result
-    
+
+    async def stream(
+        self,
+        chunks: AsyncIterator[str],
+        context: Optional[Dict] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Execute skill on streamed input, yielding raw output as it is produced.
+
+        Instruction-only skills pass input chunks through as they arrive.
+        Script entry points run in a subprocess with the whole input as one
+        argument, so their input is gathered first and output yielded by line.
+        """
+        if self.get_entry_point() is None:
+            yield self._instructions_header()
+            async for chunk in chunks:
+                yield chunk
+            yield self._instructions_footer()
+            return
+
+        query = "".join([chunk async for chunk in chunks])
+
+        execution = await self.run_entry_point(query)
+        if execution is None:
+            result = await self.call_with_instructions(query, context)
+        elif not execution.ok:
+            raise RuntimeError(f"Skill {self.name} {execution.status}: {execution.error}")
+        elif isinstance(execution.value, str):
+            result = execution.value
+        else:
+            result = json.dumps(execution.value, default=str)
+
+        for line in result.splitlines(keepends=True):
+            yield line
+
+    def _format_execution(self, execution: ExecutionResult) -> str:
+        """Render an executor result as Markdown"""
+        if not execution.ok:
+            return (
+                f"# Skill: {self.name}\n\n"
+                f"**Status:** {execution.status}\n\n"
+                f"**Error:** {execution.error}\n"
+            )
+
+        value = execution.value
+        if not isinstance(value, str):
+            value = f"```json\n{json.dumps(value, indent=2, default=str)}\n```"
+
+        if execution.cached:
+            footer = "_Cached result_"
+        else:
+            footer = f"_Completed in {execution.duration_ms:.0f} ms_"
+
+        return f"# Skill: {self.name}\n\n{value}\n\n{footer}\n"
+
     async def get_skill_actions(self) -> List[str]:
         """Get available actions in skill"""
         actions = []
@@ -306,6 +427,7 @@ class SkillLoader:
         self.skills_root = skills_root
         self.registry = SkillRegistry()
         self.bots: Dict[str, SkillBot] = {}
+        self.loaded = False
     
     def load_all_skills(self) -> int:
         """Discover and load all skills"""
@@ -319,6 +441,7 @@ class SkillLoader:
                 self.bots[skill.metadata.name] = SkillBot(skill, self.registry)
                 loaded += 1
         
+        self.loaded = True
         logger.info(f"Loaded {loaded} skills")
         return loaded
     
@@ -389,10 +512,13 @@ def get_skill_loader() -> SkillLoader:
     return _skill_loader
 
 
-async def load_skills() -> int:
-    """Load all available skills"""
+async def load_skills(force: bool = False) -> int:
+    """Load all available skills (discovery runs once unless forced)"""
     loader = get_skill_loader()
-    return loader.load_all_skills()
+    if loader.loaded and not force:
+        return len(loader.bots)
+    # Discovery walks the filesystem, keep it off the event loop
+    return await asyncio.to_thread(loader.load_all_skills)
 
 
 async def get_available_skills() -> List[Dict]:
@@ -421,3 +547,67 @@ async def execute_skill(skill_id: str, query: str, context: Optional[Dict] = Non
     except Exception as e:
         logger.error(f"Error executing skill {skill_id}: {e}")
         return f"Error executing skill: {str(e)}"
+
+
+def batch_concurrency(value: Any, default: int = 8) -> int:
+    """Check a batch request's ``concurrency`` and cap it at the executor's batch limit"""
+    value = default if value is None else value
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError("'concurrency' must be an integer of at least 1")
+    return min(value, get_skill_executor().max_batch_concurrency)
+
+
+async def execute_skill_batch(
+    skill_id: str,
+    queries: List[str],
+    concurrency: int = 8,
+    context: Optional[Dict] = None
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Execute a skill for many queries, yielding results as each finishes.
+
+    Closing the generator cancels the queries still running; script skills
+    rely on SkillExecutor.run() retiring the worker of a cancelled call.
+    """
+    concurrency = min(concurrency, get_skill_executor().max_batch_concurrency)
+    loader = get_skill_loader()
+    bot = loader.get_bot(skill_id)
+    
+    if not bot:
+        raise ValueError(f"Skill '{skill_id}' not found")
+    
+    pending: asyncio.Queue = asyncio.Queue()
+    for index, query in enumerate(queries):
+        pending.put_nowait((index, query))
+    finished: asyncio.Queue = asyncio.Queue()
+    
+    async def worker():
+        while True:
+            try:
+                index, query = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            started = time.perf_counter()
+            try:
+                result = await bot.call_with_instructions(query, context)
+                item = {"index": index, "status": "ok", "result": result}
+            except Exception as e:
+                logger.error(f"Error executing skill {skill_id} [{index}]: {e}")
+                item = {"index": index, "status": "error", "error": str(e)}
+            
+            item["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            await finished.put(item)
+    
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(max(1, min(concurrency, len(queries))))
+    ]
+    
+    try:
+        for _ in range(len(queries)):
+            yield await finished.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -3,12 +3,117 @@ Beautiful UI Components and Widgets
 
 Modern, responsive components for displaying analysis results.
 Includes glassmorphism and gradient effects.
+
+HTML rendering is kept cheap for large reports:
+1. Shared styles live in one ``STYLESHEET``; widgets only carry class names
+   (and the one per-widget value, a progress bar's width, inline)
+2. A panel emits the stylesheet once; a widget rendered on its own
+   includes it unless ``include_styles=False``
+3. Output is assembled with ``str.join``, never repeated ``+=``
+4. Renders are memoized on the widget's fields, so identical widgets are
+   formatted only once
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 from enum import Enum
 
+# Memoized renders kept per widget type
+RENDER_CACHE_SIZE = 1024
+
+STATUS_COLORS = {
+    "success": "#2E7D32",
+    "warning": "#F57C00",
+    "error": "#C62828",
+    "info": "#1565C0",
+}
+
+STYLESHEET = (
+    "<style>"
+    ".bl1nk-panel{max-width:1200px;margin:0 auto;padding:20px;"
+    "background:linear-gradient(135deg,rgba(30,30,45,0.8),rgba(50,50,70,0.8));"
+    "border-radius:16px;color:white}"
+    ".bl1nk-panel h1{margin-bottom:30px;font-size:28px}"
+    ".bl1nk-panel h2{margin-bottom:15px}"
+    ".bl1nk-section{margin-top:30px}"
+    ".bl1nk-cards{display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:20px}"
+    ".bl1nk-card{background:rgba(255,255,255,0.1);backdrop-filter:blur(10px);"
+    "border:1px solid rgba(255,255,255,0.2);border-radius:12px;padding:20px;margin:10px;"
+    "color:white;box-shadow:0 8px 32px 0 rgba(31,38,135,0.37)}"
+    ".bl1nk-card-icon{font-size:28px;margin-bottom:10px}"
+    ".bl1nk-card-title{font-size:14px;opacity:0.7}"
+    ".bl1nk-card-value{font-size:32px;font-weight:bold;margin:10px 0}"
+    ".bl1nk-card-description{font-size:12px;opacity:0.6}"
+    + "".join(
+        f".bl1nk-{status} .bl1nk-card-value{{color:{color}}}"
+        for status, color in STATUS_COLORS.items()
+    )
+    + ".bl1nk-metrics{width:100%;border-collapse:collapse;color:white}"
+    ".bl1nk-metrics tr{border-bottom:1px solid rgba(255,255,255,0.1)}"
+    ".bl1nk-metrics td{padding:12px}"
+    ".bl1nk-metrics td.bl1nk-metric-value{font-weight:bold}"
+    ".bl1nk-progress{margin:15px 0}"
+    ".bl1nk-progress-label{display:flex;justify-content:space-between;margin-bottom:8px}"
+    ".bl1nk-progress-track{background:rgba(255,255,255,0.1);border-radius:8px;height:8px;overflow:hidden}"
+    ".bl1nk-progress-fill{background:linear-gradient(90deg,#2E7D32,#66BB6A);height:100%;"
+    "transition:width 0.3s ease}"
+    "</style>"
+)
+
+
+def _with_styles(html: str, include_styles: bool) -> str:
+    return STYLESHEET + html if include_styles else html
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _card_html(title: str, icon: str, value: str, description: str, status: str) -> str:
+    status = status if status in STATUS_COLORS else "success"
+    return (
+        f'<div class="bl1nk-card bl1nk-{status}">'
+        f'<div class="bl1nk-card-icon">{icon}</div>'
+        f'<div class="bl1nk-card-title">{title}</div>'
+        f'<div class="bl1nk-card-value">{value}</div>'
+        f'<div class="bl1nk-card-description">{description}</div>'
+        "</div>"
+    )
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _card_markdown(title: str, icon: str, value: str, description: str) -> str:
+    return f"""
+| {icon} | {title} |
+|---|---|
+| **{value}** | {description} |
+"""
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _metrics_html(metrics: Tuple[Tuple[str, str, str], ...]) -> str:
+    rows = "".join(
+        f'<tr><td>{icon}</td><td>{label}</td><td class="bl1nk-metric-value">{value}</td></tr>'
+        for icon, label, value in metrics
+    )
+    return f'<table class="bl1nk-metrics">{rows}</table>'
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _progress_html(label: str, value: float, max_value: float, icon: str, percentage: float) -> str:
+    return (
+        '<div class="bl1nk-progress">'
+        f'<div class="bl1nk-progress-label"><span>{icon} {label}</span>'
+        f"<span>{value:.0f}/{max_value:.0f}</span></div>"
+        '<div class="bl1nk-progress-track">'
+        f'<div class="bl1nk-progress-fill" style="width:{percentage}%"></div>'
+        "</div></div>"
+    )
+
+
+def clear_render_cache():
+    """Drop all memoized widget renders"""
+    for render in (_card_html, _card_markdown, _metrics_html, _progress_html):
+        render.cache_clear()
+
 
 class WidgetStyle(Enum):
     """Widget styling themes"""
@@ -28,46 +133,17 @@ class AnalysisCard:
     status: str = "success"
     style: WidgetStyle = WidgetStyle.GLASSMORPHISM
     
-    def to_html(self) -> str:
+    def _key(self) -> Tuple[str, str, str, str]:
+        return (str(self.title), str(self.icon), str(self.value), str(self.description))
+    
+    def to_html(self, include_styles: bool = True) -> str:
         """Generate HTML representation"""
-        color_map = {
-            "success": "#2E7D32",
-            "warning": "#F57C00",
-            "error": "#C62828",
-            "info": "#1565C0",
-        }
-        color = color_map.get(self.status, "#2E7D32")
-        
-        return f"""
-        <div style="
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 12px;
-            padding: 20px;
-            margin: 10px;
-            color: white;
-            box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-        ">
-            <div style="font-size: 28px; margin-bottom: 10px;">{self.icon}</div>
-            <div style="font-size: 14px; opacity: 0.7;">{self.title}</div>
-            <div style="
-                font-size: 32px;
-                font-weight: bold;
-                margin: 10px 0;
-                color: {color};
-            ">{self.value}</div>
-            <div style="font-size: 12px; opacity: 0.6;">{self.description}</div>
-        </div>
-        """
+        html = _card_html(*self._key(), str(self.status))
+        return _with_styles(html, include_styles)
     
     def to_markdown(self) -> str:
         """Generate Markdown representation"""
-        return f"""
-| {self.icon} | {self.title} |
-|---|---|
-| **{self.value}** | {self.description} |
-"""
+        return _card_markdown(*self._key())
 
 
 @dataclass
@@ -75,27 +151,15 @@ class MetricsRow:
     """Row widget for displaying metrics"""
     metrics: List[Dict[str, str]]
     
-    def to_html(self) -> str:
+    def _key(self) -> Tuple[Tuple[str, str, str], ...]:
+        return tuple(
+            (str(metric.get('icon', '')), str(metric.get('label', '')), str(metric.get('value', '')))
+            for metric in self.metrics
+        )
+    
+    def to_html(self, include_styles: bool = True) -> str:
         """Generate HTML table"""
-        rows = ""
-        for metric in self.metrics:
-            rows += f"""
-            <tr style="border-bottom: 1px solid rgba(255,255,255,0.1);">
-                <td style="padding: 12px;">{metric.get('icon', '')}</td>
-                <td style="padding: 12px;">{metric.get('label', '')}</td>
-                <td style="padding: 12px; font-weight: bold;">{metric.get('value', '')}</td>
-            </tr>
-            """
-        
-        return f"""
-        <table style="
-            width: 100%;
-            border-collapse: collapse;
-            color: white;
-        ">
-            {rows}
-        </table>
-        """
+        return _with_styles(_metrics_html(self._key()), include_styles)
     
     def to_markdown(self) -> str:
         """Generate Markdown table"""
@@ -120,30 +184,13 @@ class ProgressBar:
         """Calculate percentage"""
         return (self.value / self.max_value) * 100 if self.max_value > 0 else 0
     
-    def to_html(self) -> str:
+    def to_html(self, include_styles: bool = True) -> str:
         """Generate HTML progress bar"""
-        percentage = self.get_percentage()
-        return f"""
-        <div style="margin: 15px 0;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 8px;">
-                <span>{self.icon} {self.label}</span>
-                <span>{self.value:.0f}/{self.max_value:.0f}</span>
-            </div>
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 8px;
-                height: 8px;
-                overflow: hidden;
-            ">
-                <div style="
-                    background: linear-gradient(90deg, #2E7D32, #66BB6A);
-                    height: 100%;
-                    width: {percentage}%;
-                    transition: width 0.3s ease;
-                "></div>
-            </div>
-        </div>
-        """
+        html = _progress_html(
+            str(self.label), float(self.value), float(self.max_value), str(self.icon),
+            self.get_percentage(),
+        )
+        return _with_styles(html, include_styles)
     
     def to_markdown(self) -> str:
         """Generate Markdown progress"""
@@ -169,52 +216,25 @@ class AnalysisPanel:
         self.metrics = metrics
         self.progress_bars = progress_bars or []
     
-    def to_html(self) -> str:
+    def to_html(self, include_styles: bool = True) -> str:
         """Generate full HTML panel"""
-        content = f"""
-        <div style="
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: linear-gradient(135deg, rgba(30, 30, 45, 0.8), rgba(50, 50, 70, 0.8));
-            border-radius: 16px;
-            color: white;
-        ">
-            <h1 style="margin-bottom: 30px; font-size: 28px;">🏗️ {self.title}</h1>
-            
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px;">
-        """
-        
-        for card in self.cards:
-            content += card.to_html()
-        
-        content += """
-            </div>
-        """
+        parts = [STYLESHEET] if include_styles else []
+        parts.append(f'<div class="bl1nk-panel"><h1>🏗️ {self.title}</h1><div class="bl1nk-cards">')
+        parts.extend(card.to_html(include_styles=False) for card in self.cards)
+        parts.append("</div>")
         
         if self.metrics:
-            content += f"""
-            <div style="margin-top: 30px;">
-                <h2 style="margin-bottom: 15px;">📊 Metrics</h2>
-                {self.metrics.to_html()}
-            </div>
-            """
+            parts.append('<div class="bl1nk-section"><h2>📊 Metrics</h2>')
+            parts.append(self.metrics.to_html(include_styles=False))
+            parts.append("</div>")
         
         if self.progress_bars:
-            content += """
-            <div style="margin-top: 30px;">
-                <h2 style="margin-bottom: 15px;">📈 Progress</h2>
-            """
-            for pb in self.progress_bars:
-                content += pb.to_html()
-            content += """
-            </div>
-            """
+            parts.append('<div class="bl1nk-section"><h2>📈 Progress</h2>')
+            parts.extend(pb.to_html(include_styles=False) for pb in self.progress_bars)
+            parts.append("</div>")
         
-        content += """
-        </div>
-        """
-        return content
+        parts.append("</div>")
+        return "".join(parts)
     
     def to_markdown(self) -> str:
         """Generate full Markdown panel"""
@@ -249,8 +269,9 @@ def create_analysis_report(
     duplicates: List,
     python_deps: List,
     typescript_deps: List,
+    output_format: str = "markdown",
 ) -> str:
-    """Create a full analysis report with widgets"""
+    """Create a full analysis report with widgets (markdown or html)"""
     
     # Create cards
     cards = [
@@ -320,4 +341,6 @@ def create_analysis_report(
         progress_bars=progress_bars,
     )
     
+    if output_format == "html":
+        return panel.to_html()
     return panel.to_markdown()
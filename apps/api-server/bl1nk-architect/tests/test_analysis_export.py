@@ -0,0 +1,75 @@
+"""Analysis export tests"""
+from datetime import datetime, timezone
+
+import pytest
+
+from src import analysis_export
+from src.analysis_export import AnalysisExporter
+
+CREATED_AT = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+ANALYSIS = {
+    "repository": "acme/web app",
+    "files": ["src/app.py", "src/api/routes.py", "README"],
+    "files_count": 3,
+    "python_deps": ["fastapi", "httpx"],
+    "typescript_deps": ["react"],
+    "duplicates": [{"pattern": "def handler", "count": 4}],
+}
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    return AnalysisExporter(str(tmp_path), "csv")
+
+
+def test_csv_export_round_trip(exporter):
+    written = exporter.export(ANALYSIS, run_id="run-1", created_at=CREATED_AT)
+    assert set(written) == {"runs", "files", "deps", "duplicates"}
+    assert "repository=acme%2Fweb%20app" in written["runs"]
+
+    [run] = exporter.read("runs")
+    assert run == {
+        "run_id": "run-1",
+        "created_at": CREATED_AT,
+        "task_id": "",
+        "files_count": 3,
+        "python_deps_count": 2,
+        "typescript_deps_count": 1,
+        "duplicates_count": 1,
+        "repository": "acme/web app",
+        "date": "2026-03-01",
+    }
+
+    files = exporter.read("files", columns=["path", "extension", "depth"])
+    assert files == [
+        {"path": "src/app.py", "extension": ".py", "depth": 1},
+        {"path": "src/api/routes.py", "extension": ".py", "depth": 2},
+        {"path": "README", "extension": "", "depth": 0},
+    ]
+    assert exporter.read("duplicates")[0]["count"] == 4
+
+
+def test_read_filters_by_repository(exporter):
+    exporter.export(ANALYSIS, run_id="run-1", created_at=CREATED_AT)
+    exporter.export({"repository": "acme/cli", "files": []}, run_id="run-2", created_at=CREATED_AT)
+
+    assert [row["run_id"] for row in exporter.read("runs", repository="acme/cli")] == ["run-2"]
+    assert len(exporter.read("runs")) == 2
+    # Empty tables are skipped, the runs row is always written
+    assert {row["run_id"] for row in exporter.read("files")} == {"run-1"}
+
+
+def test_unknown_table_rejected(exporter):
+    with pytest.raises(ValueError):
+        exporter.read("commits")
+
+
+def test_misconfigured_export_is_disabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(analysis_export, "ANALYSIS_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(analysis_export, "ANALYSIS_EXPORT_FORMAT", "feather")
+    monkeypatch.setattr(analysis_export, "_exporter", None)
+    monkeypatch.setattr(analysis_export, "_exporter_configured", False)
+
+    assert analysis_export.get_analysis_exporter() is None
+    assert analysis_export.get_analysis_exporter() is None
@@ -0,0 +1,123 @@
+"""Attachment handler tests"""
+import asyncio
+import csv
+import gzip
+import io
+import os
+
+import pytest
+
+from src.attachment_handler import AttachmentBuilder, AttachmentHandler, AttachmentTooLarge
+
+
+def test_prepare_text_file_enforces_encoded_size():
+    handler = AttachmentHandler(max_file_size=100)
+    assert asyncio.run(handler.prepare_text_file("héllo")) == ("héllo".encode("utf-8"), "output.txt")
+    # 60 characters but 120 bytes once encoded
+    assert asyncio.run(handler.prepare_text_file("é" * 60)) == (None, None)
+
+
+def test_stream_csv_file_from_generator():
+    handler = AttachmentHandler()
+    rows = ([index, f"row {index}"] for index in range(1000))
+    file_obj, filename = asyncio.run(handler.stream_csv_file(["id", "name"], rows))
+    with file_obj:
+        parsed = list(csv.reader(io.TextIOWrapper(file_obj, encoding="utf-8", newline="")))
+    assert filename == "data.csv"
+    assert parsed[0] == ["id", "name"] and parsed[-1] == ["999", "row 999"]
+    assert len(parsed) == 1001
+
+
+def _csv_rows(count):
+    return ([index, "architecture", "pending", "medium"] for index in range(count))
+
+
+def test_size_limit_applies_to_compressed_output():
+    handler = AttachmentHandler(max_file_size=1024 * 1024)
+    # About 3 MB of CSV, far below 1 MB once gzipped
+    file_obj, filename = asyncio.run(handler.stream_csv_file(
+        ["id", "area", "status", "effort"], _csv_rows(100_000), "tasks.csv", compression="gzip"
+    ))
+    assert filename == "tasks.csv.gz"
+    with file_obj:
+        data = gzip.decompress(file_obj.read())
+    assert len(data) > 2 * 1024 * 1024
+    assert data.splitlines()[-1] == b"99999,architecture,pending,medium"
+
+
+def test_incompressible_content_still_hits_the_limit():
+    handler = AttachmentHandler(max_file_size=64 * 1024)
+    assert asyncio.run(handler.stream_text_file([os.urandom(256 * 1024)], "blob.bin", "gzip")) == (None, None)
+
+
+def test_compressed_builder_round_trip():
+    handler = AttachmentHandler()
+    with handler.open_builder("empty.txt", "gzip") as builder:
+        file_obj = builder.finish()
+    assert builder.filename == "empty.txt.gz"
+    assert gzip.decompress(file_obj.read()) == b""
+
+    original = os.urandom(3 * 1024 * 1024 + 17)
+    file_obj, filename = asyncio.run(handler.compress_file(io.BytesIO(original), "blob.bin"))
+    assert filename == "blob.bin.gz"
+    assert gzip.decompress(file_obj.read()) == original
+
+
+def test_unknown_compression_rejected():
+    handler = AttachmentHandler()
+    with pytest.raises(ValueError):
+        handler.open_builder("report.md", "brotli")
+
+
+def test_parallel_gzip_members_decode_as_one_file():
+    original = b"".join(os.urandom(1024) * 64 for _ in range(200))  # 12.5 MB, compressible
+    with AttachmentBuilder("big.bin", 8 * 1024 * 1024, compression="gzip", workers=4) as builder:
+        for start in range(0, len(original), 300_000):
+            builder.write(original[start:start + 300_000])
+        file_obj = builder.finish()
+    with file_obj:
+        assert gzip.decompress(file_obj.read()) == original
+
+    with pytest.raises(AttachmentTooLarge):
+        with AttachmentBuilder("random.bin", 1024 * 1024, compression="gzip", workers=4) as builder:
+            builder.write(os.urandom(4 * 1024 * 1024))
+            builder.finish()
+
+
+@pytest.fixture
+def small_reports(monkeypatch):
+    from functools import partial
+
+    from src import orchestrator_with_attachments
+
+    # 1 MB limit so a 3 MB report only fits once compressed
+    limited = partial(AttachmentHandler, max_file_size=1024 * 1024)
+    monkeypatch.setattr(orchestrator_with_attachments, "AttachmentHandler", limited)
+    return orchestrator_with_attachments
+
+
+def test_orchestrator_reports_use_configured_compression(monkeypatch, small_reports):
+    from src import attachment_handler
+
+    analysis = "## Layer\n- service depends on repository\n" * 80_000
+    report = asyncio.run(small_reports.create_architecture_report("repo", analysis))
+    assert report == (None, None, "text/markdown")
+
+    monkeypatch.setattr(attachment_handler, "ATTACHMENT_COMPRESSION", "gzip")
+    data, filename, content_type = asyncio.run(small_reports.create_architecture_report("repo", analysis))
+    assert (filename, content_type) == ("repo_architecture_analysis.md.gz", "application/gzip")
+    assert analysis in gzip.decompress(data).decode("utf-8")
+
+    tasks = [{"name": f"Task {index}", "priority": "High"} for index in range(3)]
+    data, filename = asyncio.run(small_reports.generate_summary_csv(tasks))
+    assert filename == "architecture_tasks.csv.gz"
+    assert gzip.decompress(data).splitlines()[-1] == b"Task 2,High,,,Pending"
+
+
+def test_unusable_configured_compression_is_ignored(monkeypatch, small_reports):
+    from src import attachment_handler
+
+    monkeypatch.setattr(attachment_handler, "ATTACHMENT_COMPRESSION", "brotli")
+    data, filename = asyncio.run(small_reports.generate_summary_csv([{"name": "Fix"}]))
+    assert filename == "architecture_tasks.csv"
+    assert data.splitlines()[-1] == b"Fix,,,,Pending"
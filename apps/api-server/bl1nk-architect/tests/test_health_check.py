@@ -0,0 +1,125 @@
+"""Health check cache tests"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.health_check import CheckSpec, HealthChecker, HealthCheckResult, LintCache
+
+
+class CountingChecker(HealthChecker):
+    """Checker whose single check reports how often it has run"""
+
+    def __init__(self, ttl: float):
+        super().__init__([CheckSpec("Counter", "check_counter", timeout=5, ttl=ttl)])
+        self.runs = 0
+
+    async def check_counter(self):
+        self.runs += 1
+        await asyncio.sleep(0)
+        self.add_result(HealthCheckResult("Counter", "ok", f"run {self.runs}"))
+
+
+@pytest.fixture
+def checker():
+    checker = CountingChecker(ttl=60)
+    yield checker
+    checker.lint_cache.shutdown()
+    checker.history.close()
+
+
+def test_results_cached_within_ttl(checker):
+    async def read_twice():
+        await checker.get_results()
+        return await checker.get_results()
+
+    results = asyncio.run(read_twice())
+    assert checker.runs == 1
+    assert results["Counter"].message == "run 1"
+
+
+def test_concurrent_reads_share_one_run(checker):
+    async def read_many():
+        await asyncio.gather(*(checker.run_check("Counter") for _ in range(10)))
+
+    asyncio.run(read_many())
+    assert checker.runs == 1
+
+
+def test_stale_result_served_then_refreshed_in_background(checker):
+    async def scenario():
+        await checker.get_results()
+        checker.specs["Counter"].ttl = 0
+        stale = (await checker.get_results())["Counter"].message
+        await asyncio.sleep(0.01)
+        return stale, checker.results["Counter"].message
+
+    stale, refreshed = asyncio.run(scenario())
+    assert (stale, refreshed) == ("run 1", "run 2")
+
+
+def test_fresh_runs_work_across_event_loops(checker):
+    checker.specs["Counter"].ttl = 0
+    for expected in ("run 1", "run 2", "run 3"):
+        results = asyncio.run(checker.run_all_checks())
+        assert results["Counter"].message == expected
+
+
+def test_run_left_by_closed_loop_is_replaced(checker):
+    async def start_and_leave():
+        await checker.get_results()
+        checker.specs["Counter"].ttl = 0
+        await checker.get_results()  # starts a refresh the loop never finishes
+
+    asyncio.run(start_and_leave())
+    result = asyncio.run(checker.run_check("Counter"))
+    assert result.message == f"run {checker.runs}"
+
+
+def test_lint_cache_overlapping_runs(tmp_path):
+    for index in range(20):
+        (tmp_path / f"module_{index}.py").write_text("x = 1\n" + "\t" * (index % 2))
+    cache = LintCache(str(tmp_path), max_workers=1)
+
+    with ThreadPoolExecutor(max_workers=4) as threads:
+        runs = list(threads.map(lambda _: cache.lint(), range(4)))
+
+    files, issues, _ = runs[0]
+    assert len(files) == 20 and len(issues) == 10
+    assert all(run[:2] == (files, issues) for run in runs)
+    assert sum(run[2] for run in runs) == 20  # each file linted exactly once
+
+
+def test_history_persists_in_batches(tmp_path):
+    from src.health_history import HealthHistory
+
+    path = str(tmp_path / "history.db")
+    history = HealthHistory(capacity=4, path=path)
+    for index in range(6):
+        history.record("Counter", "ok" if index % 3 else "error", float(index), timestamp=1000.0 + index)
+    assert history.stats("Counter")["samples"] == 4
+    assert history.flush() == 6
+    assert history.flush() == 0
+    history.close()
+
+    reloaded = HealthHistory(capacity=4, path=path)
+    samples = reloaded.samples("Counter")
+    reloaded.close()
+    assert [sample["latency_ms"] for sample in samples] == [2.0, 3.0, 4.0, 5.0]
+    assert [sample["status"] for sample in samples] == ["ok", "error", "ok", "ok"]
+
+
+@pytest.mark.parametrize("url, status", [
+    ("https://hooks.slack.com/services/T000/B000/XXXX", "ok"),
+    ("https://example.com/hook", "error"),
+])
+def test_slack_webhook_is_never_posted_to(monkeypatch, url, status):
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", url)
+    monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+    monkeypatch.delenv("CLICKUP_API_KEY", raising=False)
+    checker = HealthChecker()
+    monkeypatch.setattr(checker, "http_client", lambda: pytest.fail("no HTTP request expected"))
+
+    asyncio.run(checker.check_webhooks())
+    checker.history.close()
+    assert checker.results["Webhook Check"].details["slack"]["status"] == status
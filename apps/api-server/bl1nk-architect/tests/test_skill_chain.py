@@ -0,0 +1,28 @@
+"""Skill chain tests"""
+import pytest
+
+from src.skill_chain import ChainStage, SkillChain
+
+
+class StubLoader:
+    def get_bot(self, skill_id):
+        return object() if skill_id != "missing" else None
+
+
+@pytest.mark.parametrize("build", [
+    lambda loader: SkillChain([], loader),
+    lambda loader: SkillChain.linear([], loader),
+])
+def test_empty_chain_rejected(build):
+    with pytest.raises(ValueError, match="at least one stage"):
+        build(StubLoader())
+
+
+def test_linear_chain_order():
+    chain = SkillChain.linear(["a", "b", "c"], StubLoader())
+    assert chain.order == ["0:a", "1:b", "2:c"]
+
+
+def test_unknown_skill_rejected():
+    with pytest.raises(ValueError, match="Skill not found"):
+        SkillChain([ChainStage("only", "missing")], StubLoader())
@@ -0,0 +1,98 @@
+"""Skill executor tests"""
+import asyncio
+
+import pytest
+
+from src.skill_executor import ExecutionLimits, SkillExecutor, _Worker
+
+SCRIPT = """
+import time
+
+def execute(query, delay=0):
+    time.sleep(delay)
+    return f"answer to {query}"
+"""
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / "skill.py"
+    path.write_text(SCRIPT)
+    return str(path)
+
+
+def test_cancelled_call_does_not_leak_its_reply(script):
+    async def scenario():
+        executor = SkillExecutor(workers=1)
+        await executor.start()
+        first = executor._workers[0]
+        slow = asyncio.ensure_future(executor.run(script, args=["slow"], kwargs={"delay": 1}))
+        await asyncio.sleep(0.2)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+
+        result = await executor.run(script, args=["fast"])
+        workers = list(executor._workers)
+        await executor.shutdown()
+        return first, workers, result
+
+    first, workers, result = asyncio.run(scenario())
+    assert result.ok and result.value == "answer to fast"
+    assert len(workers) == 1 and workers[0] is not first
+
+
+def test_second_cancellation_keeps_the_pool_slot(script):
+    async def scenario():
+        executor = SkillExecutor(workers=1)
+        await executor.start()
+        call = asyncio.ensure_future(executor.run(script, args=["slow"], kwargs={"delay": 1}))
+        await asyncio.sleep(0.2)
+        call.cancel()
+        await asyncio.sleep(0)  # now awaiting the replacement
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        result = await asyncio.wait_for(executor.run(script, args=["again"]), timeout=30)
+        size = len(executor._workers)
+        await executor.shutdown()
+        return result, size
+
+    result, size = asyncio.run(scenario())
+    assert result.value == "answer to again"
+    assert size == 1
+
+
+def test_shutdown_during_call(script):
+    async def scenario():
+        executor = SkillExecutor(workers=1, limits=ExecutionLimits(timeout=5))
+        await executor.start()
+        call = asyncio.ensure_future(executor.run(script, args=["slow"], kwargs={"delay": 1}))
+        await asyncio.sleep(0.2)
+        await executor.shutdown()
+        result = await call
+        return executor, result
+
+    executor, result = asyncio.run(scenario())
+    assert result.status == "killed"
+    assert executor._workers == [] and not executor.started
+
+
+def test_unresponsive_worker_fails_start(monkeypatch):
+    monkeypatch.setattr(_Worker, "roundtrip", lambda self, payload, timeout: None)
+    executor = SkillExecutor(workers=2)
+    with pytest.raises(RuntimeError, match="warm-up ping"):
+        asyncio.run(executor.start())
+    assert not executor.started and executor._workers == []
+
+
+def test_batch_concurrency_capped_by_executor(monkeypatch):
+    from src import skill_executor
+    from src.skill_loader import batch_concurrency
+
+    monkeypatch.setattr(skill_executor, "_executor", SkillExecutor(workers=1, max_batch_concurrency=3))
+    assert batch_concurrency(None) == 3
+    assert batch_concurrency(2) == 2
+    with pytest.raises(ValueError):
+        batch_concurrency(0)
@@ -0,0 +1,91 @@
+"""Widget rendering tests"""
+import pytest
+
+from src.widgets.components import (
+    STYLESHEET,
+    AnalysisCard,
+    AnalysisPanel,
+    MetricsRow,
+    ProgressBar,
+    clear_render_cache,
+    create_analysis_report,
+)
+
+# Output of AnalysisPanel.to_markdown() before HTML rendering was reworked
+BASELINE_MARKDOWN = (
+    "# 🏗️ Demo\n\n## 📁 Files\n\n\n| 📁 | Files |\n|---|---|\n| **3** | Scanned |\n\n\n"
+    "## 📊 Metrics\n\n| Icon | Metric | Value |\n|------|--------|-------|\n| 🐍 | Deps | 2 |\n\n"
+    "## 📈 Progress\n\n✅ Quality: `█████████████████░░░` 85%\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_render_cache()
+    yield
+    clear_render_cache()
+
+
+@pytest.fixture
+def panel():
+    return AnalysisPanel(
+        "Demo",
+        [AnalysisCard("Files", "📁", "3", "Scanned"), AnalysisCard("Deps", "📚", "2", "Total", "info")],
+        MetricsRow([{"icon": "🐍", "label": "Deps", "value": "2"}]),
+        [ProgressBar("Quality", 85, icon="✅"), ProgressBar("Coverage", 3, max_value=4)],
+    )
+
+
+def test_panel_emits_stylesheet_once(panel):
+    html = panel.to_html()
+    assert html.startswith(STYLESHEET)
+    assert html.count("<style>") == 1
+
+    assert "<style>" not in panel.to_html(include_styles=False)
+    assert panel.to_html(include_styles=False) == html[len(STYLESHEET):]
+
+
+def test_standalone_widgets_include_styles():
+    card = AnalysisCard("Files", "📁", "3", "Scanned", "warning")
+    assert card.to_html().count("<style>") == 1
+    assert card.to_html(include_styles=False) == (
+        '<div class="bl1nk-card bl1nk-warning"><div class="bl1nk-card-icon">📁</div>'
+        '<div class="bl1nk-card-title">Files</div><div class="bl1nk-card-value">3</div>'
+        '<div class="bl1nk-card-description">Scanned</div></div>'
+    )
+
+
+def test_progress_width_stays_inline(panel):
+    html = panel.to_html(include_styles=False)
+    assert 'style="width:85.0%"' in html
+    assert 'style="width:75.0%"' in html
+    assert "<span>3/4</span>" in html
+
+
+def test_markdown_matches_baseline():
+    panel = AnalysisPanel(
+        "Demo",
+        [AnalysisCard("Files", "📁", "3", "Scanned")],
+        MetricsRow([{"icon": "🐍", "label": "Deps", "value": "2"}]),
+        [ProgressBar("Quality", 85, icon="✅")],
+    )
+    assert panel.to_markdown() == BASELINE_MARKDOWN
+
+
+def test_unhashable_fields_still_render():
+    card = AnalysisCard("Files", "📁", [1, 2], "Scanned")
+    assert '<div class="bl1nk-card-value">[1, 2]</div>' in card.to_html()
+    assert "| **[1, 2]** | Scanned |" in card.to_markdown()
+    assert "<span>📊 ['a']</span>" in ProgressBar(["a"], 1).to_html()
+
+
+def test_report_formats():
+    args = ("Report", "org/repo", 12, ["dup"], ["fastapi"], ["react", "vite"])
+    html = create_analysis_report(*args, output_format="html")
+    assert html.count("<style>") == 1
+    assert '<div class="bl1nk-card-value">repo</div>' in html
+    assert html.count('class="bl1nk-progress-fill"') == 3
+
+    markdown = create_analysis_report(*args)
+    assert "<style>" not in markdown
+    assert markdown.startswith("# 🏗️ Report\n")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+API Benchmark Suite
+Load-tests the skill API and the bot app, and compares runs
+
+1. Each scenario is loaded with every requested concurrency level
+2. Results (latency percentiles, throughput, error rate) are written as JSON
+3. ``--compare`` diffs a run against an earlier results file and exits
+   non-zero when a scenario regressed by more than ``--threshold`` percent
+
+Start the servers first, e.g. ``uvicorn api:app --port 8000`` and the bot
+app from ``apps/api-server/bl1nk-architect``; bot scenarios run only when
+``--bot-url`` is given.
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.loadgen import Scenario, run_load
+
+RESULTS_DIR = Path("benchmarks/results")
+
+# Metrics compared between runs; True when higher is better
+COMPARED_METRICS = {
+    "latency_ms.p50": False,
+    "latency_ms.p95": False,
+    "latency_ms.p99": False,
+    "throughput_rps": True,
+}
+
+
+def api_scenarios(skill: str) -> List[Scenario]:
+    """Scenarios for the skill API (api.py)"""
+    return [
+        Scenario("api.skills", "GET", "/skills"),
+        Scenario("api.skills.phase", "GET", "/skills", query={"phase": "critical"}),
+        Scenario("api.tools", "GET", "/tools"),
+        Scenario("api.run_skill", "POST", f"/run-skill/{skill}", body={}),
+    ]
+
+
+def bot_scenarios(skill: str, query: str) -> List[Scenario]:
+    """Scenarios for the bot app (bot_with_skills.py)"""
+    return [
+        Scenario("bot.skills", "GET", "/skills"),
+        Scenario("bot.execute", "POST", f"/skills/{skill}/execute", query={"query": query}),
+    ]
+
+
+def _metric(result: Dict[str, Any], dotted: str) -> Optional[float]:
+    value: Any = result
+    for key in dotted.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Per-scenario, per-concurrency metric changes against a baseline run"""
+    previous = {(r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])}
+    changes = []
+    for result in current["results"]:
+        before = previous.get((result["scenario"], result["concurrency"]))
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = _metric(before, metric), _metric(result, metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better else change
+            changes.append({
+                "scenario": result["scenario"],
+                "concurrency": result["concurrency"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change_pct": round(change, 2),
+                "regression": worse > threshold,
+            })
+    return changes
+
+
+async def run_suite(args) -> Dict[str, Any]:
+    targets = [(args.api_url, api_scenarios(args.skill))]
+    if args.bot_url:
+        targets.append((args.bot_url, bot_scenarios(args.bot_skill, args.query)))
+
+    results = []
+    for base_url, scenarios in targets:
+        for scenario in scenarios:
+            if args.only and not any(name in scenario.name for name in args.only):
+                continue
+            for concurrency in args.concurrency:
+                metrics = await run_load(
+                    base_url,
+                    scenario,
+                    concurrency=concurrency,
+                    requests=args.requests,
+                    duration=args.duration,
+                    warmup=args.warmup,
+                    timeout=args.timeout,
+                )
+                results.append({"scenario": scenario.name, "base_url": base_url, **metrics})
+                print(
+                    f"{scenario.name:<18} c={concurrency:<4} "
+                    f"{metrics['throughput_rps']:>9.1f} req/s  "
+                    f"p50 {metrics['latency_ms']['p50']:>8.2f} ms  "
+                    f"p95 {metrics['latency_ms']['p95']:>8.2f} ms  "
+                    f"p99 {metrics['latency_ms']['p99']:>8.2f} ms  "
+                    f"errors {metrics['error_rate']:.2%}"
+                )
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "settings": {
+            "requests": args.requests,
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="BL1NK API Benchmark Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_api.py                                # api.py on :8000
+  python benchmark_api.py -c 1 8 32 -n 2000              # Concurrency sweep
+  python benchmark_api.py --bot-url http://127.0.0.1:8080
+  python benchmark_api.py --compare benchmarks/results/baseline.json
+        """
+    )
+    parser.add_argument("--api-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--bot-url", help="Bot app base URL (bot scenarios are skipped without it)")
+    parser.add_argument("-c", "--concurrency", type=int, nargs="+", default=[1, 8, 32],
+                        help="Concurrency levels to run (default: 1 8 32)")
+    parser.add_argument("-n", "--requests", type=int, default=1000,
+                        help="Requests per scenario and concurrency level (default: 1000)")
+    parser.add_argument("-d", "--duration", type=float,
+                        help="Stop each run after this many seconds")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout (seconds)")
+    parser.add_argument("--only", nargs="+", help="Run scenarios whose name contains any of these")
+    parser.add_argument("--skill", default="hello-world", help="Skill for /run-skill")
+    parser.add_argument("--bot-skill", default="hello-world", help="Skill for /skills/{id}/execute")
+    parser.add_argument("--query", default="benchmark", help="Query for /skills/{id}/execute")
+    parser.add_argument("-o", "--output", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Regression threshold in percent (default: 10)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_suite(args))
+
+    exit_code = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["baseline"] = args.compare
+        report["comparison"] = compare(report, baseline, args.threshold)
+        print()
+        for change in report["comparison"]:
+            marker = "REGRESSION" if change["regression"] else ""
+            print(
+                f"{change['scenario']:<18} c={change['concurrency']:<4} {change['metric']:<16} "
+                f"{change['baseline']:>10} -> {change['current']:<10} "
+                f"{change['change_pct']:+7.2f}%  {marker}"
+            )
+        if any(change["regression"] for change in report["comparison"]):
+            exit_code = 1
+
+    output = Path(args.output) if args.output else \
+        RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResults written to {output}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
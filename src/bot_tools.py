@@ -7,6 +7,300 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import json
+import re
+
+from src.store import ArtifactStore, get_artifact_store
+from src.templates import TemplateEngine, slugify
+from src.harness import run_bot_harness
+
+# Scaffold file templates, compiled once by the template engine
+SCAFFOLD_TEMPLATES = {
+    "poe_script": """#!/usr/bin/env python3
+\"\"\"
+Poe Protocol Bot Implementation
+\"\"\"
+
+from fastapi_poe import PoeApiHandler, ProtocolMessage, ToolResult
+
+BOT_NAME = {{ bot_name|py }}
+DESCRIPTION = {{ description|py }}
+
+class {{ bot_name|ident }}Handler(PoeApiHandler):
+    \"\"\"Poe protocol handler\"\"\"
+    
+    async def on_message(self, message: ProtocolMessage) -> ToolResult:
+        \"\"\"Process incoming messages\"\"\"
+        # Implement bot logic here
+        return ToolResult(text=f"Processed: {message.text}")
+
+# Main entry point
+if __name__ == "__main__":
+    # Start bot server
+    pass
+""",
+
+    "canvas_components": """import React, { useState } from 'react';
+
+const TITLE = {{ bot_name|json }};
+
+export default function {{ bot_name|ident }}Canvas() {
+    const [input, setInput] = useState('');
+    const [output, setOutput] = useState('');
+    
+    const handleSubmit = async () => {
+        // Handle submission
+        setOutput('Processing...');
+    };
+    
+    return (
+        <div className="canvas-container">
+            <h1>{TITLE}</h1>
+            <textarea value={input} onChange={(e) => setInput(e.target.value)} />
+            <button onClick={handleSubmit}>Submit</button>
+            <div className="output">{output}</div>
+        </div>
+    );
+}
+""",
+
+    "canvas_styles": """
+.canvas-container {
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+.output {
+    background-color: #f5f5f5;
+    padding: 15px;
+    border-radius: 5px;
+    margin-top: 20px;
+}
+""",
+
+    "config_poe": """
+name: {{ bot_name|json }}
+version: 1.0.0
+description: {{ description|json }}
+
+poe:
+  protocol_version: 1
+  auth_required: false
+  rate_limit: 100
+
+settings:
+  timeout: 30
+  max_retries: 3
+""",
+
+    "requirements_poe": """fastapi-poe>=0.0.34
+fastapi>=0.100.0
+uvicorn>=0.23.0
+pydantic>=2.0.0
+python-dotenv>=1.0.0
+""",
+
+    "readme_poe": """# {{ bot_name|html }}
+
+{{ description|html }}
+
+## Setup
+
+```bash
+pip install -r requirements.txt
+python bot.py
+```
+
+## Configuration
+
+Edit `config.yaml` to customize the bot.
+
+## API
+
+POST /message
+GET /status
+""",
+
+    "optimized_prompt": """You are an expert assistant specialized in {{ description }}.
+
+**Task**: {{ use_case }}
+
+**Style**: {{ style }}
+
+Guidelines:
+1. Be clear and concise
+2. Provide specific examples
+3. Ask clarifying questions if needed
+4. Consider edge cases
+
+Please proceed with the task.
+""",
+
+    "script_python": """#!/usr/bin/env python3
+\"\"\"
+Generated script
+\"\"\"
+
+SCRIPT_NAME = {{ script_name|py }}
+SCRIPT_TYPE = {{ script_type|py }}
+
+def main():
+    \"\"\"Main function\"\"\"
+    print(f"Script: {SCRIPT_NAME}")
+    # Implementation here
+    pass
+
+if __name__ == "__main__":
+    main()
+""",
+
+    "script_javascript": """/**
+ * Generated script
+ */
+
+const SCRIPT_NAME = {{ script_name|json }};
+const SCRIPT_TYPE = {{ script_type|json }};
+
+function main() {
+    console.log(`Script: ${SCRIPT_NAME}`);
+    // Implementation here
+}
+
+main();
+""",
+
+    "system_prompt": """You are {{ project_name }}, an AI assistant specialized in {{ description }}.
+
+Your role is to:
+- Provide expert guidance
+- Answer questions accurately
+- Give actionable advice
+- Maintain professional tone
+""",
+
+    "claude_instructions": """# Instructions for {{ project_name|html }}
+
+## Core Purpose
+{{ project_name|html }} is designed to assist with specialized tasks.
+
+## Guidelines
+1. Be helpful and thorough
+2. Ask for clarification when needed
+3. Provide examples
+4. Consider context
+
+## Response Format
+- Use clear structure
+- Include relevant details
+- Suggest next steps
+""",
+
+    "project_config": """{
+    "name": {{ project_name|json }},
+    "model": "claude-3-opus",
+    "temperature": 0.7,
+    "max_tokens": 8000,
+    "system_prompt": "...",
+    "instructions": []
+}
+""",
+
+    "readme_claude": """# {{ project_name|html }}
+
+{{ description|html }}
+
+## Setup
+
+1. Load this project in Claude
+2. Configure the system prompt
+3. Add custom instructions
+
+## Configuration
+
+Edit `project.json` to customize settings.
+""",
+
+    "plugin_manifest": """{
+    "name": {{ plugin_name|json }},
+    "description": {{ description|json }},
+    "version": "1.0.0",
+    "capabilities": {{ capabilities|json }},
+    "auth": "oauth2",
+    "api": {
+        "version": "1.0",
+        "endpoints": []
+    }
+}
+""",
+
+    "openapi_spec": """openapi: 3.0.0
+info:
+  title: {{ plugin_name|json }}
+  version: 1.0.0
+paths:
+  /api/v1/execute:
+    post:
+      summary: Execute plugin
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              type: object
+      responses:
+        200:
+          description: Success
+""",
+
+    "plugin_code": """#!/usr/bin/env python3
+\"\"\"
+Claude Plugin Implementation
+\"\"\"
+
+class {{ plugin_name|ident }}Plugin:
+    \"\"\"Claude plugin\"\"\"
+    
+    def __init__(self):
+        self.name = {{ plugin_name|py }}
+        self.version = "1.0.0"
+    
+    def execute(self, **kwargs):
+        \"\"\"Execute plugin\"\"\"
+        # Plugin logic here
+        return {"status": "success"}
+""",
+
+    "readme_plugin": """# {{ plugin_name|html }} Claude Plugin
+
+{{ description|html }}
+
+## Installation
+
+1. Add this plugin to Claude
+2. Configure API credentials
+3. Start using in conversations
+
+## Usage
+
+Use the plugin by referencing it in your prompts.
+
+## Configuration
+
+Set up authentication in your Claude settings.
+""",
+}
+
+scaffold_engine = TemplateEngine(SCAFFOLD_TEMPLATES)
+
+# Bot names become class names in generated code
+BOT_NAME_PATTERN = r"^[A-Za-z][A-Za-z0-9 _-]{0,63}$"
+
+
+def invalid_bot_name(bot_name: Any) -> Optional[Dict[str, Any]]:
+    """Error dict for a name that does not match BOT_NAME_PATTERN, else None"""
+    if isinstance(bot_name, str) and re.fullmatch(BOT_NAME_PATTERN, bot_name):
+        return None
+    return {"error": "Invalid bot name: use letters, digits, spaces, '_' or '-' (max 64), starting with a letter"}
 
 @dataclass
 class BotTemplate:
@@ -20,10 +314,9 @@ class BotTemplate:
 class BotGenerationTools:
     """Tools for generating bots, scripts, and projects"""
     
-    def __init__(self):
-        self.bots = {}
-        self.scripts = {}
-        self.prompts = {}
+    def __init__(self, store: Optional[ArtifactStore] = None):
+        # Generated artifacts are persisted, not kept in memory
+        self.store = store or get_artifact_store()
         self.templates = self._init_templates()
     
     def _init_templates(self) -> Dict[str, BotTemplate]:
@@ -68,7 +361,10 @@ class BotGenerationTools:
     
     def create_poe_script_bot(self, bot_name: str, bot_description: str, language: str = "python", **kwargs) -> Dict[str, Any]:
         """Create a new Poe script bot"""
-        bot_id = f"poe_script_{bot_name.lower().replace(' ', '_')}"
+        error = invalid_bot_name(bot_name)
+        if error:
+            return error
+        bot_id = f"poe_script_{slugify(bot_name)}"
         
         bot_data = {
             "id": bot_id,
@@ -82,17 +378,19 @@ class BotGenerationTools:
             "files": {
                 "bot.py": self._generate_poe_script(bot_name, bot_description),
                 "requirements.txt": self._generate_requirements_poe(),
-                "config.yaml": self._generate_config_poe(bot_name),
+                "config.yaml": self._generate_config_poe(bot_name, bot_description),
                 "README.md": self._generate_readme_poe(bot_name, bot_description),
             }
         }
         
-        self.bots[bot_id] = bot_data
-        return bot_data
+        return self.store.put("bot", bot_data)
     
     def create_poe_canvas_bot(self, bot_name: str, bot_description: str, **kwargs) -> Dict[str, Any]:
         """Create a new Poe canvas bot (UI-based)"""
-        bot_id = f"poe_canvas_{bot_name.lower().replace(' ', '_')}"
+        error = invalid_bot_name(bot_name)
+        if error:
+            return error
+        bot_id = f"poe_canvas_{slugify(bot_name)}"
         
         bot_data = {
             "id": bot_id,
@@ -107,17 +405,16 @@ class BotGenerationTools:
                 "bot.py": self._generate_poe_script(bot_name, bot_description),
                 "components.tsx": self._generate_canvas_components(bot_name),
                 "styles.css": self._generate_canvas_styles(),
-                "config.yaml": self._generate_config_poe(bot_name),
+                "config.yaml": self._generate_config_poe(bot_name, bot_description),
                 "README.md": self._generate_readme_poe(bot_name, bot_description),
             }
         }
         
-        self.bots[bot_id] = bot_data
-        return bot_data
+        return self.store.put("bot", bot_data)
     
     def generate_prompt(self, prompt_name: str, description: str, use_case: str, style: str = "instruction-based", **kwargs) -> Dict[str, Any]:
         """Generate an optimized prompt"""
-        prompt_id = f"prompt_{prompt_name.lower().replace(' ', '_')}"
+        prompt_id = f"prompt_{slugify(prompt_name)}"
         
         prompt_data = {
             "id": prompt_id,
@@ -131,12 +428,11 @@ class BotGenerationTools:
             "version": "1.0"
         }
         
-        self.prompts[prompt_id] = prompt_data
-        return prompt_data
+        return self.store.put("prompt", prompt_data)
     
     def generate_script(self, script_name: str, script_type: str, description: str, language: str = "python", **kwargs) -> Dict[str, Any]:
         """Generate a script file"""
-        script_id = f"script_{script_name.lower().replace(' ', '_')}"
+        script_id = f"script_{slugify(script_name)}"
         
         script_data = {
             "id": script_id,
@@ -150,12 +446,12 @@ class BotGenerationTools:
             "status": "generated"
         }
         
-        self.scripts[script_id] = script_data
-        return script_data
+        return self.store.put("script", script_data)
     
     def create_claude_project(self, project_name: str, project_description: str, **kwargs) -> Dict[str, Any]:
         """Create a Claude project with context and instructions"""
-        project_id = f"claude_project_{project_name.lower().replace(' ', '_')}"
+        project_id = f"claude_project_{slugify(project_name)}"
+        instructions = self._generate_claude_instructions(project_name)
         
         project_data = {
             "id": project_id,
@@ -166,22 +462,23 @@ class BotGenerationTools:
             "model": "claude-3-opus",
             "config": {
                 "system_prompt": self._generate_system_prompt(project_name, project_description),
-                "instructions": self._generate_claude_instructions(project_name),
+                "instructions": instructions,
                 "context_length": 8000,
                 "temperature": 0.7,
             },
             "files": {
                 "project.json": self._generate_project_config(project_name),
-                "instructions.md": self._generate_claude_instructions(project_name),
+                "instructions.md": instructions,
                 "README.md": self._generate_readme_claude(project_name, project_description),
             }
         }
         
-        return project_data
+        return self.store.put("bot", project_data)
     
     def create_claude_plugin(self, plugin_name: str, plugin_description: str, capabilities: List[str], **kwargs) -> Dict[str, Any]:
         """Create a Claude plugin"""
-        plugin_id = f"claude_plugin_{plugin_name.lower().replace(' ', '_')}"
+        plugin_id = f"claude_plugin_{slugify(plugin_name)}"
+        manifest = self._generate_plugin_manifest(plugin_name, plugin_description, capabilities)
         
         plugin_data = {
             "id": plugin_id,
@@ -191,25 +488,28 @@ class BotGenerationTools:
             "version": "1.0.0",
             "capabilities": capabilities,
             "created_at": datetime.now().isoformat(),
-            "manifest": self._generate_plugin_manifest(plugin_name, plugin_description, capabilities),
+            "manifest": manifest,
             "files": {
-                "manifest.json": self._generate_plugin_manifest(plugin_name, plugin_description, capabilities),
+                "manifest.json": manifest,
                 "openapi.yaml": self._generate_openapi_spec(plugin_name),
                 "plugin.py": self._generate_plugin_code(plugin_name),
                 "README.md": self._generate_readme_plugin(plugin_name, plugin_description),
             }
         }
         
-        return plugin_data
+        return self.store.put("bot", plugin_data)
     
-    def list_bots(self, filter_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all created bots"""
-        bots = list(self.bots.values())
-        
-        if filter_type:
-            bots = [b for b in bots if b.get("type") == filter_type]
-        
-        return bots
+    def list_bots(self, filter_type: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """List created bots, newest first (one page, without file contents)"""
+        return self.store.list("bot", filter_type, limit=limit, offset=offset)
+    
+    def count_bots(self, filter_type: Optional[str] = None) -> int:
+        """Number of created bots"""
+        return self.store.count("bot", filter_type)
+    
+    def get_bot(self, bot_id: str) -> Optional[Dict[str, Any]]:
+        """Full bot record including generated files"""
+        return self.store.get(bot_id)
     
     def list_templates(self) -> List[Dict[str, Any]]:
         """List available templates"""
@@ -258,31 +558,50 @@ class BotGenerationTools:
             "documentation": "https://docs.poe.com"
         }
     
-    def test_bot(self, bot_id: str, test_input: str) -> Dict[str, Any]:
-        """Test a bot with sample input"""
-        if bot_id not in self.bots:
+    def test_bot(
+        self,
+        bot_id: str,
+        test_input: str,
+        corpus: Optional[List[str]] = None,
+        concurrency: int = 8,
+        repeat: int = 1,
+    ) -> Dict[str, Any]:
+        """Run a bot against sample inputs and measure it"""
+        bot = self.store.get(bot_id)
+        if bot is None:
             return {"error": f"Bot {bot_id} not found"}
         
-        bot = self.bots[bot_id]
+        inputs = [test_input] + list(corpus or [])
+        run = run_bot_harness(bot.get("files", {}), inputs * max(1, repeat), concurrency=concurrency)
+        if not run["ok"]:
+            return {
+                "bot_id": bot_id,
+                "bot_name": bot["name"],
+                "test_input": test_input,
+                "status": "test_failed",
+                "error": run["error"],
+                "success": False
+            }
         
+        metrics = run["metrics"]
         return {
             "bot_id": bot_id,
             "bot_name": bot["name"],
             "test_input": test_input,
             "status": "test_completed",
-            "response": f"Test response from {bot['name']}: Processed input successfully",
-            "latency_ms": 123,
-            "tokens_used": 45,
-            "success": True
+            "response": metrics.pop("sample_response"),
+            "latency_ms": metrics["latency_ms"]["p50"],
+            "tokens_used": metrics["tokens_used"],
+            "success": metrics["errors"] == 0,
+            "metrics": metrics
         }
     
     def fix_bot(self, bot_id: str, issue_description: str) -> Dict[str, Any]:
         """Fix issues in a bot"""
-        if bot_id not in self.bots:
+        bot = self.store.get(bot_id, with_files=False)
+        if bot is None:
             return {"error": f"Bot {bot_id} not found"}
         
-        bot = self.bots[bot_id]
-        
         return {
             "bot_id": bot_id,
             "bot_name": bot["name"],
@@ -359,159 +678,36 @@ Requirements:
 Please provide a detailed response.
 """
     
-    def _generate_poe_script(self, bot_name: str, description: str) -> str:
-        return f"""#!/usr/bin/env python3
-\"\"\"
-{bot_name} - {description}
-Poe Protocol Bot Implementation
-\"\"\"
-
-from fastapi_poe import PoeApiHandler, ProtocolMessage, ToolResult
-
-class {bot_name.replace(' ', '')}Handler(PoeApiHandler):
-    \"\"\"Handler for {bot_name}\"\"\"
+    # Scaffold generators - rendered from SCAFFOLD_TEMPLATES (memoized)
     
-    async def on_message(self, message: ProtocolMessage) -> ToolResult:
-        \"\"\"Process incoming messages\"\"\"
-        # Implement bot logic here
-        return ToolResult(text=f"Processed: {{message.text}}")
-
-# Main entry point
-if __name__ == "__main__":
-    # Start bot server
-    pass
-"""
+    def _render(self, template: str, **params) -> str:
+        return scaffold_engine.render(template, **params)
     
-    def _generate_canvas_components(self, bot_name: str) -> str:
-        return f"""import React, {{ useState }} from 'react';
-
-export default function {bot_name.replace(' ', '')}() {{
-    const [input, setInput] = useState('');
-    const [output, setOutput] = useState('');
-    
-    const handleSubmit = async () => {{
-        // Handle submission
-        setOutput('Processing...');
-    }};
+    def _generate_poe_script(self, bot_name: str, description: str) -> str:
+        return self._render("poe_script", bot_name=bot_name, description=description)
     
-    return (
-        <div className="canvas-container">
-            <h1>{bot_name}</h1>
-            <textarea value={{input}} onChange={{(e) => setInput(e.target.value)}} />
-            <button onClick={{handleSubmit}}>Submit</button>
-            <div className="output">{{output}}</div>
-        </div>
-    );
-}}
-"""
+    def _generate_canvas_components(self, bot_name: str) -> str:
+        return self._render("canvas_components", bot_name=bot_name)
     
     def _generate_canvas_styles(self) -> str:
-        return """
-.canvas-container {
-    max-width: 800px;
-    margin: 0 auto;
-    padding: 20px;
-}
-
-.output {
-    background-color: #f5f5f5;
-    padding: 15px;
-    border-radius: 5px;
-    margin-top: 20px;
-}
-"""
+        return self._render("canvas_styles")
     
-    def _generate_config_poe(self, bot_name: str) -> str:
-        return f"""
-name: {bot_name}
-version: 1.0.0
-description: "Poe bot for {bot_name}"
-
-poe:
-  protocol_version: 1
-  auth_required: false
-  rate_limit: 100
-
-settings:
-  timeout: 30
-  max_retries: 3
-"""
+    def _generate_config_poe(self, bot_name: str, description: str) -> str:
+        return self._render("config_poe", bot_name=bot_name, description=description)
     
     def _generate_requirements_poe(self) -> str:
-        return """fastapi-poe>=0.0.34
-fastapi>=0.100.0
-uvicorn>=0.23.0
-pydantic>=2.0.0
-python-dotenv>=1.0.0
-"""
+        return self._render("requirements_poe")
     
     def _generate_readme_poe(self, bot_name: str, description: str) -> str:
-        return f"""# {bot_name}
-
-{description}
-
-## Setup
-
-```bash
-pip install -r requirements.txt
-python bot.py
-```
-
-## Configuration
-
-Edit `config.yaml` to customize the bot.
-
-## API
-
-POST /message
-GET /status
-"""
+        return self._render("readme_poe", bot_name=bot_name, description=description)
     
     def _generate_optimized_prompt(self, prompt_name: str, description: str, use_case: str, style: str) -> str:
-        return f"""You are an expert assistant specialized in {description}.
-
-**Task**: {use_case}
-
-**Style**: {style}
-
-Guidelines:
-1. Be clear and concise
-2. Provide specific examples
-3. Ask clarifying questions if needed
-4. Consider edge cases
-
-Please proceed with the task.
-"""
+        return self._render("optimized_prompt", description=description, use_case=use_case, style=style)
     
     def _generate_script_content(self, script_name: str, script_type: str, language: str) -> str:
-        if language == "python":
-            return f"""#!/usr/bin/env python3
-\"\"\"
-{script_name} - {script_type}
-\"\"\"
-
-def main():
-    \"\"\"Main function\"\"\"
-    print("Script: {script_name}")
-    # Implementation here
-    pass
-
-if __name__ == "__main__":
-    main()
-"""
-        elif language == "javascript":
-            return f"""/**
- * {script_name} - {script_type}
- */
-
-function main() {{
-    console.log("Script: {script_name}");
-    // Implementation here
-}}
-
-main();
-"""
-        return ""
+        if language not in ("python", "javascript"):
+            return ""
+        return self._render(f"script_{language}", script_name=script_name, script_type=script_type)
     
     def _get_imports_for_type(self, script_type: str, language: str) -> List[str]:
         if language == "python":
@@ -521,132 +717,28 @@ main();
         return []
     
     def _generate_system_prompt(self, project_name: str, description: str) -> str:
-        return f"""You are {project_name}, an AI assistant specialized in {description}.
-
-Your role is to:
-- Provide expert guidance
-- Answer questions accurately
-- Give actionable advice
-- Maintain professional tone
-"""
+        return self._render("system_prompt", project_name=project_name, description=description)
     
     def _generate_claude_instructions(self, project_name: str) -> str:
-        return f"""# Instructions for {project_name}
-
-## Core Purpose
-{project_name} is designed to assist with specialized tasks.
-
-## Guidelines
-1. Be helpful and thorough
-2. Ask for clarification when needed
-3. Provide examples
-4. Consider context
-
-## Response Format
-- Use clear structure
-- Include relevant details
-- Suggest next steps
-"""
+        return self._render("claude_instructions", project_name=project_name)
     
     def _generate_project_config(self, project_name: str) -> str:
-        return f"""{{
-    "name": "{project_name}",
-    "model": "claude-3-opus",
-    "temperature": 0.7,
-    "max_tokens": 8000,
-    "system_prompt": "...",
-    "instructions": []
-}}
-"""
+        return self._render("project_config", project_name=project_name)
     
     def _generate_readme_claude(self, project_name: str, description: str) -> str:
-        return f"""# {project_name}
-
-{description}
-
-## Setup
-
-1. Load this project in Claude
-2. Configure the system prompt
-3. Add custom instructions
-
-## Configuration
-
-Edit `project.json` to customize settings.
-"""
+        return self._render("readme_claude", project_name=project_name, description=description)
     
     def _generate_plugin_manifest(self, plugin_name: str, description: str, capabilities: List[str]) -> str:
-        return f"""{{
-    "name": "{plugin_name}",
-    "description": "{description}",
-    "version": "1.0.0",
-    "capabilities": {capabilities},
-    "auth": "oauth2",
-    "api": {{
-        "version": "1.0",
-        "endpoints": []
-    }}
-}}
-"""
+        return self._render("plugin_manifest", plugin_name=plugin_name, description=description, capabilities=tuple(capabilities))
     
     def _generate_openapi_spec(self, plugin_name: str) -> str:
-        return f"""openapi: 3.0.0
-info:
-  title: {plugin_name}
-  version: 1.0.0
-paths:
-  /api/v1/execute:
-    post:
-      summary: Execute plugin
-      requestBody:
-        required: true
-        content:
-          application/json:
-            schema:
-              type: object
-      responses:
-        200:
-          description: Success
-"""
+        return self._render("openapi_spec", plugin_name=plugin_name)
     
     def _generate_plugin_code(self, plugin_name: str) -> str:
-        return f"""#!/usr/bin/env python3
-\"\"\"
-{plugin_name} - Claude Plugin Implementation
-\"\"\"
-
-class {plugin_name.replace(' ', '')}Plugin:
-    \"\"\"Claude plugin for {plugin_name}\"\"\"
-    
-    def __init__(self):
-        self.name = "{plugin_name}"
-        self.version = "1.0.0"
-    
-    def execute(self, **kwargs):
-        \"\"\"Execute plugin\"\"\"
-        # Plugin logic here
-        return {{"status": "success"}}
-"""
+        return self._render("plugin_code", plugin_name=plugin_name)
     
     def _generate_readme_plugin(self, plugin_name: str, description: str) -> str:
-        return f"""# {plugin_name} Claude Plugin
-
-{description}
-
-## Installation
-
-1. Add this plugin to Claude
-2. Configure API credentials
-3. Start using in conversations
-
-## Usage
-
-Use the plugin by referencing it in your prompts.
-
-## Configuration
-
-Set up authentication in your Claude settings.
-"""
+        return self._render("readme_plugin", plugin_name=plugin_name, description=description)
 
 # Export
 bot_tools = BotGenerationTools()
@@ -0,0 +1,250 @@
+"""
+Skill Catalog for BL1NK Skill MCP Server
+Indexed, read-only view of the skills on disk
+
+Sources, merged in this order (later entries override earlier ones):
+1. ``skills/manifest/*.json`` - every file with a ``skills`` list
+2. ``skills/phase-N-<phase>/<skill>/SKILL.md`` frontmatter - the
+   directory name gives the skill's phase
+
+A catalog snapshot is immutable - records are frozen into read-only
+mappings and tuples - and indexed by name and phase. Responses are handed
+out as fresh copies, and JSON payloads are built once. ``SkillCatalogLoader`` rebuilds the snapshot when
+any source file changes, checking at most once per ``check_interval``.
+"""
+
+import re
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import yaml
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+PHASE_DIR = re.compile(r"^phase-\d+-(?P<phase>[a-z0-9-]+)$")
+FRONTMATTER = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+
+# Fields returned by list_skills; get_skill_info returns the full record
+SUMMARY_FIELDS = ("name", "description", "phase", "category", "version")
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy: dicts become mapping proxies, lists become tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Plain, caller-owned copy of a frozen value"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class SkillCatalog:
+    """Immutable snapshot of the skill catalog"""
+
+    def __init__(self, records: Iterable[Dict[str, Any]], signature: Tuple = ()):
+        by_name: Dict[str, Mapping[str, Any]] = {}
+        for record in records:
+            by_name[record["name"]] = _freeze(record)
+
+        phases: Dict[str, List[Mapping[str, Any]]] = {}
+        summaries = []
+        for record in by_name.values():
+            summary = MappingProxyType(
+                {key: record[key] for key in SUMMARY_FIELDS if record.get(key) is not None}
+            )
+            summaries.append(summary)
+            if record.get("phase"):
+                phases.setdefault(record["phase"], []).append(summary)
+
+        self.signature = signature
+        self.by_name: Mapping[str, Mapping[str, Any]] = MappingProxyType(by_name)
+        self.by_phase: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            {phase: tuple(items) for phase, items in phases.items()}
+        )
+        self.summaries: Tuple[Mapping[str, Any], ...] = tuple(summaries)
+        self._payloads: Dict[Optional[str], bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def list_skills(self, phase: Optional[str] = None) -> Dict[str, Any]:
+        """List response, optionally for one phase (a copy the caller owns)"""
+        if phase:
+            items = self.by_phase.get(phase, ())
+            return {"phase": phase, "total": len(items), "skills": _thaw(items)}
+        return {"total": len(self.summaries), "skills": _thaw(self.summaries)}
+
+    def list_skills_payload(self, phase: Optional[str] = None) -> bytes:
+        """Cached JSON body of ``list_skills``"""
+        payload = self._payloads.get(phase)
+        if payload is None:
+            payload = json.dumps(self.list_skills(phase), separators=(",", ":")).encode("utf-8")
+            self._payloads[phase] = payload
+        return payload
+
+    def get_skill_info(self, skill_name: str) -> Dict[str, Any]:
+        """Info response for one skill (a copy the caller owns)"""
+        record = self.by_name.get(skill_name)
+        if record is None:
+            return {"found": False, "error": f"Skill '{skill_name}' not found"}
+        return {"found": True, "skill": _thaw(record)}
+
+
+def list_skills_schema(phases: Iterable[str] = ()) -> Dict[str, Any]:
+    """``list_skills`` input schema; ``phase`` is limited to the catalog's phases"""
+    phase: Dict[str, Any] = {"type": "string", "description": "Filter by skill phase"}
+    phases = sorted(phases)
+    if phases:
+        phase["enum"] = phases
+    return {"type": "object", "properties": {"phase": phase}}
+
+
+def _manifest_records(path: Path) -> List[Dict[str, Any]]:
+    """Normalize one manifest file's ``skills`` list"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Skipping manifest {path.name}: {e}")
+        return []
+
+    records = []
+    for entry in data.get("skills", []) if isinstance(data, dict) else []:
+        if not isinstance(entry, dict):
+            continue
+        record = dict(entry)
+        # skills.json uses "id" for the slug and "name" for the title
+        if "id" in record:
+            record.setdefault("title", record.get("name"))
+            record["name"] = record.pop("id")
+        if record.get("name"):
+            record["source"] = f"manifest/{path.name}"
+            records.append(record)
+    return records
+
+
+def _skill_dir_record(skill_md: Path, phase: str) -> Optional[Dict[str, Any]]:
+    """Record from a SKILL.md frontmatter block"""
+    try:
+        match = FRONTMATTER.match(skill_md.read_text(encoding="utf-8"))
+    except OSError as e:
+        logger.warning(f"Skipping {skill_md}: {e}")
+        return None
+
+    frontmatter = match.group(1) if match else ""
+    try:
+        meta = yaml.safe_load(frontmatter) or {}
+    except yaml.YAMLError:
+        # Hand-written frontmatter often has unquoted colons in descriptions
+        meta = dict(
+            (key.strip(), value.strip())
+            for key, _, value in (line.partition(":") for line in frontmatter.splitlines())
+            if key.strip() and not key.startswith((" ", "\t"))
+        )
+
+    meta = meta if isinstance(meta, dict) else {}
+    return {
+        **meta,
+        "name": meta.get("name") or skill_md.parent.name,
+        "phase": phase,
+        "skill_dir": str(skill_md.parent),
+        "source": "directory",
+    }
+
+
+def _sources(skills_dir: Path) -> Tuple[List[Path], List[Tuple[Path, str]]]:
+    manifests = sorted((skills_dir / "manifest").glob("*.json"))
+    skill_files = []
+    for phase_dir in sorted(skills_dir.glob("phase-*")):
+        match = PHASE_DIR.match(phase_dir.name)
+        if match and phase_dir.is_dir():
+            for skill_md in sorted(phase_dir.glob("*/SKILL.md")):
+                skill_files.append((skill_md, match.group("phase")))
+    return manifests, skill_files
+
+
+def _signature(manifests: List[Path], skill_files: List[Tuple[Path, str]]) -> Tuple:
+    stamps = []
+    for path in manifests + [path for path, _ in skill_files]:
+        try:
+            stat = path.stat()
+            stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+    return tuple(stamps)
+
+
+def build_catalog(skills_dir: Path) -> SkillCatalog:
+    """Read all sources and build a new snapshot"""
+    manifests, skill_files = _sources(skills_dir)
+    records: List[Dict[str, Any]] = []
+    for path in manifests:
+        records.extend(_manifest_records(path))
+
+    by_name = {record["name"]: record for record in records}
+    for skill_md, phase in skill_files:
+        record = _skill_dir_record(skill_md, phase)
+        if record:
+            by_name[record["name"]] = {**by_name.get(record["name"], {}), **record}
+
+    return SkillCatalog(by_name.values(), _signature(manifests, skill_files))
+
+
+class SkillCatalogLoader:
+    """Serves the current catalog snapshot, rebuilding it on file changes"""
+
+    def __init__(self, skills_dir: Optional[str] = None, check_interval: float = 2.0):
+        path = Path(skills_dir or config.SKILLS_DIR)
+        if not path.is_absolute() and not path.exists():
+            # Relative to the project root when not run from it
+            path = Path(__file__).resolve().parent.parent / path
+        self.skills_dir = path
+        self.check_interval = check_interval
+        self._catalog: Optional[SkillCatalog] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> SkillCatalog:
+        """Current snapshot (lock-free unless a change check is due)"""
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return catalog
+
+        with self._lock:
+            if self._catalog is None or time.monotonic() - self._checked_at >= self.check_interval:
+                self._refresh()
+            return self._catalog
+
+    def _refresh(self):
+        self._checked_at = time.monotonic()
+        signature = _signature(*_sources(self.skills_dir))
+        if self._catalog is not None and signature == self._catalog.signature:
+            return
+        self._catalog = build_catalog(self.skills_dir)
+        logger.info(f"Loaded skill catalog: {len(self._catalog)} skills from {self.skills_dir}")
+
+
+# Global catalog loader
+_loader: Optional[SkillCatalogLoader] = None
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """Get the current skill catalog snapshot"""
+    global _loader
+    if _loader is None:
+        _loader = SkillCatalogLoader()
+    return _loader.get()
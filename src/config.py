@@ -19,7 +19,17 @@ class Config:
     
     # Skills configuration
     SKILLS_DIR: str = os.getenv("SKILLS_DIR", "./skills")
-    MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "4"))
+    MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "4"))  # CPU-bound tool threads
+    IO_WORKERS: int = int(os.getenv("IO_WORKERS", str(MAX_WORKERS * 4)))  # I/O-bound tool threads
+    MAX_PENDING_CALLS: int = int(os.getenv("MAX_PENDING_CALLS", str(MAX_WORKERS * 8)))  # queued per pool before 429
+    MAX_BATCH_CONCURRENCY: int = int(os.getenv("SKILL_BATCH_CONCURRENCY", "16"))  # per batch request
+    
+    # MCP streamable HTTP sessions: idle expiry (seconds) and cap
+    MCP_SESSION_TTL: float = float(os.getenv("MCP_SESSION_TTL", "3600"))
+    MCP_MAX_SESSIONS: int = int(os.getenv("MCP_MAX_SESSIONS", "1000"))
+    
+    # Generated bots, scripts and prompts (":memory:" for a throwaway store)
+    STORE_PATH: str = os.getenv("STORE_PATH", "./data/bl1nk.db")
     
     # AWS settings (optional)
     AWS_REGION: Optional[str] = os.getenv("AWS_REGION")
@@ -0,0 +1,187 @@
+"""
+Tool Executor for BL1NK Skill MCP Server
+Bounded async execution of tool calls
+
+1. CPU-bound and I/O-bound tools run on separate thread pools, so slow
+   lookups never starve compute-heavy skills and vice versa
+2. The CPU pool is sized by ``Config.MAX_WORKERS``; the I/O pool by
+   ``Config.IO_WORKERS``
+3. Each pool admits at most ``workers + MAX_PENDING_CALLS`` calls; beyond
+   that ``ExecutorSaturated`` is raised instead of queueing without limit
+4. ``async def`` tool handlers are awaited on the event loop directly
+
+Batch requests fan out through ``run_batch``, a bounded worker pool that
+yields each result as soon as it finishes.
+"""
+
+import time
+import inspect
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+CPU = "cpu"
+IO = "io"
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a pool has no free admission slot"""
+
+    def __init__(self, kind: str, retry_after: int = 1):
+        super().__init__(f"Too many concurrent {kind} tool calls")
+        self.kind = kind
+        self.retry_after = retry_after
+
+
+class _Pool:
+    """Thread pool with a fixed admission limit"""
+
+    def __init__(self, kind: str, workers: int, max_pending: int):
+        self.kind = kind
+        self.workers = workers
+        self.capacity = workers + max_pending
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"tool-{kind}")
+        self.active = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.capacity)
+        return self._slots
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"workers": self.workers, "capacity": self.capacity, "active": self.active}
+
+
+class ToolExecutor:
+    """Runs ``server.call_tool`` on the pool matching each tool's kind"""
+
+    def __init__(
+        self,
+        cpu_workers: Optional[int] = None,
+        io_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        max_pending = config.MAX_PENDING_CALLS if max_pending is None else max_pending
+        self.pools = {
+            CPU: _Pool(CPU, cpu_workers or config.MAX_WORKERS, max_pending),
+            IO: _Pool(IO, io_workers or config.IO_WORKERS, max_pending),
+        }
+
+    async def call(self, server, tool_name: str, wait: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Call a tool without blocking the event loop
+
+        With ``wait=False`` a full pool raises ``ExecutorSaturated``; with
+        ``wait=True`` the caller waits for a slot (used by batch jobs that
+        already bound their own concurrency).
+        """
+        tool = server.get_tool(tool_name)
+        if tool is None:
+            return server.call_tool(tool_name, **kwargs)
+
+        pool = self.pools.get(tool.kind, self.pools[IO])
+        if not wait and pool.slots.locked():
+            raise ExecutorSaturated(pool.kind)
+
+        async with pool.slots:
+            pool.active += 1
+            try:
+                if inspect.iscoroutinefunction(tool.handler):
+                    # call_tool validates, then returns the handler's coroutine
+                    result = server.call_tool(tool_name, **kwargs)
+                    return await result if inspect.isawaitable(result) else result
+
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    pool.executor, lambda: server.call_tool(tool_name, **kwargs)
+                )
+            finally:
+                pool.active -= 1
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Pool sizes and current load"""
+        return {kind: pool.get_stats() for kind, pool in self.pools.items()}
+
+    def shutdown(self):
+        for pool in self.pools.values():
+            pool.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def batch_concurrency(value: Any, default: int = 8) -> int:
+    """
+    Validate a batch request's ``concurrency``
+
+    Raises ``ValueError`` unless it is an integer of at least 1; larger
+    values are capped at ``Config.MAX_BATCH_CONCURRENCY``.
+    """
+    value = default if value is None else value
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError("'concurrency' must be an integer of at least 1")
+    return min(value, config.MAX_BATCH_CONCURRENCY)
+
+
+async def run_batch(
+    call: Callable[[Any], Awaitable[Any]],
+    items: List[Any],
+    concurrency: int,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Await ``call(item)`` for every item on ``concurrency`` workers
+
+    Yields ``{"index", "status", "result" | "error", "duration_ms"}`` as
+    each call finishes, so results arrive out of order.
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        pending.put_nowait((index, item))
+    finished: asyncio.Queue = asyncio.Queue()
+
+    async def worker():
+        while True:
+            try:
+                index, item = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            started = time.perf_counter()
+            try:
+                outcome = {"index": index, "status": "ok", "result": await call(item)}
+            except Exception as e:
+                logger.error(f"Batch item {index} failed: {e}")
+                outcome = {"index": index, "status": "error", "error": str(e)}
+
+            outcome["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            await finished.put(outcome)
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(max(1, min(concurrency, len(items))))
+    ]
+
+    try:
+        for _ in range(len(items)):
+            yield await finished.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+# Global executor instance
+_executor: Optional[ToolExecutor] = None
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get or create the global tool executor"""
+    global _executor
+    if _executor is None:
+        _executor = ToolExecutor()
+    return _executor
@@ -0,0 +1,133 @@
+"""
+Artifact Export for BL1NK Skill MCP Server
+Streams a generated project as a ZIP or tar.gz archive
+
+Follows the packaging approach of ``package_skill.py`` (deflated ZIP, all
+entries under a top-level ``<artifact-id>/`` folder, slugified) but never builds the
+archive in memory: files are read from the store one at a time and
+compressed bytes are yielded as soon as they are produced.
+"""
+
+import io
+import json
+import time
+import itertools
+import tarfile
+import zipfile
+from typing import Iterator, List, Tuple
+
+from src.store import ArtifactStore
+from src.templates import slugify
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _StreamSink(io.RawIOBase):
+    """Write-only, unseekable file that buffers bytes until drained"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # zipfile needs the offset of each entry even on unseekable streams
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _ChunkReader(io.RawIOBase):
+    """Readable file over an iterator of byte chunks (for tarfile)"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _entries(store: ArtifactStore, artifact_id: str) -> Iterator[Tuple[str, int, Iterator[bytes]]]:
+    """(path, size, chunk iterator) for artifact.json and each stored file"""
+    record = store.get(artifact_id, with_files=False)
+    if record is None:
+        raise KeyError(artifact_id)
+
+    manifest = json.dumps(record, indent=2, default=str).encode("utf-8")
+    yield "artifact.json", len(manifest), iter([manifest])
+
+    for file in store.list_files(artifact_id):
+        yield file["path"], file["size"], store.iter_blob(file["hash"], CHUNK_SIZE)
+
+
+def stream_zip(store: ArtifactStore, artifact_id: str) -> Iterator[bytes]:
+    """Yield a deflated ZIP of an artifact's files, chunk by chunk"""
+    entries = _entries(store, artifact_id)
+    first = next(entries)  # Raises KeyError before any bytes are sent
+    folder = slugify(artifact_id)
+
+    sink = _StreamSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for path, _, chunks in itertools.chain([first], entries):
+            info = zipfile.ZipInfo(f"{folder}/{path}", time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with zipf.open(info, "w") as entry:
+                for data in chunks:
+                    entry.write(data)
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+    # Central directory
+    yield sink.drain()
+
+
+def stream_tar(store: ArtifactStore, artifact_id: str) -> Iterator[bytes]:
+    """Yield a gzipped tar of an artifact's files, chunk by chunk"""
+    entries = _entries(store, artifact_id)
+    first = next(entries)
+    folder = slugify(artifact_id)
+
+    sink = _StreamSink()
+    with tarfile.open(fileobj=sink, mode="w|gz", bufsize=CHUNK_SIZE) as tar:
+        for path, size, chunks in itertools.chain([first], entries):
+            info = tarfile.TarInfo(f"{folder}/{path}")
+            info.size = size
+            info.mtime = int(time.time())
+            tar.addfile(info, _ChunkReader(chunks))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+    yield sink.drain()
+
+
+EXPORT_FORMATS = {
+    "zip": (stream_zip, "application/zip", "zip"),
+    "tar": (stream_tar, "application/gzip", "tar.gz"),
+}
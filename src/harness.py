@@ -0,0 +1,250 @@
+"""
+Bot Test Harness for BL1NK Skill MCP Server
+Boots a generated Poe bot and replays a test corpus against it
+
+1. The bot's stored files are written to a temporary directory
+2. This module runs there as a subprocess, with a fake ``fastapi_poe``
+   module standing in for the Poe client and protocol types
+3. The bot's ``PoeApiHandler`` subclass answers every corpus input, with
+   up to ``concurrency`` messages in flight at once
+4. Per-message latencies are measured and reported as p50/p95/p99, along
+   with throughput and error rate
+
+The subprocess keeps a broken or hanging bot from taking the server down.
+It runs in isolated mode (``python -I``) with a minimal environment, so no
+API keys or other server secrets are visible to the bot, inside the
+throwaway bot directory, and under CPU and address-space rlimits.
+Only the standard library is imported at module level, because the
+subprocess runs this file directly.
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import asyncio
+import tempfile
+import subprocess
+import importlib.util
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - resource is Unix-only
+    resource = None
+
+HANDLER_FILE = "bot.py"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(results: List[Dict[str, Any]], wall_seconds: float) -> Dict[str, Any]:
+    """Latency percentiles, throughput and error rate for one run"""
+    latencies = sorted(r["latency_ms"] for r in results if r["ok"])
+    errors = [r for r in results if not r["ok"]]
+    total = len(results)
+    return {
+        "requests": total,
+        "errors": len(errors),
+        "error_rate": round(len(errors) / total, 4) if total else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "max": round(latencies[-1], 3) if latencies else 0.0,
+        },
+        "throughput_rps": round(total / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "wall_time_ms": round(wall_seconds * 1000, 3),
+        "tokens_used": sum(r.get("tokens", 0) for r in results),
+        "sample_errors": sorted({r["error"] for r in errors})[:5],
+    }
+
+
+# Subprocess side
+
+
+def _apply_limits(cpu_seconds: int, memory_mb: int):
+    """Cap the harness process; hard limits too, so the bot cannot lift them"""
+    if resource is None:
+        return
+    for kind, value in (
+        (resource.RLIMIT_CPU, cpu_seconds),
+        (resource.RLIMIT_AS, memory_mb * 1024 * 1024),
+    ):
+        _, hard = resource.getrlimit(kind)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(kind, (value, value))
+
+
+def _install_fake_poe():
+    """Register a minimal ``fastapi_poe`` so generated bots import offline"""
+    module = types.ModuleType("fastapi_poe")
+
+    class ProtocolMessage:
+        def __init__(self, content: str, role: str = "user"):
+            self.role = role
+            self.content = content
+            self.text = content
+
+    class ToolResult:
+        def __init__(self, text: str = ""):
+            self.text = text
+
+    class PoeApiHandler:
+        pass
+
+    module.ProtocolMessage = ProtocolMessage
+    module.ToolResult = ToolResult
+    module.PoeApiHandler = PoeApiHandler
+    sys.modules["fastapi_poe"] = module
+    return module
+
+
+class FakePoeClient:
+    """Delivers messages to a handler the way the Poe server would"""
+
+    def __init__(self, handler, poe_module, timeout: float):
+        self.handler = handler
+        self.poe = poe_module
+        self.timeout = timeout
+
+    async def send(self, text: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                self.handler.on_message(self.poe.ProtocolMessage(text)), self.timeout
+            )
+            reply = getattr(result, "text", result)
+            reply = "" if reply is None else str(reply)
+            return {
+                "ok": True,
+                "latency_ms": (time.perf_counter() - started) * 1000,
+                "response": reply,
+                "tokens": len(reply.split()),
+            }
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return {"ok": False, "latency_ms": (time.perf_counter() - started) * 1000, "error": error}
+
+
+def _load_handler(bot_dir: str, poe_module):
+    spec = importlib.util.spec_from_file_location("generated_bot", os.path.join(bot_dir, HANDLER_FILE))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, poe_module.PoeApiHandler) \
+                and value is not poe_module.PoeApiHandler:
+            return value()
+    raise LookupError(f"No PoeApiHandler subclass in {HANDLER_FILE}")
+
+
+async def _replay(bot_dir: str, corpus: List[str], concurrency: int, timeout: float) -> Dict[str, Any]:
+    poe = _install_fake_poe()
+    client = FakePoeClient(_load_handler(bot_dir, poe), poe, timeout)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(text: str) -> Dict[str, Any]:
+        async with slots:
+            return await client.send(text)
+
+    # Warm-up call so import and first-call costs stay out of the numbers
+    warmup = await client.send(corpus[0])
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one(text) for text in corpus))
+    metrics = summarize(results, time.perf_counter() - started)
+    metrics["sample_response"] = warmup.get("response", "")
+    return metrics
+
+
+def _main():
+    request = json.load(sys.stdin)
+    # Anything the bot prints goes to stderr; stdout carries only the result
+    result_out, sys.stdout = sys.stdout, sys.stderr
+    try:
+        _apply_limits(request["cpu_seconds"], request["memory_mb"])
+        metrics = asyncio.run(_replay(
+            request["bot_dir"], request["corpus"], request["concurrency"], request["timeout"]
+        ))
+        result = {"ok": True, "metrics": metrics}
+    except MemoryError:
+        result = {"ok": False, "error": "Memory limit exceeded"}
+    except Exception as e:
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    json.dump(result, result_out)
+
+
+# Server side
+
+
+def run_bot_harness(
+    files: Dict[str, str],
+    corpus: List[str],
+    concurrency: int = 8,
+    timeout: float = 10.0,
+    deadline: Optional[float] = None,
+    cpu_seconds: int = 30,
+    memory_mb: int = 512,
+) -> Dict[str, Any]:
+    """
+    Replay ``corpus`` against a generated bot in a sandboxed subprocess
+
+    Returns ``{"ok": True, "metrics": {...}}`` or ``{"ok": False, "error": ...}``.
+    """
+    if HANDLER_FILE not in files:
+        return {"ok": False, "error": f"Bot has no {HANDLER_FILE} to run"}
+    if not corpus:
+        return {"ok": False, "error": "Corpus is empty"}
+
+    with tempfile.TemporaryDirectory(prefix="bl1nk-bot-") as bot_dir:
+        for path, content in files.items():
+            target = os.path.normpath(os.path.join(bot_dir, path))
+            if not target.startswith(bot_dir + os.sep):
+                return {"ok": False, "error": f"Refusing to write outside the bot directory: {path}"}
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(content)
+
+        request = {
+            "bot_dir": bot_dir,
+            "corpus": corpus,
+            "concurrency": concurrency,
+            "timeout": timeout,
+            "cpu_seconds": cpu_seconds,
+            "memory_mb": memory_mb,
+        }
+        # Nothing from the server environment: no API keys, no PYTHONPATH
+        env = {"PATH": os.defpath, "HOME": bot_dir, "TMPDIR": bot_dir, "PYTHONIOENCODING": "utf-8"}
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-I", os.path.abspath(__file__)],
+                input=json.dumps(request),
+                capture_output=True,
+                text=True,
+                cwd=bot_dir,
+                env=env,
+                timeout=deadline or timeout * (len(corpus) + 1) + 10,
+            )
+        except subprocess.TimeoutExpired:
+            return {"ok": False, "error": "Harness timed out"}
+
+    try:
+        return json.loads(completed.stdout)
+    except json.JSONDecodeError:
+        stderr = completed.stderr.strip().splitlines()
+        return {"ok": False, "error": stderr[-1] if stderr else "Harness produced no output"}
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,177 @@
+"""
+Load Generator for BL1NK Skill MCP Server
+Closed-loop async HTTP/1.1 load against a running server
+
+1. ``concurrency`` workers each keep one keep-alive connection open
+2. Every worker sends its next request as soon as the previous response
+   has been read in full, until the request budget or duration runs out
+3. Each request's latency and status are recorded and summarized with the
+   same percentiles as the bot test harness
+
+Only the standard library is used, so benchmarks run without an HTTP
+client package and measure the server rather than the client.
+"""
+
+import json
+import time
+import socket
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from src.harness import summarize
+
+
+@dataclass
+class Scenario:
+    """One endpoint to load: method, path, optional query string and JSON body"""
+    name: str
+    method: str
+    path: str
+    query: Dict[str, Any] = field(default_factory=dict)
+    body: Optional[Any] = None
+    expect_status: Tuple[int, ...] = (200,)
+
+    def request_bytes(self, host: str) -> bytes:
+        target = self.path + (f"?{urlencode(self.query)}" if self.query else "")
+        payload = b"" if self.body is None else json.dumps(self.body).encode("utf-8")
+        lines = [
+            f"{self.method} {target} HTTP/1.1",
+            f"Host: {host}",
+            "Accept: application/json",
+            "Connection: keep-alive",
+            f"Content-Length: {len(payload)}",
+        ]
+        if self.body is not None:
+            lines.append("Content-Type: application/json")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection, reopened after errors"""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, raw: bytes) -> Tuple[int, int]:
+        """Send one request; returns (status, body size)"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+            sock = self._writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._writer.write(raw)
+        await self._writer.drain()
+        return await asyncio.wait_for(self._read_response(), self.timeout)
+
+    async def _read_response(self) -> Tuple[int, int]:
+        head = await self._reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        status = int(status_line.split(" ", 2)[1])
+        headers = {}
+        for line in header_lines:
+            if line:
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            size = 0
+            while True:
+                chunk_size = int((await self._reader.readline()).split(b";")[0], 16)
+                if chunk_size == 0:
+                    await self._reader.readline()
+                    break
+                size += len(await self._reader.readexactly(chunk_size + 2)) - 2
+        elif "content-length" in headers:
+            size = len(await self._reader.readexactly(int(headers["content-length"])))
+        else:
+            size = len(await self._reader.read())
+            headers["connection"] = "close"
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, size
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+
+async def run_load(
+    base_url: str,
+    scenario: Scenario,
+    concurrency: int = 8,
+    requests: Optional[int] = 1000,
+    duration: Optional[float] = None,
+    warmup: int = 10,
+    timeout: float = 10.0,
+) -> Dict[str, Any]:
+    """
+    Drive one scenario against ``base_url`` and summarize the run
+
+    Stops after ``requests`` requests or ``duration`` seconds, whichever
+    comes first (at least one of them must be set).
+    """
+    if requests is None and duration is None:
+        raise ValueError("Set a request count, a duration, or both")
+
+    url = urlsplit(base_url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+    raw = scenario.request_bytes(f"{host}:{port}")
+
+    # Warm-up requests run on their own connection and are not measured
+    warm = _Connection(host, port, timeout)
+    try:
+        for _ in range(warmup):
+            await warm.request(raw)
+    finally:
+        await warm.close()
+
+    results: List[Dict[str, Any]] = []
+    remaining = [requests if requests is not None else float("inf")]
+    stop_at = time.perf_counter() + duration if duration else float("inf")
+
+    async def worker():
+        connection = _Connection(host, port, timeout)
+        try:
+            while remaining[0] > 0 and time.perf_counter() < stop_at:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                try:
+                    status, size = await connection.request(raw)
+                    result = {"ok": status in scenario.expect_status, "status": status, "bytes": size}
+                    if not result["ok"]:
+                        result["error"] = f"HTTP {status}"
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                    await connection.close()
+                    result = {"ok": False, "status": None, "error": f"{type(e).__name__}: {e}"}
+                result["latency_ms"] = (time.perf_counter() - started) * 1000
+                results.append(result)
+        finally:
+            await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    metrics = summarize(results, time.perf_counter() - started)
+    metrics.pop("tokens_used", None)
+
+    statuses: Dict[str, int] = {}
+    for result in results:
+        key = str(result["status"])
+        statuses[key] = statuses.get(key, 0) + 1
+    metrics["status_counts"] = statuses
+    metrics["bytes_received"] = sum(r.get("bytes", 0) for r in results)
+    metrics["concurrency"] = concurrency
+    return metrics
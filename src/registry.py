@@ -0,0 +1,147 @@
+"""
+Tool Registry for BL1NK Skill MCP Server
+Dispatch table with decorator registration and cached tool listing
+"""
+
+import json
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from src.validation import Validator, compile_schema
+
+
+@dataclass
+class Tool:
+    """Tool definition"""
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: Optional[Callable] = None
+    kind: str = "io"  # "cpu" or "io" - selects the executor pool
+    params: Optional[FrozenSet[str]] = field(default=None, repr=False)  # None = accepts any
+    validator: Optional[Validator] = field(default=None, repr=False)
+
+    def validate(self, arguments: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Check arguments against the compiled input schema"""
+        if self.validator is None:
+            self.validator = compile_schema(self.input_schema)
+        return self.validator(arguments, "")
+
+    def check(self, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Error response for invalid arguments, None when they are valid"""
+        errors = self.validate(arguments)
+        if not errors:
+            return None
+        return {"error": f"Invalid arguments for tool '{self.name}'", "validation_errors": errors}
+
+    def bind(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop arguments the handler does not accept"""
+        if self.params is None:
+            return arguments
+        return {key: value for key, value in arguments.items() if key in self.params}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.input_schema,
+        }
+
+
+def _accepted_params(handler: Callable) -> Optional[FrozenSet[str]]:
+    """Keyword names a handler accepts (None if it takes **kwargs)"""
+    names = []
+    for index, param in enumerate(inspect.signature(handler).parameters.values()):
+        if param.kind is param.VAR_KEYWORD:
+            return None
+        if index == 0 and param.name == "self":
+            continue
+        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+            names.append(param.name)
+    return frozenset(names)
+
+
+class ToolRegistry:
+    """
+    Name -> Tool dispatch table
+
+    Handlers are registered with the ``tool`` decorator, usually on server
+    methods, and looked up in O(1). Each input schema is compiled into a
+    validator at registration time. The tool listing and its JSON payload
+    are built once and reused until another tool is registered.
+    """
+
+    def __init__(self):
+        self._tools: Dict[str, Tool] = {}
+        self._listing: Optional[List[Dict[str, Any]]] = None
+        self._payload: Optional[bytes] = None
+
+    def register(self, tool: Tool) -> Tool:
+        """Add a tool, replacing any tool with the same name"""
+        if tool.handler is not None and tool.params is None:
+            tool.params = _accepted_params(tool.handler)
+        if tool.validator is None:
+            tool.validator = compile_schema(tool.input_schema)
+        self._tools[tool.name] = tool
+        self._listing = None
+        self._payload = None
+        return tool
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Optional[Dict[str, Any]] = None,
+        kind: str = "io",
+    ):
+        """Decorator registering a function (sync or async) as the handler for ``name``"""
+        def decorator(handler: Callable) -> Callable:
+            self.register(Tool(
+                name=name,
+                description=description,
+                input_schema=input_schema or {"type": "object"},
+                handler=handler,
+                kind=kind,
+            ))
+            return handler
+        return decorator
+
+    def set_input_schema(self, name: str, input_schema: Dict[str, Any]) -> Tool:
+        """Replace a tool's input schema, recompiling its validator"""
+        tool = self._tools[name]
+        tool.input_schema = input_schema
+        tool.validator = compile_schema(input_schema)
+        self._listing = None
+        self._payload = None
+        return tool
+
+    def get(self, name: str) -> Optional[Tool]:
+        """Get tool by name"""
+        return self._tools.get(name)
+
+    def tools(self) -> List[Tool]:
+        """All tools in registration order"""
+        return list(self._tools.values())
+
+    def listing(self) -> List[Dict[str, Any]]:
+        """Cached list of tool dicts (MCP ``tools/list`` shape)"""
+        if self._listing is None:
+            self._listing = [tool.to_dict() for tool in self._tools.values()]
+        return self._listing
+
+    def listing_payload(self) -> bytes:
+        """Cached JSON body for the tool listing endpoint"""
+        if self._payload is None:
+            listing = self.listing()
+            self._payload = json.dumps(
+                {"total": len(listing), "tools": listing},
+                separators=(",", ":"),
+            ).encode("utf-8")
+        return self._payload
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
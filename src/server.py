@@ -9,88 +9,49 @@ import sys
 import logging
 import json
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+
+from src.registry import Tool, ToolRegistry
+from src.catalog import get_skill_catalog, list_skills_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class Tool:
-    """Tool definition"""
-    name: str
-    description: str
-    input_schema: Dict[str, Any]
-
 class BL1NKSkillMCPServer:
     """
     MCP Server for BL1NK Skills
     Manages skill execution and metadata
     """
     
+    # Tools are registered on the class with @registry.tool below
+    registry = ToolRegistry()
+    
     def __init__(self):
         self.name = "bl1nk-skill-mcp-server"
         self.version = "1.0.0"
-        self.tools = self._init_tools()
-    
-    def _init_tools(self) -> List[Tool]:
-        """Initialize available tools"""
-        return [
-            Tool(
-                name="list_skills",
-                description="List all available BL1NK skills",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "phase": {
-                            "type": "string",
-                            "enum": ["critical", "integration", "platform", "advanced"],
-                            "description": "Filter by skill phase"
-                        }
-                    }
-                }
-            ),
-            Tool(
-                name="run_skill",
-                description="Execute a BL1NK skill",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "skill_name": {"type": "string", "description": "Skill name"},
-                        "params": {"type": "object", "description": "Skill parameters"}
-                    },
-                    "required": ["skill_name"]
-                }
-            ),
-            Tool(
-                name="get_skill_info",
-                description="Get information about a skill",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "skill_name": {"type": "string", "description": "Skill name"}
-                    },
-                    "required": ["skill_name"]
-                }
-            ),
-        ]
+        self.tools = self.registry.tools()
+        self._phases: Optional[tuple] = None
+    
+    def _sync_catalog(self):
+        """Keep the list_skills phase enum in step with the catalog's phases"""
+        phases = tuple(sorted(get_skill_catalog().by_phase))
+        if phases != self._phases:
+            self._phases = phases
+            self.registry.set_input_schema("list_skills", list_skills_schema(phases))
     
     def get_tools(self) -> List[Dict[str, Any]]:
-        """Get all tools as dict"""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.input_schema
-            }
-            for tool in self.tools
-        ]
+        """Get all tools as dict (cached)"""
+        self._sync_catalog()
+        return self.registry.listing()
+    
+    def get_tools_payload(self) -> bytes:
+        """Get serialized tool listing (cached)"""
+        self._sync_catalog()
+        return self.registry.listing_payload()
     
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get tool by name"""
-        for tool in self.tools:
-            if tool.name == name:
-                return tool
-        return None
+        self._sync_catalog()
+        return self.registry.get(name)
     
     def call_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Call a tool"""
@@ -98,56 +59,36 @@ class BL1NKSkillMCPServer:
         if not tool:
             return {"error": f"Tool '{tool_name}' not found"}
         
-        if tool_name == "list_skills":
-            return self._list_skills(kwargs.get("phase"))
-        elif tool_name == "run_skill":
-            return self._run_skill(kwargs.get("skill_name"), kwargs.get("params"))
-        elif tool_name == "get_skill_info":
-            return self._get_skill_info(kwargs.get("skill_name"))
+        error = tool.check(kwargs)
+        if error:
+            return error
         
-        return {"error": "Unknown tool"}
+        return tool.handler(self, **tool.bind(kwargs))
     
+    @registry.tool(
+        name="list_skills",
+        description="List all available BL1NK skills",
+        # Phases come from the catalog, see _sync_catalog
+        input_schema=list_skills_schema()
+    )
     def _list_skills(self, phase: Optional[str] = None) -> Dict[str, Any]:
         """List all skills, optionally filtered by phase"""
-        skills = {
-            "critical": [
-                {"name": "text-processor", "description": "Text analysis & transformation"},
-                {"name": "log-analyzer", "description": "Log parsing & analysis"},
-                {"name": "notification-router", "description": "Multi-channel notifications"},
-            ],
-            "integration": [
-                {"name": "github-repo-analyzer", "description": "GitHub repository health"},
-                {"name": "prompt-optimizer", "description": "LLM prompt optimization"},
-                {"name": "poe-bot-generator", "description": "POE protocol bot scaffolding"},
-            ],
-            "platform": [
-                {"name": "code-analyzer", "description": "Code quality analysis"},
-                {"name": "skill-chain-executor", "description": "Multi-skill orchestration"},
-                {"name": "document-generator", "description": "Auto documentation"},
-            ],
-            "advanced": [
-                {"name": "test-generator", "description": "Automated test generation"},
-            ]
-        }
-        
-        if phase:
-            return {
-                "phase": phase,
-                "skills": skills.get(phase, [])
-            }
-        
-        all_skills = []
-        for p, s in skills.items():
-            for skill in s:
-                skill["phase"] = p
-                all_skills.append(skill)
-        
-        return {
-            "total": len(all_skills),
-            "skills": all_skills
-        }
+        return get_skill_catalog().list_skills(phase)
     
-    def _run_skill(self, skill_name: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    @registry.tool(
+        name="run_skill",
+        description="Execute a BL1NK skill",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "skill_name": {"type": "string", "description": "Skill name"},
+                "params": {"type": "object", "description": "Skill parameters"}
+            },
+            "required": ["skill_name"]
+        },
+        kind="cpu"
+    )
+    def _run_skill(self, skill_name: str = None, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Run a skill"""
         return {
             "status": "running",
@@ -156,20 +97,20 @@ class BL1NKSkillMCPServer:
             "message": f"Executing skill '{skill_name}'"
         }
     
-    def _get_skill_info(self, skill_name: str) -> Dict[str, Any]:
-        """Get skill information"""
-        all_skills = self._list_skills()["skills"]
-        for skill in all_skills:
-            if skill["name"] == skill_name:
-                return {
-                    "found": True,
-                    "skill": skill
-                }
-        
-        return {
-            "found": False,
-            "error": f"Skill '{skill_name}' not found"
+    @registry.tool(
+        name="get_skill_info",
+        description="Get information about a skill",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "skill_name": {"type": "string", "description": "Skill name"}
+            },
+            "required": ["skill_name"]
         }
+    )
+    def _get_skill_info(self, skill_name: str = None) -> Dict[str, Any]:
+        """Get skill information"""
+        return get_skill_catalog().get_skill_info(skill_name)
     
     def get_server_info(self) -> Dict[str, Any]:
         """Get server information"""
@@ -192,6 +133,19 @@ def get_server() -> BL1NKSkillMCPServer:
 
 def main():
     """Main entry point"""
+    import argparse
+    import asyncio
+    from src.config import config
+    from src.transport import serve_stdio
+    
+    parser = argparse.ArgumentParser(description="BL1NK Skill MCP Server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio",
+                        help="MCP transport (default: stdio)")
+    parser.add_argument("--host", default=config.HOST)
+    parser.add_argument("--port", type=int, default=config.PORT)
+    args = parser.parse_args()
+    
+    # stdout carries protocol messages on stdio, so logs stay on stderr
     logger.info("🚀 Starting BL1NK Skill MCP Server...")
     
     server = get_server()
@@ -199,8 +153,13 @@ def main():
     
     logger.info(f"Server: {info['name']} v{info['version']}")
     logger.info(f"Tools: {info['tools']}")
-    logger.info(f"Status: {info['status']}")
-    logger.info(f"✅ Server initialized and ready")
+    logger.info(f"Transport: {args.transport}")
+    
+    if args.transport == "http":
+        import uvicorn
+        uvicorn.run("api:app", host=args.host, port=args.port)
+    else:
+        asyncio.run(serve_stdio(server))
 
 if __name__ == "__main__":
     main()
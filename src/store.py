@@ -0,0 +1,241 @@
+"""
+Artifact Store for BL1NK Skill MCP Server
+SQLite persistence for generated bots, scripts and prompts
+
+1. Artifact metadata lives in one table indexed by (kind, type, created_at)
+2. Generated ``files`` are stored as content-addressed blobs (sha256 of the
+   content, zlib-compressed), so identical files are kept once
+3. Listings are paged and never load file contents
+"""
+
+import json
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    type TEXT,
+    name TEXT,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind_type
+    ON artifacts (kind, type, created_at);
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind_created
+    ON artifacts (kind, created_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    content BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifact_files (
+    artifact_id TEXT NOT NULL REFERENCES artifacts (id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES blobs (hash),
+    PRIMARY KEY (artifact_id, path)
+);
+"""
+
+
+class ArtifactStore:
+    """SQLite-backed store for generated artifacts"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or config.STORE_PATH
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by the tool executor threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(SCHEMA)
+
+    def put(self, kind: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace an artifact; ``files`` go to the blob table"""
+        files = record.get("files") or {}
+        data = {key: value for key, value in record.items() if key != "files"}
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM artifact_files WHERE artifact_id = ?", (record["id"],))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (id, kind, type, name, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    record["id"],
+                    kind,
+                    record.get("type"),
+                    record.get("name"),
+                    record.get("created_at", ""),
+                    json.dumps(data, default=str),
+                ),
+            )
+            for path, content in files.items():
+                digest = self._put_blob(content)
+                self._conn.execute(
+                    "INSERT INTO artifact_files (artifact_id, path, hash) VALUES (?, ?, ?)",
+                    (record["id"], path, digest),
+                )
+        return record
+
+    def _put_blob(self, content: str) -> str:
+        raw = content.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        self._conn.execute(
+            "INSERT OR IGNORE INTO blobs (hash, size, content) VALUES (?, ?, ?)",
+            (digest, len(raw), zlib.compress(raw)),
+        )
+        return digest
+
+    def get(self, artifact_id: str, with_files: bool = True) -> Optional[Dict[str, Any]]:
+        """Full artifact record, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            record = json.loads(row["data"])
+            if with_files:
+                rows = self._conn.execute(
+                    "SELECT f.path, b.content FROM artifact_files f "
+                    "JOIN blobs b ON b.hash = f.hash WHERE f.artifact_id = ? ORDER BY f.rowid",
+                    (artifact_id,),
+                ).fetchall()
+                record["files"] = {
+                    r["path"]: zlib.decompress(r["content"]).decode("utf-8") for r in rows
+                }
+        return record
+
+    def list_files(self, artifact_id: str) -> List[Dict[str, Any]]:
+        """File paths, content hashes and sizes of an artifact (no contents)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT f.path, f.hash, b.size FROM artifact_files f "
+                "JOIN blobs b ON b.hash = f.hash WHERE f.artifact_id = ? ORDER BY f.rowid",
+                (artifact_id,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_blob(self, digest: str) -> Optional[bytes]:
+        """Raw content of one blob"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+        return zlib.decompress(row["content"]) if row else None
+
+    def iter_blob(self, digest: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Decompress one blob incrementally, ``chunk_size`` bytes at a time"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            return
+        decompressor = zlib.decompressobj()
+        data = row["content"]
+        while data:
+            chunk = decompressor.decompress(data, chunk_size)
+            data = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+    def exists(self, artifact_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+        return row is not None
+
+    def list(
+        self,
+        kind: str,
+        type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """One page of artifact summaries (no file contents), newest first"""
+        query = "SELECT id, data FROM artifacts WHERE kind = ?"
+        params: List[Any] = [kind]
+        if type:
+            query += " AND type = ?"
+            params.append(type)
+        query += " ORDER BY created_at DESC, id LIMIT ? OFFSET ?"
+        params += [limit, offset]
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            paths: Dict[str, List[str]] = {}
+            if rows:
+                marks = ",".join("?" * len(rows))
+                for r in self._conn.execute(
+                    f"SELECT artifact_id, path FROM artifact_files WHERE artifact_id IN ({marks}) "
+                    "ORDER BY rowid",
+                    [r["id"] for r in rows],
+                ):
+                    paths.setdefault(r["artifact_id"], []).append(r["path"])
+
+        summaries = []
+        for row in rows:
+            record = json.loads(row["data"])
+            record.pop("template", None)
+            record["file_names"] = paths.get(row["id"], [])
+            summaries.append(record)
+        return summaries
+
+    def count(self, kind: str, type: Optional[str] = None) -> int:
+        query = "SELECT COUNT(*) FROM artifacts WHERE kind = ?"
+        params: List[Any] = [kind]
+        if type:
+            query += " AND type = ?"
+            params.append(type)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def delete(self, artifact_id: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+        return cursor.rowcount > 0
+
+    def gc(self) -> int:
+        """Drop blobs no artifact references; returns how many were removed"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM blobs WHERE hash NOT IN (SELECT DISTINCT hash FROM artifact_files)"
+            )
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Global store instance
+_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get or create the global artifact store"""
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
@@ -0,0 +1,106 @@
+"""
+Template Engine for BL1NK Skill MCP Server
+Precompiled templates with memoized rendering
+
+Templates use ``{{ name }}`` placeholders with optional filters
+(``{{ name|json }}``). Literal braces need no escaping, which keeps JSON,
+JSX and CSS scaffolds readable. Values are inserted verbatim by default;
+user-supplied values in code must go through an escaping filter:
+``py`` (Python literal), ``json`` (JSON/JS/YAML literal), ``ident``
+(identifier characters only) or ``html`` (HTML/Markdown text). Each template is compiled once into a
+Python string-concatenation function; rendering the same template with
+the same parameters returns a cached string.
+"""
+
+import re
+import html
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)(?:\s*\|\s*(\w+))?\s*\}\}")
+
+FILTERS: Dict[str, Callable[[Any], str]] = {
+    "str": str,
+    "json": lambda value: json.dumps(value),
+    "py": repr,
+    "html": lambda value: html.escape(str(value)),
+    "ident": lambda value: re.sub(r"^(?=\d)", "_", re.sub(r"[^0-9A-Za-z_]", "", str(value))),
+    "slug": lambda value: slugify(value),
+}
+
+
+def slugify(value: Any) -> str:
+    """Lowercase ``[a-z0-9_-]`` form of a name, safe in paths and headers"""
+    slug = re.sub(r"[^a-z0-9_-]+", "_", str(value).lower()).strip("_")
+    return slug or "untitled"
+
+
+class Template:
+    """A template compiled into a single Python concatenation expression"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.names = set()
+
+        pieces: List[str] = []
+        filters: List[Callable[[Any], str]] = []
+        position = 0
+        for match in PLACEHOLDER.finditer(source):
+            if match.start() > position:
+                pieces.append(repr(source[position:match.start()]))
+            name, filter_name = match.group(1), match.group(2) or "str"
+            if filter_name not in FILTERS:
+                raise ValueError(f"Unknown template filter: {filter_name}")
+            filters.append(FILTERS[filter_name])
+            pieces.append(f"_f[{len(filters) - 1}](_p[{name!r}])")
+            self.names.add(name)
+            position = match.end()
+        if position < len(source):
+            pieces.append(repr(source[position:]))
+
+        code = compile(f"lambda _p: {' + '.join(pieces) or repr('')}", "<template>", "eval")
+        self._render = eval(code, {"_f": tuple(filters)})
+
+    def render(self, params: Dict[str, Any]) -> str:
+        try:
+            return self._render(params)
+        except KeyError as e:
+            raise KeyError(f"Missing template parameter: {e.args[0]}") from None
+
+
+class TemplateEngine:
+    """Named templates, compiled on registration, with an LRU render cache"""
+
+    def __init__(self, templates: Optional[Dict[str, str]] = None, cache_size: int = 1024):
+        self._templates: Dict[str, Template] = {}
+        self._render_cached = lru_cache(maxsize=cache_size)(self._render)
+        self._render_json = lru_cache(maxsize=cache_size)(self._render_from_json)
+        for name, source in (templates or {}).items():
+            self.register(name, source)
+
+    def register(self, name: str, source: str) -> Template:
+        """Compile and add a template, replacing any with the same name"""
+        template = Template(source)
+        if name in self._templates:
+            self._render_cached.cache_clear()
+            self._render_json.cache_clear()
+        self._templates[name] = template
+        return template
+
+    def render(self, name: str, **params: Any) -> str:
+        """Render a template (cached per identical parameter set)"""
+        try:
+            return self._render_cached(name, tuple(params.items()))
+        except TypeError:
+            # Lists or dicts among the parameters - cache on their JSON form
+            return self._render_json(name, json.dumps(params, sort_keys=True, default=str))
+
+    def _render(self, name: str, key: Tuple) -> str:
+        return self._templates[name].render(dict(key))
+
+    def _render_from_json(self, name: str, key: str) -> str:
+        return self._templates[name].render(json.loads(key))
+
+    def cache_info(self):
+        return self._render_cached.cache_info()
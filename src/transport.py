@@ -0,0 +1,371 @@
+"""
+MCP Transport for BL1NK Skill MCP Server
+JSON-RPC 2.0 over stdio and streamable HTTP
+
+1. ``MCPSession`` dispatches JSON-RPC messages to ``BL1NKSkillMCPServer``
+2. Requests are pipelined - each one runs as its own task, so many tool
+   calls can be in flight at once and responses return as they finish
+3. ``notifications/cancelled`` cancels an in-flight request by id
+4. ``serve_stdio`` reads newline-delimited messages from stdin
+5. ``api.py`` mounts the streamable HTTP endpoint at ``/mcp``; idle HTTP
+   sessions expire after ``Config.MCP_SESSION_TTL`` and at most
+   ``Config.MCP_MAX_SESSIONS`` are kept
+"""
+
+import sys
+import json
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from src.config import config
+from src.executor import ExecutorSaturated, get_tool_executor
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2025-03-26"
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_BUSY = -32000
+
+Message = Dict[str, Any]
+Send = Callable[[Message], Awaitable[None]]
+
+
+def encode(message: Union[Message, List[Message]]) -> bytes:
+    """Compact JSON encoding for the wire"""
+    return json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def valid_id(request_id: Any) -> bool:
+    """JSON-RPC ids are strings, numbers or null - never objects or arrays"""
+    return request_id is None or (
+        isinstance(request_id, (str, int, float)) and not isinstance(request_id, bool)
+    )
+
+
+def error_response(request_id: Any, code: int, message: str, data: Any = None) -> Message:
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+class MCPSession:
+    """
+    One MCP client session
+
+    ``handle`` accepts a decoded message and returns immediately; responses
+    are delivered through ``send`` once each request completes. Tool calls
+    run on the shared bounded ``ToolExecutor``.
+    """
+
+    def __init__(self, server, send: Send):
+        self.server = server
+        self.send = send
+        self.initialized = False
+        self.client_info: Dict[str, Any] = {}
+        self._in_flight: Dict[Any, asyncio.Task] = {}
+        self.executor = get_tool_executor()
+        self._methods = {
+            "initialize": self._initialize,
+            "ping": self._ping,
+            "tools/list": self._tools_list,
+            "tools/call": self._tools_call,
+        }
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def handle(self, message: Any) -> List[asyncio.Task]:
+        """
+        Dispatch one message (request, notification or batch)
+
+        Returns the tasks started for requests; each task sends its own
+        response before it finishes.
+        """
+        if isinstance(message, list):
+            if not message:
+                await self.send(error_response(None, INVALID_REQUEST, "Empty batch"))
+            tasks = []
+            for item in message:
+                tasks.extend(await self.handle(item))
+            return tasks
+
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+            await self.send(error_response(None, INVALID_REQUEST, "Invalid JSON-RPC message"))
+            return []
+
+        method = message.get("method")
+        if method is None:
+            return []  # Response to a server request - none are issued
+
+        if "id" not in message:
+            self._notify(method, message.get("params") or {})
+            return []
+
+        request_id = message["id"]
+        if not valid_id(request_id):
+            await self.send(error_response(None, INVALID_REQUEST, "Request id must be a string or number"))
+            return []
+        if request_id in self._in_flight:
+            await self.send(error_response(request_id, INVALID_REQUEST, "Duplicate request id"))
+            return []
+
+        task = asyncio.create_task(self._run(request_id, method, message.get("params") or {}))
+        self._in_flight[request_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(request_id, None))
+        return [task]
+
+    def _notify(self, method: str, params: Dict[str, Any]):
+        if method == "notifications/initialized":
+            self.initialized = True
+        elif method == "notifications/cancelled":
+            self.cancel(params.get("requestId"), params.get("reason"))
+        else:
+            logger.debug(f"Ignoring notification: {method}")
+
+    def cancel(self, request_id: Any, reason: Optional[str] = None) -> bool:
+        """Cancel an in-flight request; no response is sent for it"""
+        if not valid_id(request_id):
+            return False
+        task = self._in_flight.get(request_id)
+        if task is None or task.done():
+            return False
+        logger.info(f"Cancelling request {request_id}: {reason or 'no reason given'}")
+        task.cancel()
+        return True
+
+    async def _run(self, request_id: Any, method: str, params: Dict[str, Any]):
+        handler = self._methods.get(method)
+        if handler is None:
+            await self.send(error_response(request_id, METHOD_NOT_FOUND, f"Method '{method}' not found"))
+            return
+
+        try:
+            result = await handler(params)
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except asyncio.CancelledError:
+            return
+        except ValueError as e:
+            response = error_response(request_id, INVALID_PARAMS, str(e))
+        except ExecutorSaturated as e:
+            response = error_response(request_id, SERVER_BUSY, str(e), {"retryAfter": e.retry_after})
+        except Exception as e:
+            logger.exception(f"Error handling {method}: {e}")
+            response = error_response(request_id, INTERNAL_ERROR, str(e))
+
+        await self.send(response)
+
+    async def cancel_all(self):
+        """Cancel every in-flight request (on disconnect)"""
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Methods
+
+    async def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.client_info = params.get("clientInfo", {})
+        return {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {"name": self.server.name, "version": self.server.version},
+        }
+
+    async def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    async def _tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"tools": self.server.get_tools()}
+
+    async def _tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        name = params.get("name")
+        if not name or self.server.get_tool(name) is None:
+            raise ValueError(f"Unknown tool: {name}")
+
+        arguments = params.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError("'arguments' must be an object")
+
+        result = await self.executor.call(self.server, name, **arguments)
+
+        return {
+            "content": [{"type": "text", "text": json.dumps(result, default=str)}],
+            "structuredContent": result,
+            "isError": "error" in result,
+        }
+
+
+async def serve_stdio(server):
+    """Serve one MCP session over stdin/stdout (newline-delimited JSON)"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    out = sys.stdout.buffer
+    write_lock = asyncio.Lock()
+
+    async def send(message: Message):
+        async with write_lock:
+            out.write(encode(message) + b"\n")
+            out.flush()
+
+    session = MCPSession(server, send)
+    logger.info("MCP stdio transport ready")
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as e:
+            await send(error_response(None, PARSE_ERROR, f"Parse error: {e}"))
+            continue
+        await session.handle(message)
+
+    # stdin closed - let pending calls finish before exiting
+    pending = list(session._in_flight.values())
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class HTTPSession(MCPSession):
+    """Session whose responses are routed back to the POST that sent the request"""
+
+    def __init__(self, server):
+        super().__init__(server, self._route)
+        self.routes: Dict[Any, asyncio.Queue] = {}
+
+    async def _route(self, message: Message):
+        queue = self.routes.get(message.get("id"))
+        if queue is None:
+            logger.debug(f"Dropping response with no open stream: {message.get('id')}")
+            return
+        await queue.put(message)
+
+    async def exchange(self, messages: List[Any]):
+        """
+        Feed one POST body to the session and yield responses as they complete
+
+        Several POSTs may share the session concurrently; each only receives
+        responses to its own requests. Cancelled requests produce no response.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        ids = [
+            m["id"] for m in messages
+            if isinstance(m, dict) and "method" in m and "id" in m and valid_id(m["id"])
+        ]
+        for request_id in ids:
+            self.routes.setdefault(request_id, queue)
+
+        try:
+            # Errors for malformed messages carry no id; they are sent before
+            # handle() yields, so the None route belongs to this POST meanwhile
+            self.routes[None] = queue
+            try:
+                pending = set(await self.handle(messages))
+            finally:
+                del self.routes[None]
+            while pending:
+                # A task sends its response before finishing, so the queue
+                # holds it by the time asyncio.wait reports the task done
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                while not queue.empty():
+                    yield queue.get_nowait()
+            while not queue.empty():
+                yield queue.get_nowait()
+        finally:
+            for request_id in ids:
+                if self.routes.get(request_id) is queue:
+                    del self.routes[request_id]
+
+
+class SessionLimitReached(Exception):
+    """Raised when every session slot is held by a session with calls in flight"""
+
+
+class HTTPSessionManager:
+    """
+    Streamable HTTP sessions keyed by ``Mcp-Session-Id``
+
+    Sessions are kept in least-recently-used order. Sessions idle for longer
+    than ``idle_ttl`` seconds are dropped, and creating a session beyond
+    ``max_sessions`` evicts the least recently used idle one.
+    """
+
+    def __init__(
+        self,
+        server,
+        max_sessions: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        self.server = server
+        self.max_sessions = config.MCP_MAX_SESSIONS if max_sessions is None else max_sessions
+        self.idle_ttl = config.MCP_SESSION_TTL if idle_ttl is None else idle_ttl
+        self.sessions: "OrderedDict[str, HTTPSession]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+
+    def create(self) -> str:
+        self.expire()
+        if len(self.sessions) >= self.max_sessions:
+            self._evict_one()
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = HTTPSession(self.server)
+        self._last_used[session_id] = time.monotonic()
+        return session_id
+
+    def get(self, session_id: Optional[str]) -> Optional[HTTPSession]:
+        if not session_id:
+            return None
+        self.expire()
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            self._last_used[session_id] = time.monotonic()
+        return session
+
+    def expire(self) -> int:
+        """Drop sessions idle for longer than ``idle_ttl``; returns how many"""
+        deadline = time.monotonic() - self.idle_ttl
+        expired = [
+            session_id for session_id, session in self.sessions.items()
+            if self._last_used[session_id] < deadline and not session.in_flight
+        ]
+        for session_id in expired:
+            self._drop(session_id)
+        if expired:
+            logger.info(f"Expired {len(expired)} idle MCP sessions")
+        return len(expired)
+
+    def _evict_one(self):
+        for session_id, session in self.sessions.items():
+            if not session.in_flight:
+                self._drop(session_id)
+                return
+        raise SessionLimitReached(f"Too many active MCP sessions (limit {self.max_sessions})")
+
+    def _drop(self, session_id: str) -> Optional[HTTPSession]:
+        self._last_used.pop(session_id, None)
+        return self.sessions.pop(session_id, None)
+
+    async def close(self, session_id: str) -> bool:
+        session = self._drop(session_id)
+        if session is None:
+            return False
+        await session.cancel_all()
+        return True
@@ -0,0 +1,168 @@
+"""
+Input Validation for BL1NK Skill MCP Server
+Compiles a tool's JSON schema once into a plain-Python validator
+
+Supports the subset of JSON Schema used by tool ``input_schema`` definitions:
+type, properties, required, enum, const, items, additionalProperties,
+pattern, minLength/maxLength, minimum/maximum and minItems/maxItems.
+Unsupported keywords are ignored.
+"""
+
+import re
+from typing import Any, Callable, Dict, List
+
+# Validator: (value, path) -> list of {"path", "message"} errors
+Validator = Callable[[Any, str], List[Dict[str, str]]]
+
+_TYPES = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "null": lambda v: v is None,
+}
+
+
+def _error(path: str, message: str) -> Dict[str, str]:
+    return {"path": path or "$", "message": message}
+
+
+def _no_errors(value: Any, path: str) -> List[Dict[str, str]]:
+    return []
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile a schema into a validator closure"""
+    if not schema:
+        return _no_errors
+
+    checks: List[Validator] = []
+
+    expected = schema.get("type")
+    if expected is not None:
+        names = expected if isinstance(expected, list) else [expected]
+        type_checks = tuple(_TYPES[name] for name in names if name in _TYPES)
+        label = " or ".join(names)
+        if type_checks:
+            def check_type(value, path):
+                for check in type_checks:
+                    if check(value):
+                        return []
+                return [_error(path, f"expected {label}, got {type(value).__name__}")]
+            checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        def check_enum(value, path):
+            if value in allowed:
+                return []
+            return [_error(path, f"must be one of {allowed}")]
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+        def check_const(value, path):
+            return [] if value == const else [_error(path, f"must be {const!r}")]
+        checks.append(check_const)
+
+    if "pattern" in schema:
+        pattern = schema["pattern"]
+        regex = re.compile(pattern)
+        def check_pattern(value, path):
+            if not isinstance(value, str) or regex.search(value):
+                return []
+            return [_error(path, f"must match {pattern!r}")]
+        checks.append(check_pattern)
+
+    checks.extend(_compile_bounds(schema))
+
+    properties = schema.get("properties")
+    required = tuple(schema.get("required", ()))
+    additional = schema.get("additionalProperties", True)
+    if properties or required or additional is not True:
+        checks.append(_compile_object(properties or {}, required, additional))
+
+    if "items" in schema and isinstance(schema["items"], dict):
+        item_validator = compile_schema(schema["items"])
+        def check_items(value, path):
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for index, item in enumerate(value):
+                errors.extend(item_validator(item, f"{path}[{index}]"))
+            return errors
+        checks.append(check_items)
+
+    if not checks:
+        return _no_errors
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value, path=""):
+        errors = checks[0](value, path)
+        # Structural checks are pointless once the type is wrong
+        if errors and expected is not None:
+            return errors
+        for check in checks[1:]:
+            errors.extend(check(value, path))
+        return errors
+
+    return validate
+
+
+def _compile_object(properties: Dict[str, Any], required: tuple, additional: Any) -> Validator:
+    prop_validators = {name: compile_schema(sub) for name, sub in properties.items()}
+    extra_validator = compile_schema(additional) if isinstance(additional, dict) else None
+    closed = additional is False
+
+    def check_object(value, path):
+        if not isinstance(value, dict):
+            return []
+        errors = []
+        for name in required:
+            if name not in value:
+                errors.append(_error(_join(path, name), "is required"))
+        for name, item in value.items():
+            validator = prop_validators.get(name)
+            if validator is not None:
+                errors.extend(validator(item, _join(path, name)))
+            elif closed:
+                errors.append(_error(_join(path, name), "is not allowed"))
+            elif extra_validator is not None:
+                errors.extend(extra_validator(item, _join(path, name)))
+        return errors
+
+    return check_object
+
+
+def _compile_bounds(schema: Dict[str, Any]) -> List[Validator]:
+    checks: List[Validator] = []
+
+    def bound(keyword, measure, applies, compare, message):
+        if keyword not in schema:
+            return
+        limit = schema[keyword]
+        def check(value, path):
+            if applies(value) and not compare(measure(value), limit):
+                return [_error(path, message.format(limit))]
+            return []
+        checks.append(check)
+
+    is_str = lambda v: isinstance(v, str)
+    is_num = lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    is_list = lambda v: isinstance(v, list)
+    identity = lambda v: v
+
+    bound("minLength", len, is_str, lambda n, m: n >= m, "must be at least {} characters")
+    bound("maxLength", len, is_str, lambda n, m: n <= m, "must be at most {} characters")
+    bound("minimum", identity, is_num, lambda n, m: n >= m, "must be >= {}")
+    bound("maximum", identity, is_num, lambda n, m: n <= m, "must be <= {}")
+    bound("minItems", len, is_list, lambda n, m: n >= m, "must have at least {} items")
+    bound("maxItems", len, is_list, lambda n, m: n <= m, "must have at most {} items")
+    return checks
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
@@ -0,0 +1,41 @@
+"""Skill catalog tests"""
+import pytest
+
+from src.catalog import build_catalog, list_skills_schema
+from src.validation import compile_schema
+
+
+def _skill(root, phase_dir, name):
+    skill_dir = root / phase_dir / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ntags: [a, b]\n---\nBody\n", encoding="utf-8")
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    _skill(tmp_path, "phase-1-critical", "alpha")
+    _skill(tmp_path, "phase-2-integration", "beta")
+    return build_catalog(tmp_path)
+
+
+def test_phases_come_from_directories(catalog):
+    assert sorted(catalog.by_phase) == ["critical", "integration"]
+    validate = compile_schema(list_skills_schema(catalog.by_phase))
+    assert validate({"phase": "integration"}, "") == []
+    assert validate({"phase": "platform"}, "")[0]["path"] == "phase"
+
+
+def test_snapshot_is_read_only(catalog):
+    with pytest.raises(TypeError):
+        catalog.by_name["alpha"]["name"] = "changed"
+    with pytest.raises(TypeError):
+        catalog.by_phase["critical"][0]["name"] = "changed"
+
+
+def test_responses_are_copies(catalog):
+    listing = catalog.list_skills("critical")
+    listing["skills"][0]["name"] = "changed"
+    info = catalog.get_skill_info("alpha")
+    info["skill"]["tags"].append("c")
+    assert catalog.list_skills("critical")["skills"][0]["name"] == "alpha"
+    assert catalog.get_skill_info("alpha")["skill"]["tags"] == ["a", "b"]
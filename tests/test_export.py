@@ -0,0 +1,73 @@
+"""Archive export tests"""
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from src.bot_tools import BotGenerationTools
+from src.export import stream_tar, stream_zip
+from src.store import ArtifactStore
+from src.templates import slugify
+
+
+@pytest.fixture
+def store():
+    store = ArtifactStore(":memory:")
+    yield store
+    store.close()
+
+
+def _put(store, artifact_id, files):
+    store.put("bot", {
+        "id": artifact_id,
+        "type": "poe_script",
+        "name": artifact_id,
+        "created_at": "2026-01-01T00:00:00",
+        "files": files,
+    })
+
+
+def test_zip_round_trip(store):
+    files = {"bot.py": "print('hi')\n" * 5000, "README.md": "# Bot ✓\n"}
+    _put(store, "bot-1", files)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip(store, "bot-1"))))
+    assert archive.testzip() is None
+    for path, content in files.items():
+        assert archive.read(f"bot-1/{path}").decode("utf-8") == content
+    assert json.loads(archive.read("bot-1/artifact.json"))["id"] == "bot-1"
+
+
+def test_tar_round_trip(store):
+    files = {"bot.py": "print('hi')\n" * 5000, "config.yaml": "name: bot\n"}
+    _put(store, "bot-1", files)
+
+    archive = tarfile.open(fileobj=io.BytesIO(b"".join(stream_tar(store, "bot-1"))), mode="r:gz")
+    for path, content in files.items():
+        assert archive.extractfile(f"bot-1/{path}").read().decode("utf-8") == content
+    assert json.loads(archive.extractfile("bot-1/artifact.json").read())["id"] == "bot-1"
+
+
+def test_missing_artifact_raises_before_streaming(store):
+    with pytest.raises(KeyError):
+        next(stream_zip(store, "missing"))
+
+
+def test_unsafe_names_are_slugified(store):
+    bot = BotGenerationTools(store).create_claude_project('../../x"\r\nSet-Cookie: a', "desc")
+    assert bot["id"] == "claude_project_x_set-cookie_a"
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip(store, bot["id"]))))
+    assert all(name.startswith(f"{bot['id']}/") and ".." not in name for name in archive.namelist())
+
+
+@pytest.mark.parametrize("name, slug", [
+    ("My Bot", "my_bot"),
+    ("a/../b", "a_b"),
+    ("..", "untitled"),
+    ("weather-bot_2", "weather-bot_2"),
+])
+def test_slugify(name, slug):
+    assert slugify(name) == slug
@@ -0,0 +1,54 @@
+"""Bot test harness tests"""
+import sys
+
+import pytest
+
+from src.bot_tools import BotGenerationTools
+from src.harness import run_bot_harness
+from src.store import ArtifactStore
+
+ENV_BOT = """
+import os
+from fastapi_poe import PoeApiHandler, ToolResult
+
+class EnvHandler(PoeApiHandler):
+    async def on_message(self, message):
+        return ToolResult(text=",".join(sorted(os.environ)) + "|" + os.getcwd())
+"""
+
+HOG_BOT = """
+from fastapi_poe import PoeApiHandler, ToolResult
+
+class HogHandler(PoeApiHandler):
+    async def on_message(self, message):
+        return ToolResult(text=str(len(bytearray(2 * 1024 ** 3))))
+"""
+
+
+def test_generated_bot_runs():
+    store = ArtifactStore(":memory:")
+    tools = BotGenerationTools(store)
+    bot = tools.create_poe_script_bot("Echo Bot", 'says """hi"""')
+
+    result = tools.test_bot(bot["id"], "hello")
+    store.close()
+    assert result["success"], result
+    assert result["response"] == "Processed: hello"
+
+
+def test_harness_hides_server_environment(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "secret")
+    run = run_bot_harness({"bot.py": ENV_BOT}, ["env"])
+    assert run["ok"], run
+
+    names, cwd = run["metrics"]["sample_response"].split("|")
+    assert "ANTHROPIC_API_KEY" not in names.split(",")
+    assert "bl1nk-bot-" in cwd
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="rlimits are Unix-only")
+def test_harness_memory_limit():
+    run = run_bot_harness({"bot.py": HOG_BOT}, ["x"], memory_mb=256)
+    assert run["ok"], run
+    assert run["metrics"]["errors"] == 1
+    assert "MemoryError" in run["metrics"]["sample_errors"][0]
@@ -0,0 +1,60 @@
+"""Artifact store tests"""
+import pytest
+
+from src.store import ArtifactStore
+
+
+@pytest.fixture
+def store():
+    store = ArtifactStore(":memory:")
+    yield store
+    store.close()
+
+
+def _record(artifact_id, files, created_at="2026-01-01T00:00:00"):
+    return {
+        "id": artifact_id,
+        "type": "poe_script",
+        "name": artifact_id,
+        "created_at": created_at,
+        "files": files,
+    }
+
+
+def test_round_trip(store):
+    files = {"bot.py": "print('hi')\n", "README.md": "# Bot ✓\n"}
+    store.put("bot", _record("bot-1", files))
+
+    record = store.get("bot-1")
+    assert record["files"] == files
+    assert record["name"] == "bot-1"
+    assert "files" not in store.get("bot-1", with_files=False)
+
+    listed = store.list_files("bot-1")
+    assert [f["path"] for f in listed] == ["bot.py", "README.md"]
+    for entry in listed:
+        content = files[entry["path"]].encode("utf-8")
+        assert entry["size"] == len(content)
+        assert store.get_blob(entry["hash"]) == content
+        assert b"".join(store.iter_blob(entry["hash"], chunk_size=4)) == content
+
+
+def test_identical_files_are_stored_once(store):
+    store.put("bot", _record("a", {"bot.py": "same"}))
+    store.put("bot", _record("b", {"bot.py": "same"}))
+    assert store.list_files("a")[0]["hash"] == store.list_files("b")[0]["hash"]
+
+    assert store.delete("a")
+    assert store.gc() == 0
+    assert store.delete("b")
+    assert store.gc() == 1
+
+
+def test_listing_is_paged_newest_first(store):
+    for index in range(3):
+        store.put("bot", _record(f"bot-{index}", {"bot.py": str(index)}, f"2026-01-0{index + 1}"))
+    page = store.list("bot", limit=2)
+    assert [r["id"] for r in page] == ["bot-2", "bot-1"]
+    assert page[0]["file_names"] == ["bot.py"]
+    assert store.count("bot") == 3
+    assert store.get("missing") is None
@@ -0,0 +1,76 @@
+"""Template engine and scaffold escaping tests"""
+import ast
+import json
+
+import pytest
+import yaml
+
+from src.bot_tools import BotGenerationTools
+from src.store import ArtifactStore
+from src.templates import Template
+
+HOSTILE = 'Evil"""\nimport os; os.system("id")  # </h1><script>x</script> \'{}'
+
+
+@pytest.fixture
+def tools():
+    store = ArtifactStore(":memory:")
+    yield BotGenerationTools(store)
+    store.close()
+
+
+@pytest.mark.parametrize("filter_name, expected", [
+    ("py", repr(HOSTILE)),
+    ("json", json.dumps(HOSTILE)),
+    ("ident", "Evilimportosossystemidh1scriptxscript"),
+])
+def test_filters_escape(filter_name, expected):
+    assert Template(f"{{{{ value|{filter_name} }}}}").render({"value": HOSTILE}) == expected
+
+
+def test_html_filter():
+    rendered = Template("{{ value|html }}").render({"value": "<b>&'\"</b>"})
+    assert rendered == "&lt;b&gt;&amp;&#x27;&quot;&lt;/b&gt;"
+
+
+def test_ident_filter_never_starts_with_digit():
+    assert Template("{{ value|ident }}").render({"value": "1 bot"}) == "_1bot"
+
+
+def test_unknown_filter_rejected():
+    with pytest.raises(ValueError):
+        Template("{{ value|shell }}")
+
+
+def test_scaffolds_keep_user_values_as_data(tools):
+    bot = tools.create_poe_canvas_bot("Evil Bot", HOSTILE)
+    files = bot["files"]
+
+    module = ast.parse(files["bot.py"])
+    assigned = {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in module.body if isinstance(node, ast.Assign)
+    }
+    assert assigned == {"BOT_NAME": "Evil Bot", "DESCRIPTION": HOSTILE}
+    assert not any(isinstance(node, ast.Import) and node.names[0].name == "os" for node in module.body)
+
+    config = yaml.safe_load(files["config.yaml"])
+    assert config["name"] == "Evil Bot"
+    assert config["description"] == HOSTILE
+
+    assert "<script>" not in files["README.md"]
+    assert "<h1>{TITLE}</h1>" in files["components.tsx"]
+
+
+def test_invalid_bot_name_rejected(tools):
+    assert "error" in tools.create_poe_script_bot(HOSTILE, "desc")
+    assert "error" in tools.create_poe_canvas_bot("Bot\n", "desc")
+
+
+def test_plugin_scaffolds_escape(tools):
+    plugin = tools.create_claude_plugin(HOSTILE, HOSTILE, ["search"])
+    files = plugin["files"]
+
+    assert json.loads(files["manifest.json"])["name"] == HOSTILE
+    assert yaml.safe_load(files["openapi.yaml"])["info"]["title"] == HOSTILE
+    ast.parse(files["plugin.py"])
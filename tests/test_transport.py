@@ -0,0 +1,48 @@
+"""MCP transport tests"""
+import asyncio
+
+import pytest
+
+from src.server import get_server
+from src.transport import INVALID_REQUEST, HTTPSessionManager, MCPSession, SessionLimitReached
+
+
+def test_unhashable_request_id_is_rejected():
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        session = MCPSession(get_server(), send)
+        tasks = await session.handle({"jsonrpc": "2.0", "id": {"x": 1}, "method": "ping"})
+        tasks += await session.handle({"jsonrpc": "2.0", "id": [1], "method": "ping"})
+        return tasks
+
+    assert asyncio.run(run()) == []
+    assert [m["error"]["code"] for m in sent] == [INVALID_REQUEST, INVALID_REQUEST]
+    assert all(m["id"] is None for m in sent)
+
+
+def test_idle_sessions_expire():
+    manager = HTTPSessionManager(get_server(), max_sessions=10, idle_ttl=0)
+    session_id = manager.create()
+    assert manager.get(session_id) is None
+    assert not manager.sessions
+
+
+def test_session_cap_evicts_least_recently_used():
+    manager = HTTPSessionManager(get_server(), max_sessions=2, idle_ttl=3600)
+    first, second = manager.create(), manager.create()
+    manager.get(first)
+    third = manager.create()
+    assert set(manager.sessions) == {first, third}
+    assert second not in manager.sessions
+
+
+def test_session_cap_refuses_when_all_busy():
+    manager = HTTPSessionManager(get_server(), max_sessions=1, idle_ttl=3600)
+    session = manager.get(manager.create())
+    session._in_flight["busy"] = object()
+    with pytest.raises(SessionLimitReached):
+        manager.create()
@@ -0,0 +1,54 @@
+"""Validation tests"""
+from src.server import get_server
+from src.validation import compile_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "phase": {"enum": ["critical", "high"]},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+        "limits": {
+            "type": "object",
+            "properties": {"timeout": {"type": "number", "minimum": 0}},
+            "additionalProperties": False,
+        },
+    },
+    "required": ["name"],
+}
+
+
+def test_valid_arguments_have_no_errors():
+    validate = compile_schema(SCHEMA)
+    assert validate({"name": "ok", "phase": "high", "tags": ["a"], "limits": {"timeout": 1}}, "") == []
+
+
+def test_errors_carry_path_and_message():
+    validate = compile_schema(SCHEMA)
+    errors = validate({"phase": "low", "tags": ["a", 1, "c"], "limits": {"timeout": -1, "x": 1}}, "")
+    assert {"path": "name", "message": "is required"} in errors
+    assert {"path": "phase", "message": "must be one of ['critical', 'high']"} in errors
+    assert {"path": "tags", "message": "must have at most 2 items"} in errors
+    assert {"path": "tags[1]", "message": "expected string, got int"} in errors
+    assert {"path": "limits.timeout", "message": "must be >= 0"} in errors
+    assert {"path": "limits.x", "message": "is not allowed"} in errors
+
+
+def test_wrong_type_stops_structural_checks():
+    validate = compile_schema(SCHEMA)
+    assert validate("not an object", "") == [{"path": "$", "message": "expected object, got str"}]
+
+
+def test_empty_schema_accepts_anything():
+    assert compile_schema({})({"anything": 1}, "") == []
+
+
+def test_call_tool_returns_structured_errors():
+    result = get_server().call_tool("run_skill", skill_name=5)
+    assert result["validation_errors"] == [{"path": "skill_name", "message": "expected string, got int"}]
+
+
+def test_pattern():
+    validate = compile_schema({"type": "string", "pattern": "^[a-z]+$"})
+    assert validate("abc", "") == []
+    assert validate("ab c", "name") == [{"path": "name", "message": "must match '^[a-z]+$'"}]